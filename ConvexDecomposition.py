@@ -0,0 +1,101 @@
+# Group ID 14 (21114021 & 21114078) - Ashutosh Kumar and Raiwat Bapat
+# Date: October 19 2026
+# ConvexDecomposition.py : Contains the Implementation of the Hertel-Mehlhorn Algorithm that merges the triangles of a triangulated polygon into convex pieces.
+
+import time
+from array import array
+
+from elements.DCEL import DCEL
+from elements.Geometry import cross
+from elements.Instrumentation import instrumentation
+
+
+class ConvexDecomposition:
+    def __init__(self, dcel: DCEL, dual_graph=None):
+        """
+        Initialize the decomposition with a triangulated DCEL and, optionally, the dual graph built from it.
+        """
+        self.dcel = dcel
+        self.dual_graph = dual_graph
+        self.parent = {}  # Face -> face it was merged into, to relabel the half-edges once at the end
+
+    def find(self, face):
+        """ The face that a face has been merged into """
+        root = face
+        while self.parent.get(root, root) is not root:
+            root = self.parent[root]
+        while face is not root:
+            self.parent[face], face = root, self.parent[face]
+        return root
+
+    def is_removable(self, edge):
+        """
+        Checks if the diagonal can be removed while its faces stay convex, i.e. the corners at both of its endpoints
+        are convex in the joined face. The other corners do not change.
+        """
+        twin = edge.twin
+        a, b = edge.origin.point, twin.origin.point
+        before_a, after_a = edge.prev.origin.point, twin.next.next.origin.point
+        before_b, after_b = twin.prev.origin.point, edge.next.next.origin.point
+        return cross(before_a, a, after_a) >= 0 and cross(before_b, b, after_b) >= 0
+
+    @instrumentation.timed('convex_decomposition')
+    def decompose(self):
+        """
+        Remove every diagonal whose removal keeps both faces next to it convex, in the order of the faces. Every
+        diagonal is tested once in O(1) and the faces are relabeled in one pass at the end, so the whole decomposition
+        takes linear time. The result has at most four times the minimum number of convex pieces.
+        Returns the number of pieces, the number of removed diagonals and the time taken in seconds.
+        """
+        start = time.perf_counter()
+        outside = self.dcel.faces[0]
+        removed = set()
+
+        diagonals = [edge for face in self.dcel.faces[1:] for edge in self.dcel.get_cycle(face.outer_component)
+                     if edge.id < edge.twin.id and edge.twin.incident_face is not outside]
+        for edge in diagonals:
+            if not self.is_removable(edge):
+                continue
+            twin = edge.twin
+            edge.prev.next = twin.next
+            twin.next.prev = edge.prev
+            twin.prev.next = edge.next
+            edge.next.prev = twin.prev
+            removed.update((edge, twin))
+
+            face, other = self.find(edge.incident_face), self.find(twin.incident_face)
+            self.parent[other] = face
+
+        for edge in removed:
+            self.dcel._remove_half_edge(edge)
+        for edge in self.dcel.half_edges:
+            if edge.incident_face is not outside:
+                edge.incident_face = self.find(edge.incident_face)
+                edge.incident_face.outer_component = edge
+        for face in self.parent:
+            self.dcel._remove_face(face)
+        self.dcel.invalidate_faces()
+        for vertex in {edge.origin for edge in removed}:
+            vertex.incident_edge = [edge for edge in vertex.incident_edge if edge not in removed]
+        self.parent = {}
+
+        if self.dual_graph is not None:
+            self.dual_graph.dual_graph = {}
+            self.dual_graph.build_dual_graph()
+
+        if instrumentation.enabled:
+            instrumentation.increment('convex_diagonals_removed', len(removed) // 2)
+        return {'pieces': len(self.dcel.faces) - 1, 'diagonals_removed': len(removed) // 2,
+                'seconds': time.perf_counter() - start}
+
+    def to_arrays(self):
+        """
+        Export the pieces in compact form, the vertex IDs of every piece in counter-clockwise order one after another,
+        and the offsets where each piece starts (with the total length at the end).
+        """
+        offsets = array('i', [0])
+        indices = array('i')
+        for face in self.dcel.faces[1:]:
+            indices.extend(vertex.id for vertex in self.dcel.get_vertices_of_face(face))
+            offsets.append(len(indices))
+        return offsets, indices
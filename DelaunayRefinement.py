@@ -0,0 +1,126 @@
+# Group ID 14 (21114021 & 21114078) - Ashutosh Kumar and Raiwat Bapat
+# Date: October 19 2026
+# DelaunayRefinement.py : Contains the Implementation of the Lawson edge flips that turn a triangulated polygon into its constrained Delaunay triangulation.
+
+import time
+from collections import deque
+
+from elements.DCEL import DCEL
+from elements.Geometry import cross, in_circle
+from elements.Instrumentation import instrumentation
+
+
+class DelaunayRefinement:
+    def __init__(self, dcel: DCEL, dual_graph=None):
+        """
+        Initialize the refinement with a triangulated DCEL and, optionally, the dual graph built from it.
+        The boundary edges of the polygon and of its holes are constraints, every diagonal can be flipped.
+        """
+        self.dcel = dcel
+        self.dual_graph = dual_graph
+        self.flips = 0
+        self.edges_tested = 0
+
+    def is_diagonal(self, edge):
+        """ Checks if a half-edge lies between two triangles of the polygon """
+        outside = self.dcel.faces[0]
+        return edge.incident_face is not outside and edge.twin.incident_face is not outside
+
+    def is_illegal(self, edge):
+        """
+        Checks if the diagonal should be flipped, i.e. the far vertex of the triangle on the other side lies inside the
+        circumcircle of the triangle of the half-edge. The quadrilateral of an illegal diagonal is always convex.
+        """
+        twin = edge.twin
+        if edge.next.next.next is not edge or twin.next.next.next is not twin:
+            return False  # Only diagonals between two triangles can be flipped
+        a, b, c = edge.origin.point, edge.next.origin.point, edge.prev.origin.point
+        d = twin.prev.origin.point
+        if in_circle(a, b, c, d) <= 0:
+            return False
+        return cross(c, a, d) > 0 and cross(d, b, c) > 0  # Guard against rounding on nearly degenerate corners
+
+    def flip(self, edge):
+        """
+        Replace the diagonal ab between the triangles (a, b, c) and (b, a, d) by the diagonal cd in O(1), reusing both
+        half-edges and both faces. The incident edge lists of the vertices are fixed once all flips are done.
+        """
+        twin = edge.twin
+        e1, e2 = edge.next, edge.prev  # b -> c, c -> a
+        t1, t2 = twin.next, twin.prev  # a -> d, d -> b
+        face1, face2 = edge.incident_face, twin.incident_face
+        c, d = e2.origin, t2.origin
+        self.dcel.invalidate_faces(face1, face2)
+
+        # Triangle (d, c, a) keeps the face of the half-edge, triangle (c, d, b) the face of the twin
+        edge.origin, twin.origin = d, c
+        edge.next, e2.next, t1.next = e2, t1, edge
+        edge.prev, e2.prev, t1.prev = t1, edge, e2
+        twin.next, t2.next, e1.next = t2, e1, twin
+        twin.prev, t2.prev, e1.prev = e1, twin, t2
+        t1.incident_face = face1
+        e1.incident_face = face2
+        face1.outer_component = edge
+        face2.outer_component = twin
+
+    @instrumentation.timed('delaunay_refinement')
+    def refine(self):
+        """
+        Flip illegal diagonals until there are none left, starting from every diagonal and queueing again the four
+        edges around each flip. The dual graph, if given, is rebuilt and the vertex colors are recomputed.
+        Returns the number of flips, the number of tested diagonals and the time taken in seconds.
+        """
+        start = time.perf_counter()
+        queue = deque(edge for edge in self.dcel.half_edges if edge.id < edge.twin.id and self.is_diagonal(edge))
+        queued = set(queue)
+        touched = set()
+
+        while queue:
+            edge = queue.popleft()
+            queued.discard(edge)
+            self.edges_tested += 1
+            if not self.is_illegal(edge):
+                continue
+
+            a, b = edge.origin, edge.twin.origin
+            around = (edge.next, edge.prev, edge.twin.next, edge.twin.prev)
+            self.flip(edge)
+            self.flips += 1
+            touched.update((a, b, edge.origin, edge.twin.origin))
+
+            for neighbour in around:
+                if neighbour.id > neighbour.twin.id:
+                    neighbour = neighbour.twin
+                if neighbour not in queued and self.is_diagonal(neighbour):
+                    queue.append(neighbour)
+                    queued.add(neighbour)
+
+        self.update_incident_edges(touched)
+        if self.dual_graph is not None:
+            self.dual_graph.dual_graph = {}
+            self.dual_graph.build_dual_graph()
+            if any(vertex.color is not None for vertex in self.dcel.vertices):
+                # A flip joins two vertices of the same color, the coloring has to be computed again
+                for vertex in self.dcel.vertices:
+                    vertex.color = None
+                self.dual_graph.three_coloring()
+
+        if instrumentation.enabled:
+            instrumentation.increment('delaunay_flips', self.flips)
+            instrumentation.increment('delaunay_edges_tested', self.edges_tested)
+        return {'flips': self.flips, 'edges_tested': self.edges_tested, 'seconds': time.perf_counter() - start}
+
+    def update_incident_edges(self, vertices):
+        """
+        Rebuild the incident edge lists of the given vertices in one pass over the half-edges. The first incident edge
+        of a vertex is its boundary edge, which is never flipped, and stays first.
+        """
+        if not vertices:
+            return
+        outside = self.dcel.faces[0]
+        for vertex in vertices:
+            vertex.incident_edge = vertex.incident_edge[:1]
+        for edge in self.dcel.half_edges:
+            vertex = edge.origin
+            if vertex in vertices and edge.incident_face is not outside and edge is not vertex.incident_edge[0]:
+                vertex.incident_edge.append(edge)
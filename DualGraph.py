@@ -2,9 +2,8 @@
 # Date: September 30 2024
 # DualGraph.py : Contains the Implementation of the Algorithm to Construct the Dual Graph of a Triangulated Polygon
 
-from matplotlib import pyplot as plt
-
 from elements import Face
+from elements.Instrumentation import instrumentation
 from elements.Point import Point
 
 
@@ -58,6 +57,7 @@ class DualGraph:
 
         return twin_faces
 
+    @instrumentation.timed('build_dual_graph')
     def build_dual_graph(self):
         """
         Build the dual graph by iterating through each face and connecting adjacent faces
@@ -81,66 +81,12 @@ class DualGraph:
             print(f"Face {face_id}: Adjacent faces -> {list(neighbors)}")
 
     def plot_dual_graph(self):
-        plt.figure(figsize=(8, 8))
-
-        # Plot the centroids (nodes of the dual graph)
-        for face, adjacent_faces in self.dual_graph.items():
-            # Plot the node (centroid of the face)
-            centroid = face.centroid
-            plt.scatter(centroid.x, centroid.y, c='blue')  # Plot centroids as blue points
-            plt.text(centroid.x, centroid.y, f'{face.id}', fontsize=9, ha='right')  # Label the face ID
-
-            # Plot edges to adjacent faces
-            for adjacent_face in adjacent_faces:
-                adj_centroid = adjacent_face.centroid
-                plt.plot([centroid.x, adj_centroid.x], [centroid.y, adj_centroid.y], 'k-', lw=1)  # Black edges
-
-        # Display the plot
-        plt.title("Dual Graph of Faces")
-        plt.xlabel("X Coordinate")
-        plt.ylabel("Y Coordinate")
-        plt.show()
+        from elements import Visualization
+        Visualization.plot_dual_graph(self)
 
     def plot_dcel_and_dual_graph(self):
-        """
-        Plots both the DCEL (vertices and edges) and the dual graph (faces and their adjacency)
-        in the same image.
-        """
-
-        plt.figure(figsize=(10, 10))
-
-        # Plot DCEL vertices and edges
-        for vertex in self.dcel.vertices:
-            plt.plot(vertex.point.x, vertex.point.y, 'bo')  # Plot vertex as a blue dot
-            plt.text(vertex.point.x, vertex.point.y, f"V{vertex.id}", fontsize=9, ha='right')  # Annotate vertex
-
-        for half_edge in self.dcel.half_edges:
-            origin = self.dcel.vertices[half_edge.origin.id]
-            destination = self.dcel.vertices[half_edge.next.origin.id]
-
-            # Plot the edge between origin and destination
-            plt.plot([origin.point.x, destination.point.x], [origin.point.y, destination.point.y], 'k-',
-                     label='DCEL edge')
-
-        # Plot dual graph nodes and edges (faces and adjacency)
-        for face, adjacent_faces in self.dual_graph.items():
-            # Plot the node (centroid of the face)
-            centroid = face.centroid
-            plt.scatter(centroid.x, centroid.y, c='black', zorder=3)  # Plot centroids as red points for dual graph
-            plt.text(centroid.x, centroid.y, f'{face.id}', fontsize=9, ha='right', color='red')  # Label the face ID
-
-            # Plot edges to adjacent faces
-            for adjacent_face in adjacent_faces:
-                adj_centroid = adjacent_face.centroid
-                plt.plot([centroid.x, adj_centroid.x], [centroid.y, adj_centroid.y], 'r', lw=1, label='Dual graph edge')
-
-        # Set equal scaling and remove axis for better visualization
-        plt.axis('equal')
-        plt.grid(False)
-        plt.gca().set_axis_off()  # Hide axes for clean visualization
-
-        plt.title("DCEL and Dual Graph")
-        plt.show()
+        from elements import Visualization
+        Visualization.plot_dcel_and_dual_graph(self)
 
     def dfs_color_faces(self, face, available_colors):
         # Create a set to store used colors for this face
@@ -169,10 +115,12 @@ class DualGraph:
                 continue  # If all vertices of adjacent face are colored, skip it
             self.dfs_color_faces(adjacent_face, available_colors)
 
+    @instrumentation.timed('three_coloring')
     def three_coloring(self):
         """
         Perform three-coloring of the vertices of a triangulated polygon using the dual graph.
         The graph must be represented as an adjacency list of faces, where each face contains three vertices.
+        The dual graph of several disjoint polygons has one component per polygon, each one is colored separately.
         """
         # Define three available colors (represented as integers)
         available_colors = [0, 1, 2]
@@ -183,106 +131,36 @@ class DualGraph:
         # Run DFS coloring on the faces of the triangulated polygon
         self.dfs_color_faces(starting_face, available_colors)
 
-    def plot_colored_dcel(self):
-        plt.figure(figsize=(8, 8))
-
-        # Define colors corresponding to 0, 1, 2
-        color_map = {0: 'red', 1: 'green', 2: 'blue'}
-        color_names = {0: "Red", 1: "Green", 2: "Blue"}
-
-        # Initialize color count dictionary
-        color_count = {0: 0, 1: 0, 2: 0}
-
-        # Plot vertices with their assigned colors and count color frequencies
+        # An uncolored vertex belongs to a polygon that has not been reached, its boundary face starts another DFS
         for vertex in self.dcel.vertices:
-            color_count[vertex.color] += 1  # Count each vertex color
-            plt.plot(vertex.point.x, vertex.point.y, 'o', color=color_map[vertex.color], markersize=10)  # Color vertex
-            plt.text(vertex.point.x, vertex.point.y, f"V{vertex.id}", fontsize=9, ha='right')
-
-        # Plot edges
-        for half_edge in self.dcel.half_edges:
-            origin = self.dcel.vertices[half_edge.origin.id]
-            destination = self.dcel.vertices[half_edge.next.origin.id]
+            if vertex.color is None:
+                self.dfs_color_faces(vertex.incident_edge[0].incident_face, available_colors)
 
-            # Plot the edge between origin and destination
-            plt.plot([origin.point.x, destination.point.x], [origin.point.y, destination.point.y], 'k-')
-
-        # Find the color with the minimum count
-        min_color = min(color_count, key=color_count.get)
-        min_color_name = color_names[min_color]
-        min_color_value = color_map[min_color]
-        min_color_count = color_count[min_color]
-
-        # Set equal scaling and remove axis for better visualization
-        plt.axis('equal')
-        plt.grid(False)
-        plt.gca().set_axis_off()  # Hide axes
-
-        # Display the minimum color count at the bottom of the plot
-        plt.text(0.5, -0.1,
-                 f"The Sufficient number of Vertex Guards required will be {min_color_count} Colored in {min_color_name}",
-                 fontsize=12, ha='center', va='center', transform=plt.gca().transAxes)
-
-        # Show a dot representing the minimum color at the bottom
-        plt.plot(0.45, -0.1, 'o', color=min_color_value, markersize=12, transform=plt.gca().transAxes)
+    def components(self):
+        """
+        The connected components of the dual graph as lists of faces, one for every disjoint polygon.
+        """
+        components = []
+        seen = set()
+        for face in self.dual_graph:
+            if face in seen:
+                continue
+            seen.add(face)
+            component = [face]
+            stack = [face]
+            while stack:
+                for neighbour in self.dual_graph[stack.pop()]:
+                    if neighbour not in seen:
+                        seen.add(neighbour)
+                        component.append(neighbour)
+                        stack.append(neighbour)
+            components.append(component)
+        return components
 
-        # Show the plot
-        plt.show()
+    def plot_colored_dcel(self):
+        from elements import Visualization
+        Visualization.plot_colored_dcel(self)
 
     def plot_colored_dcel_with_dual_graph(self):
-        plt.figure(figsize=(10, 10))
-
-        # Define colors corresponding to 0, 1, 2
-        color_map = {0: 'red', 1: 'green', 2: 'blue'}
-        color_names = {0: "Red", 1: "Green", 2: "Blue"}
-
-        # Initialize color count dictionary
-        color_count = {0: 0, 1: 0, 2: 0}
-
-        # Plot DCEL vertices with their assigned colors and count color frequencies
-        for vertex in self.dcel.vertices:
-            color_count[vertex.color] += 1  # Count each vertex color
-            plt.plot(vertex.point.x, vertex.point.y, 'o', color=color_map[vertex.color], markersize=10)  # Color vertex
-            plt.text(vertex.point.x, vertex.point.y, f"V{vertex.id}", fontsize=9, ha='right')
-
-        # Plot DCEL edges
-        for half_edge in self.dcel.half_edges:
-            origin = self.dcel.vertices[half_edge.origin.id]
-            destination = self.dcel.vertices[half_edge.next.origin.id]
-
-            # Plot the edge between origin and destination
-            plt.plot([origin.point.x, destination.point.x], [origin.point.y, destination.point.y], 'k-', lw=1)
-
-        # Now, plot the dual graph (centroids of faces and adjacency)
-        for face, adjacent_faces in self.dual_graph.items():
-            # Plot the centroid of the face as a node of the dual graph
-            centroid = face.centroid
-            plt.scatter(centroid.x, centroid.y, c='black', zorder=3, s=50)  # Plot centroids as black points
-
-            # Plot edges connecting the centroids of adjacent faces
-            for adjacent_face in adjacent_faces:
-                adj_centroid = adjacent_face.centroid
-                plt.plot([centroid.x, adj_centroid.x], [centroid.y, adj_centroid.y], 'r-', lw=1,
-                         label='Dual graph edge')
-
-        # Find the color with the minimum count
-        min_color = min(color_count, key=color_count.get)
-        min_color_name = color_names[min_color]
-        min_color_value = color_map[min_color]
-        min_color_count = color_count[min_color]
-
-        # Set equal scaling and remove axis for better visualization
-        plt.axis('equal')
-        plt.grid(False)
-        plt.gca().set_axis_off()  # Hide axes
-
-        # Display the minimum color count at the bottom of the plot
-        plt.text(0.5, -0.1,
-                 f"The Sufficient number of Vertex Guards required will be {min_color_count}, Colored in {min_color_name}",
-                 fontsize=12, ha='center', va='center', transform=plt.gca().transAxes)
-
-        # Show a dot representing the minimum color at the bottom
-        plt.plot(0.45, -0.1, 'o', color=min_color_value, markersize=12, transform=plt.gca().transAxes)
-
-        # Show the plot
-        plt.show()
+        from elements import Visualization
+        Visualization.plot_colored_dcel_with_dual_graph(self)
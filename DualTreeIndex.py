@@ -0,0 +1,152 @@
+# Group ID 14 (21114021 & 21114078) - Ashutosh Kumar and Raiwat Bapat
+# Date: October 19 2026
+# DualTreeIndex.py : Contains the Euler tour and sparse table index of the dual tree for constant time LCA and distance queries between faces.
+
+from array import array
+from collections import deque
+
+from elements.DCEL import DCEL
+from elements.Instrumentation import instrumentation
+
+
+class DualTreeIndex:
+    def __init__(self, dcel: DCEL):
+        """
+        Initialize the index with a DCEL whose dual graph is a tree, or a forest when it holds several disjoint
+        polygons, e.g. a triangulated polygon without holes. Faces are given by their IDs, the index is built once,
+        on the first query.
+        """
+        self.dcel = dcel
+        self.parent = []  # Face ID -> parent face ID, -1 for a root
+        self.parent_edge = []  # Face ID -> half-edge of the face whose twin lies in the parent face
+        self.depth = []
+        self.component = []  # Face ID -> ID of the root of its tree
+        self.first = []  # Face ID -> first position of the face in the Euler tour
+        self.table = []  # table[k][i] is the minimum of the Euler tour keys at positions i to i + 2^k - 1
+        self.built = False
+
+    @instrumentation.timed('dual_tree_index')
+    def build(self):
+        """
+        Root every tree of the dual graph at its face with the smallest ID, walk its Euler tour and build the sparse
+        table over it, in O(n log n) time. An entry of the tour is depth * F + face for F faces, so the smallest entry
+        of a range is the face of least depth and the minimum is a plain integer comparison.
+        """
+        faces = self.dcel.faces
+        outside = faces[0]
+        count = len(faces)
+        self.parent = [-1] * count
+        self.parent_edge = [None] * count
+        self.depth = [0] * count
+        self.component = [-1] * count
+        self.first = [-1] * count
+        tour = array('q')
+
+        for root in faces[1:]:
+            if self.component[root.id] != -1:
+                continue
+            self.component[root.id] = root.id
+            queue = deque([root])
+            order = []
+            while queue:
+                face = queue.popleft()
+                order.append(face)
+                edge = start = face.outer_component
+                while True:
+                    neighbour = edge.twin.incident_face
+                    if neighbour is not outside and neighbour.id != self.parent[face.id]:
+                        if self.component[neighbour.id] != -1:
+                            raise ValueError("The dual graph is not a tree, the polygon must not have holes.")
+                        self.component[neighbour.id] = root.id
+                        self.parent[neighbour.id] = face.id
+                        self.parent_edge[neighbour.id] = edge.twin
+                        self.depth[neighbour.id] = self.depth[face.id] + 1
+                        queue.append(neighbour)
+                    edge = edge.next
+                    if edge is start:
+                        break
+
+            # The Euler tour visits a face, then the tour of every child followed by the face again
+            children = {face.id: [] for face in order}
+            for face in order[1:]:
+                children[self.parent[face.id]].append(face.id)
+            stack = [(root.id, 0)]
+            while stack:
+                face, i = stack.pop()
+                if i == 0:
+                    self.first[face] = len(tour)
+                tour.append(self.depth[face] * count + face)
+                if i < len(children[face]):
+                    stack.append((face, i + 1))
+                    stack.append((children[face][i], 0))
+
+        self.table = [tour]
+        length = 1
+        while 2 * length <= len(tour):
+            previous = self.table[-1]
+            self.table.append(array('q', map(min, previous[:len(previous) - length], previous[length:])))
+            length *= 2
+        self.built = True
+        if instrumentation.enabled:
+            instrumentation.increment('dual_tree_index_faces', count - 1)
+        return self
+
+    def lca(self, face1, face2):
+        """ The lowest common ancestor of two faces by their IDs, or -1 if they lie in different trees """
+        if not self.built:
+            self.build()
+        if self.component[face1] != self.component[face2]:
+            return -1
+        left, right = self.first[face1], self.first[face2]
+        if left > right:
+            left, right = right, left
+        k = (right - left + 1).bit_length() - 1
+        row = self.table[k]
+        return min(row[left], row[right - (1 << k) + 1]) % len(self.first)
+
+    def distance(self, face1, face2):
+        """ The number of diagonals crossed between two faces, or -1 if they lie in different trees """
+        ancestor = self.lca(face1, face2)
+        if ancestor == -1:
+            return -1
+        return self.depth[face1] + self.depth[face2] - 2 * self.depth[ancestor]
+
+    def path(self, face1, face2):
+        """ The IDs of the faces from face1 to face2 along the dual tree, in time linear in their number """
+        ancestor = self.lca(face1, face2)
+        if ancestor == -1:
+            raise ValueError(f"Faces {face1} and {face2} are not connected in the dual graph.")
+        upward = []
+        while face1 != ancestor:
+            upward.append(face1)
+            face1 = self.parent[face1]
+        downward = []
+        while face2 != ancestor:
+            downward.append(face2)
+            face2 = self.parent[face2]
+        return upward + [ancestor] + downward[::-1]
+
+    def lcas(self, faces1, faces2):
+        """ The lowest common ancestors of pairs of faces, given as two sequences of face IDs, as an array """
+        if not self.built:
+            self.build()
+        first, component, table, count = self.first, self.component, self.table, len(self.first)
+        result = array('i')
+        append = result.append
+        for face1, face2 in zip(faces1, faces2):
+            if component[face1] != component[face2]:
+                append(-1)
+                continue
+            left, right = first[face1], first[face2]
+            if left > right:
+                left, right = right, left
+            k = (right - left + 1).bit_length() - 1
+            row = table[k]
+            append(min(row[left], row[right - (1 << k) + 1]) % count)
+        return result
+
+    def distances(self, faces1, faces2):
+        """ The number of diagonals crossed between pairs of faces, as an array, -1 for faces in different trees """
+        depth = self.depth
+        return array('i', (depth[face1] + depth[face2] - 2 * depth[ancestor] if ancestor != -1 else -1
+                           for face1, face2, ancestor in zip(faces1, faces2, self.lcas(faces1, faces2))))
@@ -0,0 +1,80 @@
+# Group ID 14 (21114021 & 21114078) - Ashutosh Kumar and Raiwat Bapat
+# Date: October 19 2026
+# FastTriangulation.py : Contains the triangulation pipeline with direct paths for convex and monotone polygons.
+
+import time
+from array import array
+
+from MonotonePartitioner import MonotonePartitioner, is_left_turn
+from MonotoneTriangulation import MonotoneTriangulation
+from ParallelTriangulation import ParallelTriangulation, triangulate_monotone_ring
+from elements.DCEL import DCEL
+from elements.Instrumentation import instrumentation
+
+
+def convex_strip(m):
+    """
+    Triangulate a convex polygon of m vertices in counter-clockwise order as a zigzag strip between its two ends,
+    which avoids the slivers of a fan. Returns the triangles as a flat array of counter-clockwise index triples.
+    """
+    triangles = array('i')
+    left, right = 0, m - 1
+    while right - left >= 2:
+        triangles.extend((left, left + 1, right))
+        left += 1
+        if right - left >= 2:
+            triangles.extend((left, right - 1, right))
+            right -= 1
+    return triangles
+
+
+class FastTriangulation:
+    def __init__(self, dcel: DCEL):
+        """
+        Initialize the triangulation with the DCEL of a polygon that has not been partitioned yet.
+        """
+        self.dcel = dcel
+        self.partitioner = MonotonePartitioner(dcel)
+
+    def classify(self):
+        """
+        Classify the polygon in O(n) time: 'convex' when every corner turns left, 'monotone' when the sweep would meet
+        no split or merge vertex, and 'general' otherwise or when the polygon has holes.
+        """
+        self.partitioner.classify_vertices()
+        if self.dcel.faces[1].inner_component:
+            return 'general'
+        if all(v_type not in ('split', 'merge') for v_type in self.partitioner.vertex_types.values()):
+            for vertex in self.dcel.vertices:
+                edge = vertex.incident_edge[0]
+                if not is_left_turn(edge.prev.origin, vertex, edge.next.origin):
+                    return 'monotone'
+            return 'convex'
+        return 'general'
+
+    @instrumentation.timed('fast_triangulation')
+    def triangulate(self):
+        """
+        Triangulate the polygon along the cheapest path. A convex polygon is cut into a strip of triangles directly,
+        a monotone polygon goes straight to the chain merge of its two sorted chains, and any other polygon through
+        the sweep of MonotonePartitioner, which reuses the classification, and MonotoneTriangulation.
+        Returns the path taken, the number of triangles and the time taken in seconds.
+        """
+        start = time.perf_counter()
+        path = self.classify()
+        if path == 'general':
+            self.partitioner.perform_sweep_line_partition()
+            MonotoneTriangulation(self.dcel).triangulate()
+        else:
+            cycle = self.dcel.get_cycle(self.dcel.faces[1].outer_component)
+            if path == 'convex':
+                triangles = convex_strip(len(cycle))
+            else:
+                triangles = triangulate_monotone_ring(array('d', (edge.origin.point.x for edge in cycle)),
+                                                      array('d', (edge.origin.point.y for edge in cycle)))
+            if len(cycle) > 3:
+                ParallelTriangulation(self.dcel, processes=1).merge_piece(cycle, triangles)
+
+        if instrumentation.enabled:
+            instrumentation.increment(f'fast_path_{path}')
+        return {'path': path, 'triangles': len(self.dcel.faces) - 1, 'seconds': time.perf_counter() - start}
@@ -0,0 +1,345 @@
+# Group ID 14 (21114021 & 21114078) - Ashutosh Kumar and Raiwat Bapat
+# Date: October 19 2026
+# IncrementalTriangulation.py : Contains the Implementation of local retriangulation of a triangulated polygon after moving, inserting or deleting one vertex.
+
+from collections import deque
+
+from elements.DCEL import DCEL
+from elements.Geometry import cross, ear_clipping, on_segment, polygon_area, segments_intersect
+from elements.Point import Point
+from elements.Vertex import Vertex
+
+
+class IncrementalTriangulation:
+    def __init__(self, dcel: DCEL, dual_graph=None):
+        """
+        Initialize the editor with a triangulated DCEL and, optionally, the dual graph built from it.
+        Every edit only removes the triangles around the edited vertex (the cavity), retriangulates the cavity and
+        patches the dual graph and the vertex colors of the cavity. The cavity grows across the diagonals that the
+        edit would cross, an edit that would cross the boundary of the cavity or a boundary edge of the polygon at one
+        of the vertices of the cavity raises a ValueError before anything is changed. The edit must keep the polygon
+        simple farther away from the cavity, this is not checked.
+        """
+        self.dcel = dcel
+        self.dual_graph = dual_graph
+
+    def move_vertex(self, vertex: Vertex, point: Point):
+        """
+        Move a vertex of the polygon to a new position.
+        """
+        faces = {edge.incident_face for edge in vertex.incident_edge}
+
+        def edit(boundary):
+            index = next(i for i, entry in enumerate(boundary) if entry[0] is vertex)
+            boundary[index][1] = point
+            return [index - 1, index]
+
+        faces = self.find_cavity(faces, edit)
+        self.remove_cavity(faces)
+        vertex.point = point
+        self.retriangulate_cavity(vertex.incident_edge[0].incident_face, vertex)
+
+    def insert_vertex(self, half_edge, point: Point):
+        """
+        Insert a new vertex at the given point between the endpoints of a boundary half-edge, the half-edge is the one
+        that lies inside the polygon. Returns the new vertex.
+        """
+        faces = {half_edge.incident_face}
+
+        def edit(boundary):
+            index = next(i for i, entry in enumerate(boundary) if entry[2] is half_edge)
+            boundary[index][2] = None
+            boundary.insert(index + 1, [None, point, None])
+            return [index, index + 1]
+
+        faces = self.find_cavity(faces, edit)
+        self.remove_cavity(faces)
+        vertex = Vertex(point)
+        self.dcel.split_edge(half_edge, vertex)
+        self.retriangulate_cavity(vertex.incident_edge[0].incident_face, vertex)
+        return vertex
+
+    def delete_vertex(self, vertex: Vertex):
+        """
+        Delete a vertex of the polygon, its two neighbours on the boundary are joined by a new edge.
+        """
+        boundary_twin = vertex.incident_edge[0].twin
+        if boundary_twin.next.next.next is boundary_twin:
+            raise ValueError("A polygon must have at least 3 vertices.")
+        faces = {edge.incident_face for edge in vertex.incident_edge}
+
+        def edit(boundary):
+            index = next(i for i, entry in enumerate(boundary) if entry[0] is vertex)
+            boundary.pop(index)
+            boundary[index - 1][2] = None
+            return [index - 1]
+
+        faces = self.find_cavity(faces, edit)
+        previous_edge = vertex.incident_edge[0].twin.next.twin  # The boundary edge that ends at the vertex
+        self.remove_cavity(faces)
+        self.dcel.remove_boundary_vertex(vertex)
+        self.retriangulate_cavity(previous_edge.incident_face, None)
+
+    def get_cavity_boundary(self, faces):
+        """
+        Get the half-edges on the boundary of the union of the given faces, in counter-clockwise order.
+        """
+        start = next(edge for face in faces for edge in self.dcel.get_cycle(face.outer_component)
+                     if edge.twin.incident_face not in faces)
+        boundary = []
+        edge = start
+        while True:
+            boundary.append(edge)
+            edge = edge.next
+            while edge.twin.incident_face in faces:
+                edge = edge.twin.next  # Step over a diagonal inside the cavity
+            if edge == start:
+                break
+        return boundary
+
+    def find_cavity(self, faces, edit):
+        """
+        Grow the set of faces until the edited boundary of their union is a simple counter-clockwise polygon.
+        The boundary is a list of [vertex, point, half-edge] entries, one per boundary edge. The edit function changes
+        it in place and returns the indices of the edges whose geometry changed.
+        """
+        while True:
+            cavity_edges = self.get_cavity_boundary(faces)
+            boundary = [[edge.origin, edge.origin.point, edge] for edge in cavity_edges]
+            changed = {i % len(boundary) for i in edit(boundary)}
+            points = [point for _, point, _ in boundary]
+            n = len(points)
+
+            crossed = self._crossed_edges(points, changed)
+            if not crossed and polygon_area(points) > 0:
+                entered = self._entered_faces(boundary, changed, faces, cavity_edges)
+                if not entered:
+                    return faces
+                faces = faces | entered
+                continue
+
+            if crossed:
+                candidates = crossed
+            else:
+                # The cavity is turned inside out, grow across the edges that have a changed point on their outer side
+                moved = {i for j in changed for i in (j, (j + 1) % n)}
+                candidates = {j for j in range(n) if
+                              any(cross(points[j], points[(j + 1) % n], points[i]) < 0 for i in moved)}
+
+            grow = set()
+            for j in candidates:
+                edge = boundary[j][2]
+                if edge is None:
+                    continue
+                if edge.twin.incident_face.id == 0:
+                    if crossed:
+                        raise ValueError("The edit would make the polygon self-intersecting.")
+                    continue
+                grow.add(edge.twin.incident_face)
+            if not grow:
+                raise ValueError("The edit would make the polygon self-intersecting.")
+            faces = faces | grow
+
+    def _crossed_edges(self, points, changed):
+        """ Indices of the boundary edges that intersect one of the changed edges other than at a shared endpoint """
+        n = len(points)
+        crossed = set()
+        for i in changed:
+            p1, p2 = points[i], points[(i + 1) % n]
+            for j in range(n):
+                if j == i:
+                    continue
+                q1, q2 = points[j], points[(j + 1) % n]
+                if j == (i + 1) % n:
+                    overlap = on_segment(p1, p2, q2) or on_segment(q1, q2, p1)
+                elif (j + 1) % n == i:
+                    overlap = on_segment(p1, p2, q1) or on_segment(q1, q2, p2)
+                else:
+                    overlap = segments_intersect(p1, p2, q1, q2)
+                if overlap:
+                    crossed.add(j)
+        return crossed
+
+    def _entered_faces(self, boundary, changed, faces, cavity_edges):
+        """
+        Check the changed edges against the polygon around the cavity. A changed edge that crosses a boundary edge of
+        the polygon at one of the vertices of the cavity raises a ValueError. A changed edge that leaves one of its
+        endpoints into a triangle outside the cavity would overlap it, all the triangles around that endpoint are
+        returned for the cavity to grow across. The cavity edges are the half-edges on its boundary before the edit.
+        """
+        n = len(boundary)
+        vertices = {edge.origin for edge in cavity_edges}
+        # The boundary edges that leave and that reach every vertex, by their half-edges inside the polygon
+        boundary_edges = {side for vertex in vertices for edge in vertex.incident_edge
+                          if edge.twin.incident_face.id == 0 for side in (edge, edge.twin.next.twin)}
+        boundary_edges.difference_update(cavity_edges)
+
+        entered = set()
+        for i in changed:
+            (vertex1, p1, _), (vertex2, p2, _) = boundary[i], boundary[(i + 1) % n]
+            for edge in boundary_edges:
+                q1, q2 = edge.origin.point, edge.next.origin.point
+                if edge.origin is vertex1 or edge.origin is vertex2:
+                    p, q = (p1, p2) if edge.origin is vertex1 else (p2, p1)
+                    overlap = on_segment(p, q, q2) or on_segment(q1, q2, q)
+                elif edge.next.origin is vertex1 or edge.next.origin is vertex2:
+                    p, q = (p1, p2) if edge.next.origin is vertex1 else (p2, p1)
+                    overlap = on_segment(p, q, q1) or on_segment(q1, q2, q)
+                else:
+                    overlap = segments_intersect(p1, p2, q1, q2)
+                if overlap:
+                    raise ValueError("The edit would make the polygon self-intersecting.")
+
+            for vertex, start, end in ((vertex1, p1, p2), (vertex2, p2, p1)):
+                if vertex is None:
+                    continue
+                star = {edge.incident_face for edge in vertex.incident_edge if edge.incident_face.id != 0}
+                for edge in vertex.incident_edge:
+                    face = edge.incident_face
+                    if face.id == 0 or face in faces:
+                        continue
+                    a, b = edge.next.origin.point, edge.prev.origin.point
+                    if cross(start, a, end) >= 0 and cross(start, end, b) > 0:
+                        entered |= star - faces
+        return entered
+
+    def remove_cavity(self, faces):
+        """
+        Remove the diagonals inside the cavity so that it becomes a single face, and drop its faces from the dual graph.
+        """
+        if self.dual_graph is not None:
+            for face in faces:
+                for neighbour in self.dual_graph.dual_graph.pop(face, ()):
+                    if neighbour in self.dual_graph.dual_graph:
+                        self.dual_graph.dual_graph[neighbour].discard(face)
+
+        diagonals = [edge for face in faces for edge in self.dcel.get_cycle(face.outer_component)
+                     if edge.twin.incident_face in faces and edge.id < edge.twin.id]
+        for edge in diagonals:
+            self.dcel.remove_diagonal(edge)
+
+    def retriangulate_cavity(self, face, free_vertex):
+        """
+        Triangulate the cavity face again. A fan from the edited vertex is used when every fan triangle is valid, as
+        it keeps the colors of the cavity, otherwise the ears of the cavity are clipped, preferring the ears whose
+        corners already have three different colors.
+        """
+        vertices = [edge.origin for edge in self.dcel.get_cycle(face.outer_component)]
+        diagonals = []
+        if free_vertex is not None:
+            k = vertices.index(free_vertex)
+            others = vertices[k + 1:] + vertices[:k]
+            if all(cross(free_vertex.point, others[i].point, others[i + 1].point) > 0 for i in range(len(others) - 1)):
+                diagonals = [(free_vertex, v) for v in others[1:-1]]
+        if not diagonals and len(vertices) > 3:
+            diagonals = [(vertices[a], vertices[b]) for a, b in
+                         ear_clipping([v.point for v in vertices], [v.color for v in vertices])]
+
+        first_new_face = len(self.dcel.faces)
+        for vertex1, vertex2 in diagonals:
+            self.dcel.add_diagonal(vertex1, vertex2)
+        new_faces = [face] + self.dcel.faces[first_new_face:]
+
+        if self.dual_graph is not None:
+            for new_face in new_faces:
+                neighbours = self.dual_graph.iterate_half_edges_of_face(new_face)
+                self.dual_graph.dual_graph[new_face] = neighbours
+                for neighbour in neighbours:
+                    self.dual_graph.dual_graph.setdefault(neighbour, set()).add(new_face)
+        self.recolor(new_faces)
+
+    def local_coloring(self, new_faces):
+        """ A three-coloring of the vertices of the new triangles alone, by walking across their shared diagonals """
+        new_face_set = set(new_faces)
+        first = new_faces[0].outer_component
+        local = {first.origin: 0, first.next.origin: 1, first.prev.origin: 2}
+        visited = {new_faces[0]}
+        stack = [first]
+        while stack:
+            entry = stack.pop()
+            for edge in (entry, entry.next, entry.prev):
+                neighbour = edge.twin.incident_face
+                if neighbour in new_face_set and neighbour not in visited:
+                    visited.add(neighbour)
+                    twin = edge.twin
+                    local[twin.prev.origin] = 3 - local[twin.origin] - local[twin.next.origin]
+                    stack.append(twin)
+        return local
+
+    def largest_side(self, sides, new_face_set):
+        """
+        The permutation whose diagonals lead to the most triangles outside the cavity. The parts behind the diagonals
+        are explored together, one triangle of each at a time, until all but one are exhausted, so the cost is
+        proportional to the size of the smaller parts.
+        """
+        visited = set(new_face_set)
+        queues = {}
+        for key, faces in sides.items():
+            queues[key] = deque(faces)
+            visited.update(faces)
+        active = list(queues)
+        while len(active) > 1:
+            for key in active:
+                queue = queues[key]
+                if not queue:
+                    continue
+                edge = queue.popleft().outer_component
+                for side in (edge, edge.next, edge.prev):
+                    neighbour = side.twin.incident_face
+                    if neighbour.id != 0 and neighbour not in visited:
+                        visited.add(neighbour)
+                        queue.append(neighbour)
+            active = [key for key in active if queues[key]] or active[:1]
+        return active[0]
+
+    def recolor(self, new_faces):
+        """
+        Patch the three-coloring after an edit. The colors spread from a triangle next to the cavity through the new
+        triangles, and beyond them only as far as some vertex actually had to change its color.
+        The coloring of the new triangles is unique up to a permutation of the colors, and every diagonal on the
+        boundary of the cavity leads to a part of the polygon that keeps its colors only if the permutation agrees
+        with them there. The spreading starts at a diagonal of the permutation that the most triangles agree with, so
+        only the smaller parts are recolored. The cavity cannot always be triangulated with the colors it has, e.g.
+        when the two neighbours of a deleted vertex have the same color, and then O(n) vertices may have to change in
+        the worst case.
+        """
+        new_face_set = set(new_faces)
+        start = None
+        local = self.local_coloring(new_faces)
+        sides = {}  # Permutation of the local colors -> triangles behind the diagonals that agree with it
+        starts = {}  # Permutation of the local colors -> first diagonal that agrees with it
+        for face in new_faces:
+            for edge in self.dcel.get_cycle(face.outer_component):
+                outside = edge.twin.incident_face
+                a, b = edge.origin, edge.next.origin
+                if outside.id != 0 and outside not in new_face_set and a.color is not None and b.color is not None:
+                    permutation = [0, 0, 0]
+                    permutation[local[a]], permutation[local[b]] = a.color, b.color
+                    permutation[3 - local[a] - local[b]] = 3 - a.color - b.color
+                    key = tuple(permutation)
+                    sides.setdefault(key, []).append(outside)
+                    starts.setdefault(key, edge)
+        if sides:
+            start = starts[self.largest_side(sides, new_face_set)]
+        if start is None:
+            start = new_faces[0].outer_component
+            if start.origin.color is None or start.next.origin.color is None:
+                return  # The polygon has not been colored
+
+        changed = set()
+        visited = {start.incident_face}
+        queue = deque([start])
+        while queue:
+            entry = queue.popleft()
+            a, b, c = entry.origin, entry.next.origin, entry.prev.origin
+            required = ({0, 1, 2} - {a.color, b.color}).pop()
+            if c.color != required:
+                c.color = required
+                changed.add(c)
+            for edge in (entry.next, entry.prev):
+                neighbour = edge.twin.incident_face
+                if neighbour.id == 0 or neighbour in visited:
+                    continue
+                if neighbour in new_face_set or edge.origin in changed or edge.next.origin in changed:
+                    visited.add(neighbour)
+                    queue.append(edge.twin)
@@ -2,7 +2,11 @@
 # Date: September 27 2024
 # MonotonePartitioner.py : Contains the Implementation of the Monotone Partitioner Algorithm for Polygon Triangulation.
 
+from elements.Instrumentation import instrumentation
 from elements.StatusTree import StatusTree
+from elements.Tracing import INFO, tracing
+
+tracer = tracing.get_tracer('MonotonePartitioner')
 
 
 def is_left_turn(prev, current, next_vertex):
@@ -11,51 +15,113 @@ def is_left_turn(prev, current, next_vertex):
             prev.point.x - current.point.x) * (next_vertex.point.y - current.point.y) > 0
 
 
+def is_above(vertex1, vertex2):
+    """ Determines if vertex1 comes before vertex2 in the sweep, vertices with equal y are ordered by increasing x """
+    return vertex1.point.y > vertex2.point.y or (vertex1.point.y == vertex2.point.y and vertex1.point.x < vertex2.point.x)
+
+
 class MonotonePartitioner:
     def __init__(self, dcel):
         self.new_diagonals = []
+        self.found_diagonals = set()  # The diagonals of new_diagonals, for constant time duplicate checks
         self.dcel = dcel  # The DCEL representation of the original polygon
         self.status_tree = StatusTree()  # Status structure (active edges) for the sweep line
+        # Polygon face -> its status tree, the sweep over several disjoint polygons keeps their edges apart, since
+        # the left neighbour of a vertex always bounds the polygon of the vertex. status_tree is the current one.
+        self.status_trees = {}
         self.vertex_types = {}  # To store classified vertices
+        self.changes = None  # Changes of the status tree, helpers and diagonals of the current step, while stepping
 
+    @instrumentation.timed('classify_vertices')
     def classify_vertices(self):
         """ Classifies vertices into start, end, split, merge, and regular """
-        n = len(self.dcel.vertices)
-        for i, vertex in enumerate(self.dcel.vertices):
-            prev = self.dcel.vertices[(i - 1 + n) % n]
-            next_vertex = self.dcel.vertices[(i + 1) % n]
+        for vertex in self.dcel.vertices:
+            # The neighbours are taken along the boundary ring of the vertex, which can be the outer boundary or a hole
+            edge = vertex.incident_edge[0]
+            prev = edge.prev.origin
+            next_vertex = edge.next.origin
 
-            if vertex.point.y > prev.point.y and vertex.point.y > next_vertex.point.y:
+            if is_above(vertex, prev) and is_above(vertex, next_vertex):
                 if is_left_turn(prev, vertex, next_vertex):
                     self.vertex_types[vertex.id] = 'start'
                 else:
                     self.vertex_types[vertex.id] = 'split'
-            elif vertex.point.y < prev.point.y and vertex.point.y < next_vertex.point.y:
+            elif is_above(prev, vertex) and is_above(next_vertex, vertex):
                 if is_left_turn(prev, vertex, next_vertex):
                     self.vertex_types[vertex.id] = 'end'
                 else:
                     self.vertex_types[vertex.id] = 'merge'
-            elif prev.point.y < vertex.point.y < next_vertex.point.y:
+            elif is_above(vertex, prev) and is_above(next_vertex, vertex):
                 self.vertex_types[vertex.id] = 'regular_right'
             else:
                 self.vertex_types[vertex.id] = 'regular_left'
 
             # print(f"{vertex} Type: {self.vertex_types[vertex.id]} Prev: {prev} Next: {next_vertex}")
 
+        if instrumentation.enabled:
+            instrumentation.count_vertex_types(self.vertex_types)
+
+    @instrumentation.timed('sweep')
     def perform_sweep_line_partition(self):
         """ Perform the sweep line algorithm to partition the polygon into monotone pieces """
         # Sort vertices by decreasing y-coordinate (and by x if tie)
         sorted_vertices = sorted(self.dcel.vertices, key=lambda p: (-p.point.y, p.point.x))
 
-        # Classify vertices
-        self.classify_vertices()
+        # Classify vertices, unless classify_vertices has already been called
+        if not self.vertex_types:
+            self.classify_vertices()
 
         for vertex in sorted_vertices:
-            v_type = self.vertex_types[vertex.id]
-            self.status_tree.set_sweep_line_y(vertex.point.y)
-
             self.dcel.plot_dcel(sweep_line_y=vertex.point.y)
+            self.handle_vertex(vertex)
 
+        # Add diagonals to the DCEL
+        for vertex1, vertex2 in self.order_diagonals():
+            self.add_diagonal_to_dcel(vertex1, vertex2)
+
+    def steps(self):
+        """
+        Perform the partition one event at a time. Every vertex of the sweep yields its changes: the edges inserted
+        into and deleted from the status tree, the new helpers as (edge ID, vertex ID) pairs and the diagonals found.
+        Then every diagonal added to the DCEL yields the number of faces. Closing the generator during the sweep
+        adds no diagonal to the DCEL, but the helpers of the half-edges, the vertex types and the status tree keep the
+        state of the sweep so far. No step records images.
+        """
+        sorted_vertices = sorted(self.dcel.vertices, key=lambda p: (-p.point.y, p.point.x))
+        if not self.vertex_types:
+            self.classify_vertices()
+
+        for vertex in sorted_vertices:
+            found = len(self.new_diagonals)
+            self.changes = {'status_inserted': [], 'status_deleted': [], 'helpers': []}
+            try:
+                self.handle_vertex(vertex, record_images=False)
+                changes = self.changes
+            finally:
+                self.changes = None
+            yield {'event': 'sweep', 'vertex': vertex.id, 'type': self.vertex_types[vertex.id],
+                   'sweep_line_y': vertex.point.y, **changes,
+                   'diagonals': [(vertex1.id, vertex2.id) for vertex1, vertex2 in self.new_diagonals[found:]]}
+
+        for vertex1, vertex2 in self.order_diagonals():
+            self.add_diagonal_to_dcel(vertex1, vertex2)
+            yield {'event': 'add_diagonal', 'vertex1': vertex1.id, 'vertex2': vertex2.id,
+                   'faces': len(self.dcel.faces)}
+
+    def handle_vertex(self, vertex, record_images=None):
+        """ Move the sweep line to the vertex and handle it by its type, record_images=False skips the plots """
+        v_type = self.vertex_types[vertex.id]
+        face = vertex.incident_edge[0].incident_face
+        if face not in self.status_trees:
+            # The first polygon keeps the initial tree
+            self.status_trees[face] = StatusTree() if self.status_trees else self.status_tree
+        self.status_tree = self.status_trees[face]
+        self.status_tree.set_sweep_line_y(vertex.point.y)
+
+        recording = self.dcel.record_images
+        if record_images is not None:
+            self.dcel.record_images = record_images
+        try:
             if v_type == 'start':
                 self.handle_start_vertex(vertex)
             elif v_type == 'end':
@@ -66,24 +132,76 @@ class MonotonePartitioner:
                 self.handle_merge_vertex(vertex)
             else:
                 self.handle_regular_vertex(vertex)
+        finally:
+            self.dcel.record_images = recording
 
-        # Add diagonals to the DCEL
+    def insert_edge(self, edge, vertex):
+        """ Add an edge to the status tree with the vertex as its helper """
+        self.status_tree.insert(edge)
+        edge.helper = vertex
+        if self.changes is not None:
+            self.changes['status_inserted'].append(edge.id)
+            self.changes['helpers'].append((edge.id, vertex.id))
+        if tracer.debug:
+            tracer.emit('status_insert', vertex=vertex.id, edge=edge.id)
+
+    def delete_edge(self, edge, vertex):
+        """ Remove an edge from the status tree at the vertex where it ends """
+        self.status_tree.delete(edge)
+        if self.changes is not None:
+            self.changes['status_deleted'].append(edge.id)
+        if tracer.debug:
+            tracer.emit('status_delete', vertex=vertex.id, edge=edge.id)
+
+    def set_helper(self, edge, vertex):
+        edge.helper = vertex
+        if self.changes is not None:
+            self.changes['helpers'].append((edge.id, vertex.id))
+
+    def order_diagonals(self):
+        """
+        Order the diagonals so that the ones joining the holes to the rest of the boundary come first. They are added
+        while the polygon is still a single face, so later diagonals only ever split faces without holes.
+        """
+        rings = self.dcel.get_rings()
+        if len(rings) < 2:
+            return self.new_diagonals
+
+        ring_of = {}
+        for ring_index, ring in enumerate(rings):
+            for vertex in ring:
+                ring_of[vertex.id] = ring_index
+        parent = list(range(len(rings)))
+
+        def find(i):
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+
+        bridges = []
+        splits = []
         for vertex1, vertex2 in self.new_diagonals:
-            self.add_diagonal_to_dcel(vertex1, vertex2)
+            root1, root2 = find(ring_of[vertex1.id]), find(ring_of[vertex2.id])
+            if root1 != root2:
+                parent[root1] = root2
+                bridges.append((vertex1, vertex2))
+            else:
+                splits.append((vertex1, vertex2))
+        return bridges + splits
 
     def handle_start_vertex(self, vertex):
         """ Handle start vertex during the sweep """
         # Find the next edge in the polygon and add it to the status
-        print(f"Start vertex at {vertex}")
+        if tracer.debug:
+            tracer.emit('start_vertex', vertex=vertex.id)
         self.dcel.plot_dcel(sweep_line_y=vertex.point.y, current_vertex_id=vertex.id)
-        edge = vertex.incident_edge[0]
-        self.status_tree.insert(edge)
-        edge.helper = vertex  # Set helper to the current vertex
-        print(f"Adding edge {edge} to Status Tree")
+        self.insert_edge(vertex.incident_edge[0], vertex)  # The current vertex is the helper of its edge
 
     def handle_end_vertex(self, vertex):
         """ Handle end vertex during the sweep """
-        print(f"End vertex at {vertex}")
+        if tracer.debug:
+            tracer.emit('end_vertex', vertex=vertex.id)
         self.dcel.plot_dcel(sweep_line_y=vertex.point.y, current_vertex_id=vertex.id)
         edge = vertex.incident_edge[0].prev
         self.dcel.plot_dcel(sweep_line_y=vertex.point.y, current_vertex_id=vertex.id, left_edge_id=edge.id)
@@ -93,13 +211,13 @@ class MonotonePartitioner:
             self.add_diagonal(edge.helper, vertex)
             self.dcel.plot_dcel(sweep_line_y=vertex.point.y, current_vertex_id=vertex.id, add_diagonal=True,
                                 start=edge.helper, end=vertex)
-        self.status_tree.delete(edge)
-        print(f"Removing edge {edge} from Status Tree")
+        self.delete_edge(edge, vertex)
 
     def handle_split_vertex(self, vertex):
         """ Handle split vertex by adding a diagonal """
         # Find the nearest left edge (status structure is sorted by x-coordinates)
-        print(f"Spilt Vertex at {vertex}")
+        if tracer.debug:
+            tracer.emit('split_vertex', vertex=vertex.id)
         self.dcel.plot_dcel(sweep_line_y=vertex.point.y, current_vertex_id=vertex.id)
         left_edge = self.status_tree.find_left_neighbor(vertex)
         self.dcel.plot_dcel(sweep_line_y=vertex.point.y, current_vertex_id=vertex.id, left_edge_id=left_edge.id)
@@ -109,17 +227,14 @@ class MonotonePartitioner:
             self.dcel.plot_dcel(sweep_line_y=vertex.point.y, current_vertex_id=vertex.id, add_diagonal=True,
                                 start=left_edge.helper, end=vertex)
             # Set the new helper for the left edge
-            left_edge.helper = vertex
+            self.set_helper(left_edge, vertex)
 
-        edge = vertex.incident_edge[0]
-        self.status_tree.insert(edge)
-        edge.helper = vertex
-
-        print(f"Adding edge {edge} to Status Tree")
+        self.insert_edge(vertex.incident_edge[0], vertex)
 
     def handle_merge_vertex(self, vertex):
         """ Handle merge vertex by adding a diagonal """
-        print(f"Merge Vertex at {vertex}")
+        if tracer.debug:
+            tracer.emit('merge_vertex', vertex=vertex.id)
         self.dcel.plot_dcel(sweep_line_y=vertex.point.y, current_vertex_id=vertex.id)
         edge = vertex.incident_edge[0].prev
         self.dcel.plot_dcel(sweep_line_y=vertex.point.y, current_vertex_id=vertex.id, left_edge_id=edge.id)
@@ -129,8 +244,7 @@ class MonotonePartitioner:
             self.add_diagonal(edge.helper, vertex)
             self.dcel.plot_dcel(sweep_line_y=vertex.point.y, current_vertex_id=vertex.id, add_diagonal=True,
                                 start=edge.helper, end=vertex)
-        self.status_tree.delete(edge)
-        print(f"Removing edge {edge} from Status Tree")
+        self.delete_edge(edge, vertex)
 
         left_edge = self.status_tree.find_left_neighbor(vertex)
         self.dcel.plot_dcel(sweep_line_y=vertex.point.y, current_vertex_id=vertex.id, left_edge_id=left_edge.id)
@@ -140,15 +254,15 @@ class MonotonePartitioner:
             self.add_diagonal(left_edge.helper, vertex)
             self.dcel.plot_dcel(sweep_line_y=vertex.point.y, current_vertex_id=vertex.id, add_diagonal=True,
                                 start=left_edge.helper, end=vertex)
-        left_edge.helper = vertex
+        self.set_helper(left_edge, vertex)
 
     def handle_regular_vertex(self, vertex):
         """ Handle regular vertex during the sweep """
-        print(f"Handling regular vertex at {vertex}")
+        if tracer.debug:
+            tracer.emit('regular_vertex', vertex=vertex.id, type=self.vertex_types[vertex.id])
         self.dcel.plot_dcel(sweep_line_y=vertex.point.y, current_vertex_id=vertex.id)
         # Check whether it is on the left or right chain of the polygon
         if self.vertex_types[vertex.id] == 'regular_left':
-            print(f"Interior of Polygon lies to the right of the regular vertex")
             edge = vertex.incident_edge[0].prev
             self.dcel.plot_dcel(sweep_line_y=vertex.point.y, current_vertex_id=vertex.id, left_edge_id=edge.id)
             if edge and self.vertex_types[edge.helper.id] == 'merge':
@@ -157,14 +271,9 @@ class MonotonePartitioner:
                 self.add_diagonal(edge.helper, vertex)
                 self.dcel.plot_dcel(sweep_line_y=vertex.point.y, current_vertex_id=vertex.id, add_diagonal=True,
                                     start=edge.helper, end=vertex)
-            self.status_tree.delete(edge)
-            print(f"Removing edge {edge} from Status Tree")
-            new_edge = vertex.incident_edge[0]
-            self.status_tree.insert(new_edge)
-            print(f"Adding edge {new_edge} to Status Tree")
-            new_edge.helper = vertex
+            self.delete_edge(edge, vertex)
+            self.insert_edge(vertex.incident_edge[0], vertex)
         else:
-            print(f"Interior of Polygon lies to the left of the regular vertex")
             edge = self.status_tree.find_left_neighbor(vertex)
             self.dcel.plot_dcel(sweep_line_y=vertex.point.y, current_vertex_id=vertex.id, left_edge_id=edge.id)
             if edge and self.vertex_types[edge.helper.id] == 'merge':
@@ -173,12 +282,14 @@ class MonotonePartitioner:
                 self.add_diagonal(edge.helper, vertex)
                 self.dcel.plot_dcel(sweep_line_y=vertex.point.y, current_vertex_id=vertex.id, add_diagonal=True,
                                     start=edge.helper, end=vertex)
-            edge.helper = vertex
+            self.set_helper(edge, vertex)
 
     def add_diagonal(self, vertex1, vertex2):
         """ Add a diagonal between two vertices to make the polygon monotone """
-        if (vertex1, vertex2) in self.new_diagonals: return
-        print(f"Adding diagonal between {vertex1} and {vertex2}")
+        if (vertex1, vertex2) in self.found_diagonals: return
+        self.found_diagonals.add((vertex1, vertex2))
+        if tracer.info:
+            tracer.emit('diagonal', INFO, vertex1=vertex1.id, vertex2=vertex2.id)
         self.new_diagonals.append((vertex1, vertex2))
 
     def add_diagonal_to_dcel(self, vertex1, vertex2):
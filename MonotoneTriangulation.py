@@ -4,18 +4,26 @@
 
 from collections import deque
 
-from elements.DCEL import DCEL, Face, diagonal_exist
+from elements.DCEL import DCEL, Face
+from elements.Geometry import turns_left
+from elements.Instrumentation import instrumentation
+from elements.Tracing import INFO, tracing
+
+tracer = tracing.get_tracer('MonotoneTriangulation')
 
 
 class MonotoneTriangulation:
     def __init__(self, dcel: DCEL):
         self.dcel = dcel  # The DCEL that contains monotone polygons
         self.new_diagonals = []  # List of added diagonals
+        self.found_diagonals = set()  # The diagonals of new_diagonals, for constant time duplicate checks
 
     def add_diagonal(self, vertex1, vertex2):
         """ Add a diagonal between two vertices to make the polygon monotone """
-        if (vertex1, vertex2) in self.new_diagonals: return
-        print(f"Adding diagonal between {vertex1} and {vertex2}")
+        if (vertex1, vertex2) in self.found_diagonals: return
+        self.found_diagonals.add((vertex1, vertex2))
+        if tracer.info:
+            tracer.emit('diagonal', INFO, vertex1=vertex1.id, vertex2=vertex2.id)
         self.new_diagonals.append((vertex1, vertex2))
 
     def add_diagonal_to_dcel(self, vertex1, vertex2):
@@ -28,15 +36,26 @@ class MonotoneTriangulation:
         """
         Triangulate a monotone polygon represented by a face in the DCEL.
         """
+        for _ in self.monotone_polygon_steps(face):
+            pass
+
+    def monotone_polygon_steps(self, face: Face):
+        """
+        Triangulate a monotone polygon represented by a face in the DCEL, yielding every vertex after it is handled
+        together with the number of vertices left on the stack.
+        """
         # Get the vertices of the face in sorted order by y-coordinate
-        vertices = sorted(self.dcel.get_vertices_of_face(face),
+        boundary = self.dcel.get_face_boundary(face)
+        vertices = sorted(boundary.vertices,
                           key=lambda v: (-v.point.y, v.point.x))  # Decreasing y, increasing x
         stack = deque([vertices[0], vertices[1]])  # Initialize stack with first two vertices
         edge = face.outer_component
         start = edge
         flag = 0
+        top_edge = None
         while True:
             if edge.origin == vertices[0]:
+                top_edge = edge
                 vertices[0].chain_val = 2
                 flag = 1 - flag
             elif edge.origin == vertices[-1]:
@@ -48,63 +67,80 @@ class MonotoneTriangulation:
             edge = edge.next
             if edge == start:
                 break
+        # The boundary runs down from the top vertex along the left chain
+        left_chain = top_edge.next.origin.chain_val
 
         for i in range(2, len(vertices) - 1):
             current_vertex = vertices[i]
+            top_vertex = stack[-1]
 
-            if len(stack) > 2:
-                top_vertex = stack[-1]
-                if top_vertex.chain_val != current_vertex.chain_val:
-                    # not_used = []
-                    while len(stack) > 1:
-                        v = stack.pop()
-                        self.dcel.plot_dcel(current_vertex_id=current_vertex.id, helper_vertex_id=v.id)
-                        if diagonal_exist(current_vertex, v, face):
-                            self.add_diagonal(current_vertex, v)
-                            self.dcel.plot_dcel(current_vertex_id=current_vertex.id, add_diagonal=True,
-                                                start=current_vertex, end=v)
-                    stack.append(top_vertex)
-                    stack.append(current_vertex)
-                else:
-                    second_top_vertex = stack[-2]
-                    self.dcel.plot_dcel(current_vertex_id=current_vertex.id, helper_vertex_id=second_top_vertex.id)
-                    if diagonal_exist(current_vertex, second_top_vertex, face):
-                        self.add_diagonal(current_vertex, second_top_vertex)
-                        self.dcel.plot_dcel(current_vertex_id=current_vertex.id, add_diagonal=True,
-                                            start=current_vertex, end=second_top_vertex)
-                        stack.pop()
-                    stack.append(current_vertex)
+            if top_vertex.chain_val != current_vertex.chain_val:
+                # Opposite chains: every vertex on the stack except the bottom one sees the current vertex
+                while len(stack) > 1:
+                    v = stack.pop()
+                    self.dcel.plot_dcel(current_vertex_id=current_vertex.id, helper_vertex_id=v.id)
+                    self.add_diagonal(current_vertex, v)
+                    self.dcel.plot_dcel(current_vertex_id=current_vertex.id, add_diagonal=True,
+                                        start=current_vertex, end=v)
+                stack.pop()
+                stack.append(vertices[i - 1])
+                stack.append(current_vertex)
             else:
-                second_vertex = stack.pop()
-                top_vertex = stack.pop()
-                self.dcel.plot_dcel(current_vertex_id=current_vertex.id, helper_vertex_id=second_vertex.id)
-                if second_vertex.chain_val != current_vertex.chain_val and diagonal_exist(current_vertex, second_vertex,
-                                                                                          face):
-                    self.add_diagonal(current_vertex, second_vertex)
-                    self.dcel.plot_dcel(current_vertex_id=current_vertex.id, add_diagonal=True, start=current_vertex,
-                                        end=second_vertex)
-                    stack.append(second_vertex)
-                    stack.append(current_vertex)
-                elif diagonal_exist(top_vertex, current_vertex, face):
-                    self.dcel.plot_dcel(current_vertex_id=current_vertex.id, helper_vertex_id=top_vertex.id)
-                    self.add_diagonal(top_vertex, current_vertex)
-                    self.dcel.plot_dcel(current_vertex_id=current_vertex.id, add_diagonal=True, start=top_vertex,
-                                        end=current_vertex)
-                    stack.append(top_vertex)
-                    stack.append(current_vertex)
-                else:
-                    stack.append(top_vertex)
-                    stack.append(second_vertex)
-                    stack.append(current_vertex)
+                # Same chain: the top vertex is a neighbour, connect to the vertices below it while the corner at the
+                # previous stack vertex is strictly convex, a collinear corner would put it on the diagonal
+                last_vertex = stack.pop()
+                while stack:
+                    self.dcel.plot_dcel(current_vertex_id=current_vertex.id, helper_vertex_id=stack[-1].id)
+                    if current_vertex.chain_val == left_chain:
+                        convex = turns_left(stack[-1].point, last_vertex.point, current_vertex.point)
+                    else:
+                        convex = turns_left(current_vertex.point, last_vertex.point, stack[-1].point)
+                    if not convex:
+                        break
+                    last_vertex = stack.pop()
+                    self.add_diagonal(current_vertex, last_vertex)
+                    self.dcel.plot_dcel(current_vertex_id=current_vertex.id, add_diagonal=True,
+                                        start=current_vertex, end=last_vertex)
+                stack.append(last_vertex)
+                stack.append(current_vertex)
+            yield current_vertex, len(stack)
 
         # Connect the last vertex to the rest of the stack except top & bottom
         for i in range(1, len(stack) - 1):
             self.dcel.plot_dcel(current_vertex_id=vertices[-1].id, helper_vertex_id=stack[i].id)
-            if diagonal_exist(vertices[-1], stack[i], face):
-                self.add_diagonal(vertices[-1], stack[i])
-                self.dcel.plot_dcel(current_vertex_id=vertices[-1].id, add_diagonal=True, start=vertices[-1],
-                                    end=stack[i])
+            self.add_diagonal(vertices[-1], stack[i])
+            self.dcel.plot_dcel(current_vertex_id=vertices[-1].id, add_diagonal=True, start=vertices[-1],
+                                end=stack[i])
+        yield vertices[-1], 0
+
+    def steps(self):
+        """
+        Perform the triangulation one event at a time. Every vertex of every monotone face yields the size of the stack
+        and the diagonals found. Then every diagonal added to the DCEL yields the number of faces. Closing the
+        generator before the diagonals are added adds no diagonal to the DCEL, but the chain values of the vertices of
+        the faces handled so far are changed. No step records images.
+        """
+        recording = self.dcel.record_images
+        for face in self.dcel.faces[1:]:
+            vertices = self.monotone_polygon_steps(face)
+            while True:
+                found = len(self.new_diagonals)
+                self.dcel.record_images = False
+                try:
+                    vertex, stack_size = next(vertices)
+                except StopIteration:
+                    break
+                finally:
+                    self.dcel.record_images = recording
+                yield {'event': 'triangulate', 'face': face.id, 'vertex': vertex.id, 'stack_size': stack_size,
+                       'diagonals': [(vertex1.id, vertex2.id) for vertex1, vertex2 in self.new_diagonals[found:]]}
+
+        for vertex1, vertex2 in self.new_diagonals:
+            self.add_diagonal_to_dcel(vertex1, vertex2)
+            yield {'event': 'add_diagonal', 'vertex1': vertex1.id, 'vertex2': vertex2.id,
+                   'faces': len(self.dcel.faces)}
 
+    @instrumentation.timed('triangulate')
     def triangulate(self):
         """
         Main triangulation method. Triangulates each monotone polygon stored as faces in the DCEL.
@@ -0,0 +1,96 @@
+# Group ID 14 (21114021 & 21114078) - Ashutosh Kumar and Raiwat Bapat
+# Date: October 19 2026
+# MultiPolygonTriangulation.py : Contains the triangulation of many disjoint polygons with a single sweep over all of their vertices.
+
+import time
+
+from DualGraph import DualGraph
+from MonotonePartitioner import MonotonePartitioner
+from MonotoneTriangulation import MonotoneTriangulation
+from elements.DCEL import DCEL
+from elements.Instrumentation import instrumentation
+from elements.Point import Point
+from elements.Vertex import Vertex
+
+
+class MultiPolygonTriangulation:
+    def __init__(self, polygons, holes=None):
+        """
+        Initialize the triangulation with disjoint polygons, given as counter-clockwise rings of (x, y) points, and
+        optionally the list of hole rings of every polygon. All polygons share one DCEL, in which polygon i starts as
+        face i + 1.
+        """
+        self.polygons = [list(polygon) for polygon in polygons]
+        self.holes = [[list(hole) for hole in polygon_holes] for polygon_holes in holes] if holes else None
+        self.dcel = None
+        self.owner = []  # Vertex ID -> index of its polygon
+        self.local = []  # Vertex ID -> index of its point in its polygon, the holes following the outer boundary
+
+    def build(self):
+        """ Build the shared DCEL and map every vertex back to its polygon and to its point there """
+        rings = []
+        for p, polygon in enumerate(self.polygons):
+            outer = [Vertex(Point(x, y)) for x, y in polygon]
+            holes = [[Vertex(Point(x, y)) for x, y in hole] for hole in self.holes[p]] if self.holes else []
+            rings.append((outer, holes))
+        self.dcel = DCEL.from_polygons([outer for outer, _ in rings], [holes for _, holes in rings],
+                                       record_images=False)
+
+        self.owner = [0] * len(self.dcel.vertices)
+        self.local = [0] * len(self.dcel.vertices)
+        for p, (outer, holes) in enumerate(rings):
+            # The input order, the holes may have been reversed in the DCEL
+            k = 0
+            for ring in [outer] + holes:
+                for vertex in ring:
+                    self.owner[vertex.id] = p
+                    self.local[vertex.id] = k
+                    k += 1
+        return self.dcel
+
+    @instrumentation.timed('multi_polygon_triangulation')
+    def triangulate(self):
+        """
+        Partition all polygons with one sweep over a single sorted event list, in which every polygon keeps its own
+        status tree, then triangulate the monotone pieces and build and three-color the dual graph, which has one
+        component per polygon.
+        Returns, for every polygon, its triangles as triples of point indices, the indices of its vertex guards and
+        the IDs of its faces, with the total number of triangles and the time taken in seconds.
+        """
+        start = time.perf_counter()
+        if self.dcel is None:
+            self.build()
+        MonotonePartitioner(self.dcel).perform_sweep_line_partition()
+        MonotoneTriangulation(self.dcel).triangulate()
+        dual_graph = DualGraph(self.dcel)
+        dual_graph.build_dual_graph()
+        dual_graph.three_coloring()
+        results = self.collect_results()
+
+        if instrumentation.enabled:
+            instrumentation.increment('multi_polygon_polygons', len(self.polygons))
+        return {'polygons': results, 'triangles': len(self.dcel.faces) - 1, 'seconds': time.perf_counter() - start}
+
+    def collect_results(self):
+        """ The triangles, the guards and the face IDs of every polygon, read from the triangulated and colored DCEL """
+        results = [{'triangles': [], 'guards': [], 'faces': []} for _ in self.polygons]
+        owner, local = self.owner, self.local
+        for face in self.dcel.faces[1:]:
+            edge = face.outer_component
+            a, b, c = edge.origin.id, edge.next.origin.id, edge.prev.origin.id
+            result = results[owner[a]]
+            result['triangles'].append((local[a], local[b], local[c]))
+            result['faces'].append(face.id)
+
+        # The smallest color class of every polygon guards it
+        color_counts = [[0, 0, 0] for _ in self.polygons]
+        for vertex in self.dcel.vertices:
+            color_counts[owner[vertex.id]][vertex.color] += 1
+        guard_colors = [counts.index(min(counts)) for counts in color_counts]
+        for vertex in self.dcel.vertices:
+            p = owner[vertex.id]
+            if vertex.color == guard_colors[p]:
+                results[p]['guards'].append(local[vertex.id])
+        for result in results:
+            result['guards'].sort()
+        return results
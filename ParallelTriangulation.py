@@ -0,0 +1,240 @@
+# Group ID 14 (21114021 & 21114078) - Ashutosh Kumar and Raiwat Bapat
+# Date: October 19 2026
+# ParallelTriangulation.py : Contains the Implementation of the triangulation of the monotone pieces of a partitioned polygon in a process pool.
+
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+
+from elements.DCEL import DCEL
+from elements.Face import Face
+from elements.HalfEdge import HalfEdge
+from elements.Instrumentation import instrumentation
+from elements.SharedTables import SharedTables
+
+BATCH_VERTICES = 20000  # Small pieces are sent to the workers together, in batches of about this many vertices
+
+
+def _cross(xs, ys, o, a, b):
+    return (xs[a] - xs[o]) * (ys[b] - ys[o]) - (ys[a] - ys[o]) * (xs[b] - xs[o])
+
+
+def _turns_left(xs, ys, o, a, b, epsilon=1e-12):
+    """ Strict counter-clockwise turn, a cross product within rounding of zero counts as collinear, as turns_left """
+    scale = (abs(xs[a] - xs[o]) + abs(ys[a] - ys[o])) * (abs(xs[b] - xs[o]) + abs(ys[b] - ys[o]))
+    return _cross(xs, ys, o, a, b) > epsilon * scale
+
+
+def triangulate_monotone_ring(xs, ys):
+    """
+    Triangulate a y-monotone polygon given by the coordinates of its vertices in counter-clockwise order, with the
+    stack algorithm in linear time after sorting. Returns the triangles as a flat array of counter-clockwise index
+    triples into the coordinates.
+    """
+    m = len(xs)
+    triangles = array('i')
+    if m == 3:
+        triangles.extend((0, 1, 2))
+        return triangles
+
+    # The vertices from the top vertex counter-clockwise down to the bottom vertex form the left chain
+    key = lambda i: (-ys[i], xs[i])
+    top, bottom = min(range(m), key=key), max(range(m), key=key)
+    on_left_chain = [False] * m
+    i = top
+    while i != bottom:
+        on_left_chain[i] = True
+        i = (i + 1) % m
+    order = sorted(range(m), key=key)
+
+    def add_triangle(a, b, c):
+        if _cross(xs, ys, a, b, c) > 0:
+            triangles.extend((a, b, c))
+        else:
+            triangles.extend((a, c, b))
+
+    stack = [order[0], order[1]]
+    for j in range(2, m - 1):
+        current = order[j]
+        if on_left_chain[current] != on_left_chain[stack[-1]]:
+            # Opposite chains: fan from the current vertex to the whole stack
+            for k in range(len(stack) - 1):
+                add_triangle(current, stack[k], stack[k + 1])
+            stack = [order[j - 1], current]
+        else:
+            # Same chain: cut off triangles while the corner at the top of the stack is strictly convex, a nearly
+            # collinear corner is treated as reflex
+            last = stack.pop()
+            while stack:
+                s = stack[-1]
+                if on_left_chain[current]:
+                    convex = _turns_left(xs, ys, s, last, current)
+                else:
+                    convex = _turns_left(xs, ys, current, last, s)
+                if not convex:
+                    break
+                add_triangle(current, last, s)
+                last = stack.pop()
+            stack.append(last)
+            stack.append(current)
+
+    current = order[m - 1]
+    for k in range(len(stack) - 1):
+        add_triangle(current, stack[k], stack[k + 1])
+    return triangles
+
+
+def _triangulate_batch(pieces):
+    """ Worker entry point, triangulates a list of (xs, ys) pieces """
+    return [triangulate_monotone_ring(xs, ys) for xs, ys in pieces]
+
+
+def _triangulate_shared(descriptor, first, last):
+    """
+    Worker entry point with shared memory, triangulates the pieces first to last - 1 of the shared tables and writes
+    their triangles in place. A piece of m vertices has m - 2 triangles, so the triangles of the pieces before it take
+    3 * (offset - 2 * piece) indices, where offset is the number of vertices of the pieces before it.
+    """
+    tables = SharedTables.attach(descriptor)
+    try:
+        xs, ys, triangles = tables.column('x'), tables.column('y'), tables.column('triangles')
+        offsets, pieces = tables.column('piece_offsets'), tables.column('pieces')
+        for piece in range(first, last):
+            vertices = pieces[offsets[piece]:offsets[piece + 1]].tolist()
+            result = triangulate_monotone_ring([xs[v] for v in vertices], [ys[v] for v in vertices])
+            position = 3 * (offsets[piece] - 2 * piece)
+            triangles[position:position + len(result)] = result
+    finally:
+        tables.close()
+
+
+class ParallelTriangulation:
+    def __init__(self, dcel: DCEL, processes=None, shared=False):
+        """
+        Initialize the triangulation with a DCEL whose inner faces are y-monotone polygons without holes, as left by
+        MonotonePartitioner. processes is the size of the process pool, by default the number of CPUs, with 1 every
+        piece is triangulated in this process. With shared=True the pieces and the triangles are handed to and from
+        the workers in shared memory instead of being pickled.
+        """
+        self.dcel = dcel
+        self.processes = processes or os.cpu_count() or 1
+        self.shared = shared
+
+    def extract_pieces(self):
+        """
+        Get the boundary half-edges of every face that is not yet a triangle, and the coordinates of its vertices.
+        """
+        faces = []
+        pieces = []
+        for face in self.dcel.faces[1:]:
+            if face.inner_component:
+                raise ValueError("The faces must not have holes, partition the polygon first.")
+            cycle = self.dcel.get_cycle(face.outer_component)
+            if len(cycle) == 3:
+                continue
+            faces.append(cycle)
+            pieces.append((array('d', (edge.origin.point.x for edge in cycle)),
+                           array('d', (edge.origin.point.y for edge in cycle))))
+        return faces, pieces
+
+    def batches(self, pieces):
+        """ Group the pieces into batches of about BATCH_VERTICES vertices, at least one batch per process """
+        total = sum(len(xs) for xs, _ in pieces)
+        limit = max(1, min(BATCH_VERTICES, total // self.processes + 1))
+        batches = [[]]
+        size = 0
+        for piece in pieces:
+            if size >= limit:
+                batches.append([])
+                size = 0
+            batches[-1].append(piece)
+            size += len(piece[0])
+        return batches
+
+    @instrumentation.timed('parallel_triangulation')
+    def triangulate(self):
+        """
+        Triangulate every monotone piece, in the process pool when there is more than one process, and merge the
+        triangles back into the DCEL in one pass.
+        """
+        faces, pieces = self.extract_pieces()
+        if not pieces:
+            return
+        batches = self.batches(pieces)
+        if self.processes == 1 or len(batches) == 1:
+            results = _triangulate_batch(pieces)
+        elif self.shared:
+            results = self.triangulate_shared(faces, batches)
+        else:
+            with ProcessPoolExecutor(max_workers=self.processes) as pool:
+                results = [triangles for batch in pool.map(_triangulate_batch, batches) for triangles in batch]
+
+        for cycle, triangles in zip(faces, results):
+            self.merge_piece(cycle, triangles)
+
+    def triangulate_shared(self, faces, batches):
+        """
+        Publish the coordinates of the vertices, the vertex IDs of every piece and a zero-filled column for the
+        triangles in one shared memory segment, which the workers fill in place. Only the descriptor of the segment
+        and the range of pieces of every batch are pickled. The segment is unlinked before returning.
+        Returns the triangles of every piece, as index triples into its cycle.
+        """
+        offsets = array('i', [0])
+        pieces = array('i')
+        for cycle in faces:
+            pieces.extend(edge.origin.id for edge in cycle)
+            offsets.append(len(pieces))
+        vertices = self.dcel.vertices
+        columns = {
+            'x': array('d', (vertex.point.x for vertex in vertices)),
+            'y': array('d', (vertex.point.y for vertex in vertices)),
+            'piece_offsets': offsets,
+            'pieces': pieces,
+            'triangles': ('i', 3 * (len(pieces) - 2 * len(faces))),
+        }
+        firsts, lasts = [], []
+        for batch in batches:
+            firsts.append(lasts[-1] if lasts else 0)
+            lasts.append(firsts[-1] + len(batch))
+
+        with SharedTables.create(columns) as tables:
+            with ProcessPoolExecutor(max_workers=self.processes) as pool:
+                list(pool.map(_triangulate_shared, repeat(tables.descriptor), firsts, lasts))
+            triangles = tables.copy('triangles')
+            if instrumentation.enabled:
+                instrumentation.increment('shared_memory_bytes', tables.size)
+        return [triangles[3 * (offsets[k] - 2 * k):3 * (offsets[k + 1] - 2 * k - 2)] for k in range(len(faces))]
+
+    def merge_piece(self, cycle, triangles):
+        """
+        Replace the face bounded by the given cycle of half-edges with the triangles, given as index triples into the
+        cycle. The boundary half-edges are reused, the first triangle keeps the face of the piece.
+        """
+        m = len(cycle)
+        face = cycle[0].incident_face
+        self.dcel.invalidate_faces(face)
+        diagonals = {}  # (i, j) -> half-edge from the vertex at index i to the vertex at index j
+
+        def half_edge(i, j):
+            if (i + 1) % m == j:
+                return cycle[i]
+            edge = diagonals.get((i, j))
+            if edge is None:
+                edge = self.dcel.add_half_edge(HalfEdge(origin=cycle[i].origin))
+                twin = self.dcel.add_half_edge(HalfEdge(origin=cycle[j].origin))
+                edge.twin, twin.twin = twin, edge
+                cycle[i].origin.incident_edge.append(edge)
+                cycle[j].origin.incident_edge.append(twin)
+                diagonals[(i, j)], diagonals[(j, i)] = edge, twin
+            return edge
+
+        for t in range(0, len(triangles), 3):
+            a, b, c = triangles[t], triangles[t + 1], triangles[t + 2]
+            edges = (half_edge(a, b), half_edge(b, c), half_edge(c, a))
+            triangle_face = face if t == 0 else self.dcel.add_face(Face())
+            triangle_face.outer_component = edges[0]
+            for k in range(3):
+                edges[k].next = edges[(k + 1) % 3]
+                edges[k].prev = edges[k - 1]
+                edges[k].incident_face = triangle_face
@@ -0,0 +1,255 @@
+# Group ID 14 (21114021 & 21114078) - Ashutosh Kumar and Raiwat Bapat
+# Date: October 19 2026
+# PolygonSimplifier.py : Contains the cleanup and simplification pass that runs on the vertex rings before the DCEL is built.
+
+import heapq
+import math
+from array import array
+
+from elements.Geometry import cross, on_segment, point_in_triangle
+from elements.Instrumentation import instrumentation
+
+METHODS = (None, 'douglas_peucker', 'visvalingam')
+
+
+def segment_distance(p, a, b):
+    """ Distance from the point p to the closed segment ab """
+    dx, dy = b.x - a.x, b.y - a.y
+    length = dx * dx + dy * dy
+    t = 0 if length == 0 else max(0, min(1, ((p.x - a.x) * dx + (p.y - a.y) * dy) / length))
+    return math.hypot(p.x - a.x - t * dx, p.y - a.y - t * dy)
+
+
+class PolygonSimplifier:
+    def __init__(self, vertices, holes=None, tolerance=0.0, method=None):
+        """
+        Initialize the pass with the vertices of the outer boundary and, optionally, the vertex rings of the holes, in
+        the form the DCEL is built from. method is None to only remove the duplicate and collinear vertices,
+        'douglas_peucker' to also remove the vertices closer than tolerance to the simplified boundary, or
+        'visvalingam' to also remove the vertices whose effective triangle has an area below tolerance.
+        """
+        if method not in METHODS:
+            raise ValueError(f"Unknown simplification method {method}, expected one of {METHODS}.")
+        self.rings = [list(vertices)] + [list(hole) for hole in holes or []]
+        self.tolerance = tolerance
+        self.method = method
+        self.source = {}  # Kept vertex -> (ring index, index in the input ring)
+        self.removed = {'duplicates': 0, 'collinear': 0, 'simplified': 0}
+
+        # The kept vertices of all rings, linked into their rings
+        self.vertices = []
+        self.ring_of = []
+        self.prev = []
+        self.next = []
+        self.alive = []
+        self.ring_sizes = []
+        self.grid = {}  # Cell -> indices of the alive vertices in it, only for the occupied cells
+        self.cell_size = 1.0
+        self.grid_size = 0  # Alive vertices when the grid was built
+        self.alive_count = 0
+
+    @instrumentation.timed('simplify')
+    def simplify(self):
+        """
+        Remove the duplicate consecutive vertices, then the collinear vertices and then, with a method, the vertices
+        that are not significant. A vertex is only removed when the triangle it forms with its neighbours contains no
+        other vertex of any ring, so the rings stay simple and do not touch each other.
+        Returns the vertices of the outer boundary, the vertex rings of the holes, for every ring the indices of the
+        kept vertices in the input ring, and the number of vertices removed at every step.
+        """
+        self.link_rings()
+        self.remove_collinear()
+        if self.method == 'visvalingam':
+            self.visvalingam()
+        elif self.method == 'douglas_peucker':
+            self.douglas_peucker()
+
+        rings, indices = [], []
+        for r in range(len(self.rings)):
+            ring = [self.vertices[i] for i in self.ring_order(r)]
+            rings.append(ring)
+            indices.append(array('i', (self.source[vertex][1] for vertex in ring)))
+        if instrumentation.enabled:
+            for step, count in self.removed.items():
+                instrumentation.increment(f'simplify_{step}_removed', count)
+        return {'vertices': rings[0], 'holes': rings[1:], 'indices': indices, **self.removed}
+
+    def original(self, vertex):
+        """ The (ring index, index in the input ring) of a kept vertex, also once it is part of the DCEL """
+        return self.source[vertex]
+
+    def link_rings(self):
+        """ Drop the consecutive duplicates of every ring and link the other vertices into their rings """
+        for r, ring in enumerate(self.rings):
+            kept = []
+            for i, vertex in enumerate(ring):
+                if kept and self.same_point(ring[kept[-1]], vertex):
+                    continue
+                kept.append(i)
+            while len(kept) > 1 and self.same_point(ring[kept[-1]], ring[kept[0]]):
+                kept.pop()
+            self.removed['duplicates'] += len(ring) - len(kept)
+            if len(kept) < 3:
+                raise ValueError("A polygon must have at least 3 vertices." if r == 0 else
+                                 "A hole must have at least 3 vertices.")
+
+            first = len(self.vertices)
+            m = len(kept)
+            for k, i in enumerate(kept):
+                self.source[ring[i]] = (r, i)
+                self.vertices.append(ring[i])
+                self.ring_of.append(r)
+                self.prev.append(first + (k - 1) % m)
+                self.next.append(first + (k + 1) % m)
+                self.alive.append(True)
+            self.ring_sizes.append(m)
+        self.build_grid()
+
+    def build_grid(self):
+        """
+        Bucket the alive vertices into square cells as large as the average edge, so a cell holds a few vertices
+        whether the boundary fills the plane or follows a curve. It is built again whenever half of the vertices
+        are gone, as the triangles grow with the edges.
+        """
+        alive = [i for i in range(len(self.vertices)) if self.alive[i]]
+        perimeter = sum(math.dist((self.vertices[i].point.x, self.vertices[i].point.y),
+                                  (self.vertices[self.next[i]].point.x, self.vertices[self.next[i]].point.y)) for i in alive)
+        self.cell_size = perimeter / len(alive) or 1.0
+        self.grid = {}
+        for i in alive:
+            point = self.vertices[i].point
+            self.grid.setdefault(self.cell(point.x, point.y), set()).add(i)
+        self.grid_size = len(alive)
+        self.alive_count = len(alive)
+
+    def same_point(self, vertex1, vertex2):
+        return vertex1.point.x == vertex2.point.x and vertex1.point.y == vertex2.point.y
+
+    def cell(self, x, y):
+        return int(math.floor(x / self.cell_size)), int(math.floor(y / self.cell_size))
+
+    def ring_order(self, r):
+        """ The indices of the alive vertices of a ring, in ring order """
+        start = next(i for i in range(len(self.vertices)) if self.ring_of[i] == r and self.alive[i])
+        order = [start]
+        i = self.next[start]
+        while i != start:
+            order.append(i)
+            i = self.next[i]
+        return order
+
+    def area(self, i):
+        """ Twice the area of the triangle of a vertex and its neighbours """
+        a, b, c = self.vertices[self.prev[i]].point, self.vertices[i].point, self.vertices[self.next[i]].point
+        return abs(cross(a, b, c))
+
+    def is_removable(self, i):
+        """
+        Checks if the vertex can be removed, i.e. its ring keeps a non-zero area and no other vertex lies in the
+        closed triangle of the vertex and its neighbours. An edge that crosses the new edge would have to cross one of
+        the two removed edges otherwise, so the rings stay simple.
+        """
+        p, n = self.prev[i], self.next[i]
+        size = self.ring_sizes[self.ring_of[i]]
+        if size <= 3:
+            return False
+        a, b, c = self.vertices[p].point, self.vertices[i].point, self.vertices[n].point
+        if size == 4 and cross(a, c, self.vertices[self.next[n]].point) == 0:
+            return False
+
+        orientation = cross(a, b, c)
+        low_x, low_y = self.cell(min(a.x, b.x, c.x), min(a.y, b.y, c.y))
+        high_x, high_y = self.cell(max(a.x, b.x, c.x), max(a.y, b.y, c.y))
+        if (high_x - low_x + 1) * (high_y - low_y + 1) <= len(self.grid):
+            cells = [self.grid.get((x, y), ()) for x in range(low_x, high_x + 1) for y in range(low_y, high_y + 1)]
+        else:
+            # A large triangle, only the occupied cells are visited
+            cells = [cell for (x, y), cell in self.grid.items() if low_x <= x <= high_x and low_y <= y <= high_y]
+
+        for cell in cells:
+            for j in cell:
+                if j == i or j == p or j == n:
+                    continue
+                q = self.vertices[j].point
+                if orientation > 0:
+                    inside = point_in_triangle(q, a, b, c)
+                elif orientation < 0:
+                    inside = point_in_triangle(q, a, c, b)
+                else:
+                    inside = on_segment(a, b, q) or on_segment(b, c, q)
+                if inside:
+                    return False
+        return True
+
+    def remove(self, i):
+        p, n = self.prev[i], self.next[i]
+        self.next[p], self.prev[n] = n, p
+        self.alive[i] = False
+        self.ring_sizes[self.ring_of[i]] -= 1
+        key = self.cell(self.vertices[i].point.x, self.vertices[i].point.y)
+        self.grid[key].discard(i)
+        if not self.grid[key]:
+            del self.grid[key]
+        self.alive_count -= 1
+        if self.alive_count * 2 < self.grid_size:
+            self.build_grid()
+
+    def remove_collinear(self):
+        """ Remove the vertices on the line through their neighbours, looking again at the neighbours of each one """
+        stack = list(range(len(self.vertices)))
+        while stack:
+            i = stack.pop()
+            if not self.alive[i] or self.area(i) != 0 or not self.is_removable(i):
+                continue
+            self.remove(i)
+            self.removed['collinear'] += 1
+            stack.extend((self.prev[i], self.next[i]))
+
+    def visvalingam(self):
+        """
+        Remove the vertex with the smallest effective area while it is below the tolerance. The area of a neighbour of
+        a removed vertex is never less than the area of the removed vertex, so the order follows the significance.
+        """
+        version = [0] * len(self.vertices)
+        heap = [(self.area(i) / 2, 0, i) for i in range(len(self.vertices)) if self.alive[i]]
+        heapq.heapify(heap)
+        while heap and heap[0][0] < self.tolerance:
+            area, v, i = heapq.heappop(heap)
+            if not self.alive[i] or v != version[i] or not self.is_removable(i):
+                continue  # A blocked vertex is queued again once one of its neighbours is removed
+            self.remove(i)
+            self.removed['simplified'] += 1
+            for j in (self.prev[i], self.next[i]):
+                version[j] += 1
+                heapq.heappush(heap, (max(self.area(j) / 2, area), version[j], j))
+
+    def douglas_peucker(self):
+        """
+        Rank the vertices of every ring by the distance at which the Douglas-Peucker recursion keeps them, and remove
+        the ones within the tolerance from the least significant up.
+        """
+        significance = {}
+        for r in range(len(self.rings)):
+            ring = self.ring_order(r)
+            m = len(ring)
+            points = [self.vertices[i].point for i in ring]
+            far = max(range(m), key=lambda k: math.hypot(points[k].x - points[0].x, points[k].y - points[0].y))
+            significance[ring[0]] = significance[ring[far]] = math.inf
+
+            stack = [(0, far, math.inf), (far, m, math.inf)]
+            while stack:
+                start, end, cap = stack.pop()
+                if end - start < 2:
+                    continue
+                a, b = points[start], points[end % m]
+                k = max(range(start + 1, end), key=lambda j: segment_distance(points[j], a, b))
+                significance[ring[k]] = min(cap, segment_distance(points[k], a, b))
+                stack.append((start, k, significance[ring[k]]))
+                stack.append((k, end, significance[ring[k]]))
+
+        for i in sorted(significance, key=significance.get):
+            if significance[i] > self.tolerance:
+                break
+            if self.is_removable(i):
+                self.remove(i)
+                self.removed['simplified'] += 1
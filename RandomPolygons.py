@@ -0,0 +1,117 @@
+# Group ID 14 (21114021 & 21114078) - Ashutosh Kumar and Raiwat Bapat
+# Date: October 19 2026
+# RandomPolygons.py : Contains the generators of large random simple polygons used for testing and benchmarking.
+
+import random
+
+
+def _cross(o, a, b):
+    return (a[0] - o[0]) * (b[1] - o[1]) - (a[1] - o[1]) * (b[0] - o[0])
+
+
+def space_partition_polygon(n, seed=None):
+    """
+    Generate a random simple polygon on n uniformly distributed points with the space partitioning method of Auer and
+    Held. The point set is split by a random line through a point of the set, and each half is joined by a chain that
+    stays on its side of the line, so the chains never cross. The expected running time is O(n log n).
+    Returns the vertices as (x, y) tuples in counter-clockwise order.
+    """
+    if n < 3:
+        raise ValueError("A polygon must have at least 3 vertices.")
+    rng = random.Random(seed)
+    points = [(rng.random(), rng.random()) for _ in range(n)]
+
+    a, b = points[0], points[1]
+    right = [p for p in points[2:] if _cross(a, b, p) < 0]
+    left = [p for p in points[2:] if _cross(a, b, p) >= 0]
+
+    polygon = [a]
+    # Each task either emits a vertex, or joins p to q through the points of S, all on one side of the line pq
+    tasks = [('chain', b, a, left), ('emit', b), ('chain', a, b, right)]
+    while tasks:
+        task = tasks.pop()
+        if task[0] == 'emit':
+            polygon.append(task[1])
+            continue
+        _, p, q, subset = task
+        if not subset:
+            continue
+        if len(subset) == 1:
+            polygon.append(subset[0])
+            continue
+
+        s = subset[rng.randrange(len(subset))]
+        u = rng.random()
+        t = (p[0] + u * (q[0] - p[0]), p[1] + u * (q[1] - p[1]))  # The splitting line goes through s and t on pq
+        p_side = _cross(s, t, p) > 0
+        near_p = []
+        near_q = []
+        for point in subset:
+            if point is s:
+                continue
+            if (_cross(s, t, point) > 0) == p_side:
+                near_p.append(point)
+            else:
+                near_q.append(point)
+        tasks.append(('chain', s, q, near_q))
+        tasks.append(('emit', s))
+        tasks.append(('chain', p, s, near_p))
+    return polygon
+
+
+def _profile(rng, k, valleys):
+    """
+    Heights in (0, 1) for a chain of k vertices with exactly the given number of strict local minima among its
+    interior vertices. The first and the last vertex are never minima.
+    """
+    if k == 0:
+        return []
+    available = (k - 2) - (valleys - 1)
+    if valleys > 0 and (available < valleys or k < 3):
+        raise ValueError("Too many split or merge vertices for the number of vertices.")
+    slots = sorted(rng.sample(range(available), valleys)) if valleys else []
+    minima = [slot + i + 1 for i, slot in enumerate(slots)]
+
+    heights = [0.0] * k
+    bounds = [-1] + minima + [k]
+    for start, end in zip(bounds, bounds[1:]):
+        # The vertices between two minima rise to a single peak and fall again
+        length = end - start - 1
+        if length <= 0:
+            continue
+        values = [rng.uniform(0.1, 1) for _ in range(length)]
+        top = max(values)
+        values.remove(top)
+        peak = rng.randrange(length)
+        rising = sorted(values[:peak]) + [top]
+        falling = sorted(values[peak:], reverse=True)
+        heights[start + 1:end] = rising + falling
+    for index in minima:
+        heights[index] = rng.uniform(0, 0.1)
+    return heights
+
+
+def split_merge_polygon(n, split_density=0.1, merge_density=0.1, seed=None):
+    """
+    Generate a random x-monotone simple polygon with round(split_density * n) split vertices and
+    round(merge_density * n) merge vertices. The split vertices are the local maxima of the lower chain and the merge
+    vertices the local minima of the upper chain, so each density can be at most about a quarter.
+    Returns the vertices as (x, y) tuples in counter-clockwise order.
+    """
+    if n < 4:
+        raise ValueError("A polygon with split and merge vertices must have at least 4 vertices.")
+    rng = random.Random(seed)
+    upper_count = (n - 2) // 2
+    lower_count = n - 2 - upper_count
+
+    # The lower chain lies below y = -1 and is flipped, so the minima of its heights are its local maxima (splits)
+    lower_heights = _profile(rng, lower_count, round(split_density * n))
+    upper_heights = _profile(rng, upper_count, round(merge_density * n))
+    lower_x = sorted(rng.uniform(0.001, 0.999) for _ in range(lower_count))
+    upper_x = sorted((rng.uniform(0.001, 0.999) for _ in range(upper_count)), reverse=True)
+
+    polygon = [(0.0, rng.uniform(-0.5, 0.5))]
+    polygon.extend((x, -1 - h) for x, h in zip(lower_x, lower_heights))
+    polygon.append((1.0, rng.uniform(-0.5, 0.5)))
+    polygon.extend((x, 1 + h) for x, h in zip(upper_x, upper_heights[::-1]))
+    return polygon
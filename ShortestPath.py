@@ -0,0 +1,187 @@
+# Group ID 14 (21114021 & 21114078) - Ashutosh Kumar and Raiwat Bapat
+# Date: October 19 2026
+# ShortestPath.py : Contains the Implementation of the shortest path queries inside a triangulated polygon with the dual tree and the funnel algorithm.
+
+import math
+
+from DualTreeIndex import DualTreeIndex
+from elements.DCEL import DCEL
+from elements.Geometry import cross, point_in_triangle
+from elements.Instrumentation import instrumentation
+
+
+def path_length(path):
+    """ Euclidean length of a path given as a list of points """
+    return sum(math.hypot(q.x - p.x, q.y - p.y) for p, q in zip(path, path[1:]))
+
+
+class ShortestPath:
+    def __init__(self, dcel: DCEL):
+        """
+        Initialize the query engine with a triangulated DCEL of a polygon without holes, so that its dual graph is a
+        tree. The tree, the LCA index and the point location grid are built once, on the first query.
+        """
+        self.dcel = dcel
+        self.index = DualTreeIndex(dcel)
+        self.parent = []  # Face ID -> parent face ID in the dual tree rooted at face 1, -1 for the root
+        self.parent_edge = []  # Face ID -> half-edge of the face whose twin lies in the parent face
+        self.depth = []
+        self.grid = {}  # (row, column) -> faces whose triangle meets the cell
+        self.origin = (0.0, 0.0)
+        self.cell_size = 1.0
+        self.prepared = False
+
+    @instrumentation.timed('shortest_path_prepare')
+    def prepare(self):
+        """ Root the dual tree, build the LCA index and bucket the triangles into a grid, in O(n log n) time """
+        for face in self.dcel.faces[1:]:
+            edge = face.outer_component
+            if face.inner_component or edge.next.next.next is not edge:
+                raise ValueError("The polygon must be triangulated first.")
+
+        self.index.build()
+        self.parent, self.parent_edge, self.depth = self.index.parent, self.index.parent_edge, self.index.depth
+        self.build_grid()
+        self.prepared = True
+
+    def build_grid(self):
+        """
+        Bucket every triangle into the square cells it meets, row by row, so a skinny triangle only fills the cells
+        along it. There are about as many cells as triangles.
+        """
+        points = [vertex.point for vertex in self.dcel.vertices]
+        min_x, min_y = min(p.x for p in points), min(p.y for p in points)
+        extent = max(max(p.x for p in points) - min_x, max(p.y for p in points) - min_y)
+        self.origin = (min_x, min_y)
+        self.cell_size = extent / math.sqrt(max(1, len(self.dcel.faces) - 1)) or 1.0
+        self.grid = {}
+
+        size = self.cell_size
+        grid = self.grid
+        for face in self.dcel.faces[1:]:
+            edge = face.outer_component
+            a, b, c = edge.origin.point, edge.next.origin.point, edge.prev.origin.point
+            low_y, high_y = min(a.y, b.y, c.y), max(a.y, b.y, c.y)
+            first_row, last_row = int((low_y - min_y) // size), int((high_y - min_y) // size)
+            for row in range(first_row, last_row + 1):
+                if first_row == last_row:
+                    low_x, high_x = min(a.x, b.x, c.x), max(a.x, b.x, c.x)
+                else:
+                    # The part of the triangle inside the row lies between its vertices and edge crossings there
+                    strip_low = max(low_y, min_y + row * size)
+                    strip_high = min(high_y, min_y + (row + 1) * size)
+                    xs = [p.x for p in (a, b, c) if strip_low <= p.y <= strip_high]
+                    for p, q in ((a, b), (b, c), (c, a)):
+                        if p.y != q.y:
+                            for y in (strip_low, strip_high):
+                                if (p.y <= y <= q.y) or (q.y <= y <= p.y):
+                                    xs.append(p.x + (q.x - p.x) * (y - p.y) / (q.y - p.y))
+                    low_x, high_x = min(xs), max(xs)
+                for column in range(int((low_x - min_x) // size), int((high_x - min_x) // size) + 1):
+                    cell = grid.get((row, column))
+                    if cell is None:
+                        grid[(row, column)] = [face]
+                    else:
+                        cell.append(face)
+
+    def cell(self, x, y):
+        return int((y - self.origin[1]) // self.cell_size), int((x - self.origin[0]) // self.cell_size)
+
+    def locate(self, point):
+        """ The triangle that contains the point, or None if it lies outside the polygon """
+        if not self.prepared:
+            self.prepare()
+        for face in self.grid.get(self.cell(point.x, point.y), ()):
+            edge = face.outer_component
+            if point_in_triangle(point, edge.origin.point, edge.next.origin.point, edge.prev.origin.point):
+                return face
+        return None
+
+    def lca(self, face1, face2):
+        """ The lowest common ancestor of two faces in the dual tree, by their IDs, in O(1) time """
+        return self.index.lca(face1, face2)
+
+    def sleeve(self, start_face, goal_face):
+        """
+        The diagonals crossed on the way from the start face to the goal face, as half-edges of the faces they are
+        crossed from, in order.
+        """
+        if not self.prepared:
+            self.prepare()
+        ancestor = self.lca(start_face.id, goal_face.id)
+        upward = []
+        face = start_face.id
+        while face != ancestor:
+            upward.append(self.parent_edge[face])
+            face = self.parent[face]
+        downward = []
+        face = goal_face.id
+        while face != ancestor:
+            downward.append(self.parent_edge[face].twin)
+            face = self.parent[face]
+        return upward + downward[::-1]
+
+    def shortest_path(self, start, goal):
+        """
+        The Euclidean shortest path between two points inside the polygon, as a list of points from the start to the
+        goal that bends only at vertices of the polygon. It takes time linear in the number of crossed diagonals once
+        the engine is prepared.
+        """
+        start_face, goal_face = self.locate(start), self.locate(goal)
+        if start_face is None or goal_face is None:
+            raise ValueError(f"The point {start if start_face is None else goal} lies outside the polygon.")
+        if self.index.component[start_face.id] != self.index.component[goal_face.id]:
+            raise ValueError(f"The points {start} and {goal} lie in different polygons.")
+        return self.funnel(start, goal, self.sleeve(start_face, goal_face))
+
+    @instrumentation.timed('shortest_paths')
+    def shortest_paths(self, queries):
+        """ The shortest paths of many (start, goal) pairs, sharing the dual tree, the LCA table and the grid """
+        if not self.prepared:
+            self.prepare()
+        return [self.shortest_path(start, goal) for start, goal in queries]
+
+    def funnel(self, start, goal, sleeve):
+        """
+        The funnel algorithm of Lee and Preparata. The left and right chains of the funnel grow outwards from the apex,
+        every new portal endpoint pops the chain on its side until it is convex again, and moves the apex along the
+        other chain when it crosses it.
+        """
+        path = [start]
+        left, right = [start], [start]
+        left_start = right_start = 0  # The apex is left[left_start] and right[right_start]
+
+        portals = [(edge.twin.origin.point, edge.origin.point) for edge in sleeve] + [(goal, goal)]
+        previous_left = previous_right = None
+        for left_point, right_point in portals:
+            if right_point is not previous_right:
+                while len(right) - right_start >= 2 and cross(right[-2], right[-1], right_point) >= 0:
+                    right.pop()
+                if len(right) - right_start == 1:
+                    moved = False
+                    while (len(left) - left_start >= 2
+                           and cross(left[left_start], left[left_start + 1], right_point) > 0):
+                        left_start += 1
+                        path.append(left[left_start])
+                        moved = True
+                    if moved:
+                        right, right_start = [left[left_start]], 0
+                right.append(right_point)
+            if left_point is not previous_left:
+                while len(left) - left_start >= 2 and cross(left[-2], left[-1], left_point) <= 0:
+                    left.pop()
+                if len(left) - left_start == 1:
+                    moved = False
+                    while (len(right) - right_start >= 2
+                           and cross(right[right_start], right[right_start + 1], left_point) < 0):
+                        right_start += 1
+                        path.append(right[right_start])
+                        moved = True
+                    if moved:
+                        left, left_start = [right[right_start]], 0
+                left.append(left_point)
+            previous_left, previous_right = left_point, right_point
+
+        if path[-1] is not goal:
+            path.append(goal)
+        return path
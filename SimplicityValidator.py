@@ -0,0 +1,178 @@
+# Group ID 14 (21114021 & 21114078) - Ashutosh Kumar and Raiwat Bapat
+# Date: October 19 2026
+# SimplicityValidator.py : Contains the Implementation of the Shamos-Hoey sweep that checks that a polygon is simple before it is triangulated.
+
+from MonotonePartitioner import is_above
+from elements.DCEL import signed_area
+from elements.Geometry import on_segment, segments_intersect
+from elements.StatusTree import StatusTree
+
+
+class Segment:
+    """ An edge of a boundary ring, from vertex index of the ring to the next vertex """
+
+    def __init__(self, ring, index, start, end):
+        self.ring = ring  # Index of the ring, 0 is the outer boundary and the holes follow
+        self.index = index  # Index of the edge in its ring
+        self.upper, self.lower = (start, end) if is_above(start, end) else (end, start)
+
+
+class SegmentStatusTree(StatusTree):
+    """
+    The sweep status of the validator. Edges that meet the sweep line at the same point are ordered as they are just
+    below it, and horizontal edges are clamped to the current event, so the order stays consistent at shared vertices.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.sweep_line_x = None  # The x-coordinate of the current event
+        self.nodes = {}  # Segment -> node that stores it
+
+    def get_x_intersection(self, segment):
+        upper, lower = segment.upper.point, segment.lower.point
+        if upper.y == lower.y:
+            return min(max(self.sweep_line_x, upper.x), lower.x)  # Horizontal edge, the upper vertex is its left end
+        return upper.x + (lower.x - upper.x) * (self.sweep_line_y - upper.y) / (lower.y - upper.y)
+
+    def direction_below(self, segment):
+        """ How far the edge moves to the right per unit the sweep line moves down """
+        upper, lower = segment.upper.point, segment.lower.point
+        if upper.y == lower.y:
+            return float('inf')
+        return (lower.x - upper.x) / (upper.y - lower.y)
+
+    def compare_edges(self, edge1, edge2):
+        result = super().compare_edges(edge1, edge2)
+        if result != 0:
+            return result
+        direction1, direction2 = self.direction_below(edge1), self.direction_below(edge2)
+        return (direction1 > direction2) - (direction1 < direction2)
+
+    def add(self, segment):
+        node = self.insert(segment)
+        self.nodes[segment] = node
+        return node
+
+    def remove(self, segment):
+        node = self.nodes.pop(segment)
+        if node.left and node.right:
+            # _delete_node moves the edge of the successor into this node
+            successor = self.successor(node)
+            self.nodes[successor.edge] = node
+        self._delete_node(node)
+
+
+class SimplicityValidator:
+    def __init__(self, vertices, holes=None):
+        """
+        Initialize the validator with the vertices of the outer boundary and, optionally, the vertex rings of the holes,
+        in the form the DCEL is built from.
+        """
+        self.rings = [list(vertices)] + [list(hole) for hole in holes or []]
+
+    def validate(self):
+        """
+        Check that the boundary rings are simple and do not touch each other in O(n log n) time.
+        Returns a dictionary with the orientation of the outer boundary, the first pair of equal vertices and the first
+        pair of intersecting edges found by the sweep. Vertices and edges are given as (ring index, index in the ring)
+        pairs, edge i of a ring joins vertex i to vertex i + 1.
+        """
+        for ring in self.rings:
+            if len(ring) < 3:
+                raise ValueError("A polygon must have at least 3 vertices.")
+
+        area = signed_area(self.rings[0])
+        result = {
+            'simple': True,
+            'orientation': 'counter-clockwise' if area > 0 else 'clockwise' if area < 0 else 'degenerate',
+            'duplicate_vertices': None,
+            'intersecting_edges': None,
+        }
+
+        seen = {}
+        for r, ring in enumerate(self.rings):
+            for i, vertex in enumerate(ring):
+                key = (vertex.point.x, vertex.point.y)
+                if key in seen:
+                    result['simple'] = False
+                    result['duplicate_vertices'] = (seen[key], (r, i))
+                    return result
+                seen[key] = (r, i)
+
+        intersection = self.sweep()
+        if intersection is not None:
+            result['simple'] = False
+            result['intersecting_edges'] = intersection
+        return result
+
+    def check(self):
+        """
+        Raise a ValueError that describes the problem if the polygon cannot be triangulated as given.
+        """
+        result = self.validate()
+        if result['duplicate_vertices'] is not None:
+            first, second = result['duplicate_vertices']
+            raise ValueError(f"The polygon is not simple, vertices {first} and {second} are equal.")
+        if result['intersecting_edges'] is not None:
+            first, second = result['intersecting_edges']
+            raise ValueError(f"The polygon is not simple, edges {first} and {second} intersect.")
+        if result['orientation'] != 'counter-clockwise':
+            raise ValueError("The outer boundary must be given in counter-clockwise order.")
+        return result
+
+    def sweep(self):
+        """
+        Sweep the vertices from top to bottom, in the order of the monotone partitioning sweep. Only edges that are
+        next to each other in the status tree are tested, which finds an intersection if there is one.
+        Returns the first pair of intersecting edges, or None.
+        """
+        events = []
+        for r, ring in enumerate(self.rings):
+            m = len(ring)
+            segments = [Segment(r, i, ring[i], ring[(i + 1) % m]) for i in range(m)]
+            for i, vertex in enumerate(ring):
+                events.append((vertex, segments[i - 1], segments[i]))
+        events.sort(key=lambda event: (-event[0].point.y, event[0].point.x))
+
+        status = SegmentStatusTree()
+        for vertex, *segments in events:
+            status.set_sweep_line_y(vertex.point.y)
+            status.sweep_line_x = vertex.point.x
+
+            # Remove the edges that end at the vertex, their neighbours become adjacent
+            for segment in segments:
+                if segment.lower is vertex:
+                    node = status.nodes[segment]
+                    left, right = status.predecessor(node), status.successor(node)
+                    status.remove(segment)
+                    if left and right and self.intersects(left.edge, right.edge):
+                        return self.edge_pair(left.edge, right.edge)
+
+            # Insert the edges that start at the vertex and test them against their neighbours
+            for segment in segments:
+                if segment.upper is vertex:
+                    node = status.add(segment)
+                    for neighbour in (status.predecessor(node), status.successor(node)):
+                        if neighbour and self.intersects(segment, neighbour.edge):
+                            return self.edge_pair(segment, neighbour.edge)
+        return None
+
+    def intersects(self, segment1, segment2):
+        """ Checks if two edges share a point other than the vertex that joins consecutive edges of a ring """
+        a, b = segment1.upper.point, segment1.lower.point
+        c, d = segment2.upper.point, segment2.lower.point
+        if segment1.ring == segment2.ring:
+            m = len(self.rings[segment1.ring])
+            if (segment1.index + 1) % m == segment2.index or (segment2.index + 1) % m == segment1.index:
+                # Consecutive edges meet at one vertex, they only intersect if they overlap
+                shared = {segment1.upper, segment1.lower} & {segment2.upper, segment2.lower}
+                if len(shared) == 2:
+                    return True  # A ring of two distinct vertices
+                vertex = shared.pop()
+                other1 = segment1.lower if segment1.upper is vertex else segment1.upper
+                other2 = segment2.lower if segment2.upper is vertex else segment2.upper
+                return on_segment(a, b, other2.point) or on_segment(c, d, other1.point)
+        return segments_intersect(a, b, c, d)
+
+    def edge_pair(self, segment1, segment2):
+        return tuple(sorted([(segment1.ring, segment1.index), (segment2.ring, segment2.index)]))
@@ -0,0 +1,47 @@
+# Group ID 14 (21114021 & 21114078) - Ashutosh Kumar and Raiwat Bapat
+# Date: October 19 2026
+# StepwiseEngine.py : Contains the helpers that advance the partition and triangulation a few events at a time.
+
+import asyncio
+from itertools import islice
+
+from MonotonePartitioner import MonotonePartitioner
+from MonotoneTriangulation import MonotoneTriangulation
+from elements.DCEL import DCEL
+
+
+def pipeline_steps(dcel: DCEL):
+    """
+    Partition the polygon into monotone pieces and triangulate them one event at a time. Every event of the steps of
+    MonotonePartitioner and MonotoneTriangulation is yielded with the stage it belongs to.
+    """
+    for event in MonotonePartitioner(dcel).steps():
+        event['stage'] = 'partition'
+        yield event
+    for event in MonotoneTriangulation(dcel).steps():
+        event['stage'] = 'triangulate'
+        yield event
+
+
+def advance(steps, count):
+    """ The next events of a step generator, at most count of them, an empty list once it is done """
+    return list(islice(steps, count))
+
+
+async def run_steps(steps, events_per_frame=100, on_event=None):
+    """
+    Run a step generator to the end from asyncio, handing every event to on_event and giving the event loop a turn
+    after every events_per_frame events. Cancelling the task closes the generator at the next turn.
+    Returns the number of events.
+    """
+    count = 0
+    try:
+        for event in steps:
+            if on_event is not None:
+                on_event(event)
+            count += 1
+            if count % events_per_frame == 0:
+                await asyncio.sleep(0)
+    finally:
+        steps.close()
+    return count
@@ -0,0 +1,139 @@
+# Group ID 14 (21114021 & 21114078) - Ashutosh Kumar and Raiwat Bapat
+# Date: October 19 2026
+# SweepDirection.py : Contains the choice of the sweep direction with the fewest split and merge vertices for the monotone partitioning.
+
+import math
+
+from MonotonePartitioner import MonotonePartitioner, is_left_turn
+from MonotoneTriangulation import MonotoneTriangulation
+from elements.DCEL import DCEL
+from elements.Instrumentation import instrumentation
+from elements.Point import Point
+
+DEFAULT_ANGLE = math.pi / 2  # Sweeping from the top down, as MonotonePartitioner does
+MIN_RANGE = 1e-9  # Narrower ranges of angles come from rounding the endpoints of parallel edges and are skipped
+
+
+def rotate(point, angle):
+    """ Rotate a point about the origin so that the direction of the given angle points up """
+    turn = DEFAULT_ANGLE - angle
+    cos, sin = math.cos(turn), math.sin(turn)
+    return Point(point.x * cos - point.y * sin, point.x * sin + point.y * cos)
+
+
+class SweepDirection:
+    def __init__(self, dcel: DCEL):
+        """
+        Initialize the search with a DCEL that has not been partitioned yet. A direction is given by its angle, the
+        sweep line is perpendicular to it and moves against it, so pi / 2 is the usual sweep from the top down.
+        """
+        self.dcel = dcel
+
+    def neighbours(self, vertex):
+        """ The previous and next vertices along the boundary ring of a vertex, as classify_vertices takes them """
+        edge = vertex.incident_edge[0]
+        return edge.prev.origin, edge.next.origin
+
+    def turn_intervals(self):
+        """
+        The directions in which every reflex vertex is a split or a merge vertex, as open intervals of angles in
+        [0, pi). A reflex vertex is one when both of its neighbours lie on the same side of the sweep line, i.e. when
+        the direction is within pi / 2 of both edges leaving it. The opposite direction gives the same vertices, with
+        split and merge swapped.
+        """
+        intervals = []
+        for vertex in self.dcel.vertices:
+            prev, next_vertex = self.neighbours(vertex)
+            if is_left_turn(prev, vertex, next_vertex):
+                continue  # Convex corners are start, end or regular vertices
+            p, v, q = prev.point, vertex.point, next_vertex.point
+            angle1 = math.atan2(p.y - v.y, p.x - v.x)
+            angle2 = math.atan2(q.y - v.y, q.x - v.x)
+            between = (angle2 - angle1) % (2 * math.pi)
+            if between > math.pi:
+                angle1, between = angle2, 2 * math.pi - between
+            half_width = (math.pi - between) / 2
+            if half_width <= 0:
+                continue
+            middle = angle1 + between / 2
+            intervals.append(((middle - half_width) % math.pi, (middle + half_width) % math.pi))
+        return intervals
+
+    @instrumentation.timed('sweep_direction')
+    def best_angle(self):
+        """
+        The direction with the fewest split and merge vertices, found exactly by sweeping over the endpoints of the
+        turn intervals in O(n log n) time. Returns the middle of the best range of angles and its number of split and
+        merge vertices.
+        """
+        intervals = self.turn_intervals()
+        events = []
+        count = 0
+        for start, end in intervals:
+            events.append((start, 1))
+            events.append((end, -1))
+            if start > end:
+                count += 1  # The interval wraps around and covers the angles just above 0
+        events.sort()
+
+        # Between two consecutive endpoints the count does not change, every wide enough range is tried at its middle
+        best_count, best_angle = None, DEFAULT_ANGLE
+        previous = 0.0
+        for position, change in events + [(math.pi, 0)]:
+            if position - previous > MIN_RANGE and (best_count is None or count < best_count):
+                best_count, best_angle = count, (previous + position) / 2
+            count += change
+            previous = position
+        return best_angle, best_count or 0
+
+    def count_turn_vertices(self, angle):
+        """ The number of split and merge vertices when sweeping in the given direction """
+        points = {vertex: rotate(vertex.point, angle) for vertex in self.dcel.vertices}
+
+        def above(vertex1, vertex2):
+            p, q = points[vertex1], points[vertex2]
+            return p.y > q.y or (p.y == q.y and p.x < q.x)
+
+        counts = {'split': 0, 'merge': 0}
+        for vertex in self.dcel.vertices:
+            prev, next_vertex = self.neighbours(vertex)
+            if is_left_turn(prev, vertex, next_vertex):
+                continue
+            if above(vertex, prev) and above(vertex, next_vertex):
+                counts['split'] += 1
+            elif above(prev, vertex) and above(next_vertex, vertex):
+                counts['merge'] += 1
+        return counts
+
+    def partition(self, triangulate=False):
+        """
+        Partition the polygon into monotone pieces, and triangulate them if asked, with the sweep in the best direction.
+        The vertices are rotated into the frame of that direction for the algorithms and get their own points back
+        afterwards, the diagonals do not depend on the frame.
+        Returns the chosen angle, the split and merge vertices of the default and of the chosen direction, the saved
+        events and the number of diagonals of the partition.
+        """
+        baseline = self.count_turn_vertices(DEFAULT_ANGLE)
+        angle, _ = self.best_angle()
+        chosen = self.count_turn_vertices(angle)
+        if sum(chosen.values()) >= sum(baseline.values()):
+            angle, chosen = DEFAULT_ANGLE, baseline
+
+        original = [vertex.point for vertex in self.dcel.vertices]
+        if angle != DEFAULT_ANGLE:
+            for vertex in self.dcel.vertices:
+                vertex.point = rotate(vertex.point, angle)
+        try:
+            partitioner = MonotonePartitioner(self.dcel)
+            partitioner.perform_sweep_line_partition()
+            if triangulate:
+                MonotoneTriangulation(self.dcel).triangulate()
+        finally:
+            for vertex, point in zip(self.dcel.vertices, original):
+                vertex.point = point
+
+        saved = sum(baseline.values()) - sum(chosen.values())
+        if instrumentation.enabled:
+            instrumentation.increment('sweep_direction_events_saved', saved)
+        return {'angle': angle, 'baseline': baseline, 'chosen': chosen, 'events_saved': saved,
+                'diagonals': len(partitioner.new_diagonals), 'baseline_diagonals_at_most': sum(baseline.values())}
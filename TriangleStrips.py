@@ -0,0 +1,219 @@
+# Group ID 14 (21114021 & 21114078) - Ashutosh Kumar and Raiwat Bapat
+# Date: October 19 2026
+# TriangleStrips.py : Contains the Implementation of the greedy conversion of a triangulated polygon into triangle strips and fans for rendering.
+
+import time
+from array import array
+
+from elements.DCEL import DCEL
+from elements.Instrumentation import instrumentation
+
+
+def strip_triangles(strip):
+    """
+    The triangles of a strip as a renderer draws them, every other one with its first two indices swapped so that all
+    of them keep the winding of the first. Degenerate triangles, which stitch strips together, are skipped.
+    """
+    triangles = []
+    for i in range(len(strip) - 2):
+        a, b, c = strip[i], strip[i + 1], strip[i + 2]
+        if a == b or b == c or a == c:
+            continue
+        triangles.append((b, a, c) if i % 2 else (a, b, c))
+    return triangles
+
+
+def fan_triangles(fan):
+    """ The triangles of a fan, every one joins the first index to two consecutive other indices """
+    return [(fan[0], fan[i], fan[i + 1]) for i in range(1, len(fan) - 1)]
+
+
+class TriangleStrips:
+    def __init__(self, dcel: DCEL):
+        """
+        Initialize the conversion with a triangulated DCEL. The walk moves between triangles across their shared
+        diagonals, which are the edges of the dual graph. Indices are vertex IDs, every triangle keeps its
+        counter-clockwise winding.
+        """
+        self.dcel = dcel
+
+    def neighbour(self, edge):
+        """ The triangle on the other side of a half-edge, or None on the boundary """
+        face = edge.twin.incident_face
+        return None if face is self.dcel.faces[0] else face
+
+    def strips(self):
+        """
+        Cover the triangles with strips, greedily. Every strip starts from an unused triangle with the fewest unused
+        neighbours, so that the leaves of the dual tree start strips instead of ending them, and continues across the
+        edge of its last two indices. When that triangle is used but the one across the other free edge is not, the
+        strip turns with a swap, which costs one repeated index.
+        Returns the strips as arrays of vertex IDs.
+        """
+        faces = self.dcel.faces
+        used = bytearray(len(faces))
+        used[0] = 1
+        degree = [0] * len(faces)
+        buckets = [[], [], [], []]  # Unused triangles by their number of unused neighbours, updated lazily
+        for face in faces[1:]:
+            edge = face.outer_component
+            degree[face.id] = sum(1 for e in (edge, edge.next, edge.prev) if self.neighbour(e) is not None)
+            buckets[degree[face.id]].append(face)
+
+        def take(face):
+            used[face.id] = 1
+            edge = face.outer_component
+            for e in (edge, edge.next, edge.prev):
+                other = self.neighbour(e)
+                if other is not None and not used[other.id]:
+                    degree[other.id] -= 1
+                    buckets[degree[other.id]].append(other)
+
+        def free(face):
+            return face is not None and not used[face.id]
+
+        strips = []
+        while True:
+            start = None
+            for count, bucket in enumerate(buckets):
+                while bucket:
+                    face = bucket.pop()
+                    if not used[face.id] and degree[face.id] == count:
+                        start = face
+                        break
+                if start is not None:
+                    break
+            if start is None:
+                break
+
+            # Leave the first triangle across the edge to the unused neighbour with the fewest unused neighbours
+            edge = start.outer_component
+            exits = [e for e in (edge, edge.next, edge.prev) if free(self.neighbour(e))]
+            exit_edge = min(exits, key=lambda e: degree[self.neighbour(e).id]) if exits else edge
+            # The strip (a, b, c) ends with the exit edge b -> c
+            strip = [exit_edge.prev.origin.id, exit_edge.origin.id, exit_edge.next.origin.id]
+            take(start)
+
+            while True:
+                across = self.neighbour(exit_edge)
+                if not free(across):
+                    # Turn across the other edge of the last triangle at its last index, the one that avoids b
+                    other = exit_edge.next if exit_edge.origin.id == strip[-2] else exit_edge.prev
+                    if not free(self.neighbour(other)):
+                        break
+                    strip.insert(len(strip) - 1, strip[-3])  # The swap, the last edge becomes (a, c)
+                    exit_edge = other
+                    across = self.neighbour(other)
+                entry = exit_edge.twin
+                strip.append(entry.prev.origin.id)
+                take(across)
+                # The next exit edge joins the last two indices of the strip
+                exit_edge = entry.next if entry.next.origin.id == strip[-2] else entry.prev
+            strips.append(array('i', strip))
+
+        if instrumentation.enabled:
+            instrumentation.increment('triangle_strips', len(strips))
+        return strips
+
+    def fans(self):
+        """
+        Cover the triangles with fans, greedily. The vertices with the most diagonals go first and take every run of
+        consecutive unused triangles around them that holds at least two triangles, the remaining triangles become
+        fans of one triangle.
+        Returns the fans as arrays of vertex IDs, the centre of every fan first.
+        """
+        faces = self.dcel.faces
+        used = bytearray(len(faces))
+        fans = []
+        for vertex in sorted(self.dcel.vertices, key=lambda v: len(v.incident_edge), reverse=True):
+            if len(vertex.incident_edge) < 2:
+                continue
+            # Walk around the vertex counter-clockwise from its boundary edge, across its diagonals
+            edge = vertex.incident_edge[0]
+            run = []
+            while True:
+                face = edge.incident_face
+                if used[face.id]:
+                    self._close_fan(vertex, run, fans, used)
+                    run = []
+                else:
+                    run.append(edge)
+                edge = edge.prev.twin
+                if edge.incident_face is faces[0]:
+                    break
+            self._close_fan(vertex, run, fans, used)
+
+        for face in faces[1:]:
+            if not used[face.id]:
+                edge = face.outer_component
+                fans.append(array('i', [edge.origin.id, edge.next.origin.id, edge.prev.origin.id]))
+                used[face.id] = 1
+
+        if instrumentation.enabled:
+            instrumentation.increment('triangle_fans', len(fans))
+        return fans
+
+    def _close_fan(self, vertex, run, fans, used):
+        """ Turn a run of consecutive triangles around a vertex into a fan, if it holds at least two of them """
+        if len(run) < 2:
+            return
+        fan = array('i', [vertex.id, run[0].twin.origin.id])
+        for edge in run:
+            fan.append(edge.prev.origin.id)
+            used[edge.incident_face.id] = 1
+        fans.append(fan)
+
+    def stitch(self, strips):
+        """
+        Join strips into one strip with degenerate triangles, which renderers skip: the last index of a strip and the
+        first of the next are repeated, and one more when the next strip would start with the wrong winding.
+        """
+        stitched = array('i')
+        for strip in strips:
+            if stitched:
+                stitched.append(stitched[-1])
+                if len(stitched) % 2 == 0:
+                    stitched.append(stitched[-1])
+                stitched.append(strip[0])
+            stitched.extend(strip)
+        return stitched
+
+    def to_arrays(self, pieces):
+        """
+        Export strips or fans in compact form, their indices one after another and the offsets where each one starts
+        (with the total length at the end).
+        """
+        offsets = array('i', [0])
+        indices = array('i')
+        for piece in pieces:
+            indices.extend(piece)
+            offsets.append(len(indices))
+        return offsets, indices
+
+    @instrumentation.timed('stripify')
+    def stripify(self, kind='strip'):
+        """
+        Convert the triangles into strips, with kind='strip', or fans, with kind='fan'.
+        Returns the offsets and indices of the pieces, the number of pieces, the number of indices against the three
+        per triangle of a list of independent triangles, the indices per triangle, the length of the strips stitched
+        into one and the time taken in seconds.
+        """
+        if kind not in ('strip', 'fan'):
+            raise ValueError(f"Unknown kind {kind}, expected 'strip' or 'fan'.")
+        start = time.perf_counter()
+        pieces = self.strips() if kind == 'strip' else self.fans()
+        offsets, indices = self.to_arrays(pieces)
+        triangles = len(self.dcel.faces) - 1
+        result = {
+            'kind': kind,
+            'offsets': offsets,
+            'indices': indices,
+            'pieces': len(pieces),
+            'index_count': len(indices),
+            'triangle_list_index_count': 3 * triangles,
+            'indices_per_triangle': len(indices) / triangles if triangles else 0.0,
+        }
+        if kind == 'strip':
+            result['stitched_index_count'] = len(self.stitch(pieces))
+        result['seconds'] = time.perf_counter() - start
+        return result
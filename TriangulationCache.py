@@ -0,0 +1,256 @@
+# Group ID 14 (21114021 & 21114078) - Ashutosh Kumar and Raiwat Bapat
+# Date: October 19 2026
+# TriangulationCache.py : Contains the Implementation of a content-addressed cache in front of the triangulation pipeline.
+
+import hashlib
+import math
+import os
+import struct
+from array import array
+from collections import OrderedDict
+
+from DualGraph import DualGraph
+from FastTriangulation import FastTriangulation
+from TriangulationValidator import TriangulationValidator
+from elements.DCEL import DCEL
+from elements.Geometry import polygon_area
+from elements.Point import Point
+from elements.Vertex import Vertex
+
+# Normalized coordinates are rounded to multiples of 1 / QUANTUM before hashing. The step is far above the rounding
+# error of translating and scaling a ring, so the copies of a ring hash to the same key, and rings that differ by less
+# than about a millionth of their size share an entry, which is checked against the ring on every hit
+QUANTUM = 2 ** 20
+ENTRY_OVERHEAD = 256  # Approximate size in bytes of the bookkeeping of one cache entry
+FILE_HEADER = struct.Struct('<4sIII')  # Magic, number of vertices, triangle index count, guard count
+FILE_MAGIC = b'TRI1'
+
+
+def triangulate_points(points):
+    """
+    Run the complete pipeline on a ring of (x, y) points. A clockwise ring is triangulated in reverse and the indices
+    are mapped back, a ring without area raises a ValueError.
+    Returns the triangles as counter-clockwise triples of point indices and the indices of the vertex guards. A
+    triangulation that does not pass the TriangulationValidator raises a ValueError and is never cached.
+    """
+    n = len(points)
+    area = polygon_area([Point(x, y) for x, y in points]) if n >= 3 else 0
+    if area == 0:
+        raise ValueError("The ring must have at least 3 points and a non-zero area.")
+    if area < 0:
+        triangles, guards = triangulate_points(points[::-1])
+        return ([tuple(n - 1 - index for index in triangle) for triangle in triangles],
+                sorted(n - 1 - index for index in guards))
+
+    dcel = DCEL(vertices=[Vertex(Point(x, y)) for x, y in points], record_images=False)
+    FastTriangulation(dcel).triangulate()
+    TriangulationValidator(dcel).check()
+    dual_graph = DualGraph(dcel)
+    dual_graph.build_dual_graph()
+    dual_graph.three_coloring()
+
+    # Vertex IDs are the indices of the points
+    triangles = [tuple(vertex.id for vertex in dcel.get_vertices_of_face(face)) for face in dcel.faces[1:]]
+    color_count = {0: 0, 1: 0, 2: 0}
+    for vertex in dcel.vertices:
+        color_count[vertex.color] += 1
+    guard_color = min(color_count, key=color_count.get)
+    guards = [vertex.id for vertex in dcel.vertices if vertex.color == guard_color]
+    return triangles, guards
+
+
+def fits_ring(points, triangles):
+    """
+    Checks in O(n) time that triangles of point indices fit a ring of (x, y) points: every triangle is
+    counter-clockwise and their areas add up to the area of the ring.
+    """
+    total = 0
+    for a, b, c in triangles:
+        (ax, ay), (bx, by), (cx, cy) = points[a], points[b], points[c]
+        doubled = (bx - ax) * (cy - ay) - (by - ay) * (cx - ax)
+        if doubled <= 0:
+            return False
+        total += doubled
+    ring = abs(polygon_area([Point(x, y) for x, y in points]))
+    return math.isclose(total / 2, ring, rel_tol=1e-9)
+
+
+def least_rotation(sequence):
+    """ Booth's algorithm, returns the start index of the lexicographically smallest rotation of the sequence """
+    doubled = sequence + sequence
+    failure = [-1] * len(doubled)
+    k = 0
+    for j in range(1, len(doubled)):
+        item = doubled[j]
+        i = failure[j - k - 1]
+        while i != -1 and item != doubled[k + i + 1]:
+            if item < doubled[k + i + 1]:
+                k = j - i - 1
+            i = failure[i]
+        if item != doubled[k + i + 1]:
+            if item < doubled[k]:
+                k = j
+            failure[j - k] = -1
+        else:
+            failure[j - k] = i + 1
+    return k
+
+
+def canonicalize(points):
+    """
+    Bring a ring of points into a canonical form that does not depend on the starting vertex, on translation or on
+    uniform scaling. Returns the hash key of the canonical ring and the offset of the canonical starting vertex.
+    """
+    n = len(points)
+    centroid_x = sum(x for x, _ in points) / n
+    centroid_y = sum(y for _, y in points) / n
+    scale = max(max(abs(x - centroid_x), abs(y - centroid_y)) for x, y in points) or 1
+    quantized = [(round((x - centroid_x) / scale * QUANTUM), round((y - centroid_y) / scale * QUANTUM))
+                 for x, y in points]
+
+    offset = least_rotation(quantized)
+    canonical = quantized[offset:] + quantized[:offset]
+    digest = hashlib.sha256()
+    digest.update(struct.pack('<I', n))
+    for x, y in canonical:
+        digest.update(struct.pack('<qq', x, y))
+    return digest.hexdigest(), offset
+
+
+class TriangulationCache:
+    def __init__(self, max_bytes=64 * 1024 * 1024, directory=None):
+        """
+        Initialize the cache with a memory ceiling in bytes and, optionally, a directory for the on-disk store.
+        Results are kept in canonical vertex order so that rotated, translated and scaled copies of a ring share an
+        entry. Entries are evicted from memory in least recently used order, the disk store keeps every result.
+        """
+        self.max_bytes = max_bytes
+        self.directory = directory
+        self.entries = OrderedDict()  # Hash key -> (triangle indices, guard indices) in canonical order
+        self.current_bytes = 0
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.rejected_hits = 0
+        self.evictions = 0
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+
+    def triangulate(self, points):
+        """
+        Get the triangles and the guards of a ring of (x, y) points, running the pipeline only on a cache miss.
+        A cached entry is only used if its triangles fit the ring, an entry of a slightly different ring with the same
+        key is rejected and the ring is triangulated without replacing it.
+        Returns the triangles as triples of point indices and the indices of the vertex guards.
+        """
+        points = list(points)
+        n = len(points)
+        key, offset = canonicalize(points)
+
+        entry = self.entries.get(key)
+        in_memory = entry is not None
+        if not in_memory:
+            entry = self._load(key, n)
+        if entry is not None:
+            triangles, guards = self._map(entry, offset, n)
+            if fits_ring(points, triangles):
+                if in_memory:
+                    self.entries.move_to_end(key)
+                    self.memory_hits += 1
+                else:
+                    self.disk_hits += 1
+                    self._insert(key, entry)
+                return triangles, guards
+            self.rejected_hits += 1
+
+        self.misses += 1
+        triangles, guards = triangulate_points(points)
+        if entry is None:
+            # Store the indices relative to the canonical starting vertex
+            entry = (array('i', [(index - offset) % n for triangle in triangles for index in triangle]),
+                     array('i', [(index - offset) % n for index in guards]))
+            self._store(key, n, entry)
+            self._insert(key, entry)
+            return self._map(entry, offset, n)
+        return triangles, guards
+
+    def stats(self):
+        """
+        Get the hit, miss and eviction counters and the memory usage of the cache.
+        """
+        return {
+            'memory_hits': self.memory_hits,
+            'disk_hits': self.disk_hits,
+            'misses': self.misses,
+            'rejected_hits': self.rejected_hits,
+            'evictions': self.evictions,
+            'entries': len(self.entries),
+            'bytes': self.current_bytes,
+            'max_bytes': self.max_bytes,
+        }
+
+    def clear(self):
+        """
+        Drop every entry from memory, the disk store is kept.
+        """
+        self.entries.clear()
+        self.current_bytes = 0
+
+    def _map(self, entry, offset, n):
+        """ The triangles and the guards of an entry as indices into a ring of n points that starts offset later """
+        triangle_indices, guard_indices = entry
+        mapped = [(index + offset) % n for index in triangle_indices]
+        triangles = [tuple(mapped[i:i + 3]) for i in range(0, len(mapped), 3)]
+        guards = [(index + offset) % n for index in guard_indices]
+        return triangles, guards
+
+    def _entry_size(self, entry):
+        """ Approximate memory used by an entry """
+        triangle_indices, guard_indices = entry
+        return ENTRY_OVERHEAD + triangle_indices.itemsize * (len(triangle_indices) + len(guard_indices))
+
+    def _insert(self, key, entry):
+        """ Add an entry to the in-memory tier and evict least recently used entries above the memory ceiling """
+        size = self._entry_size(entry)
+        if size > self.max_bytes:
+            return  # Larger than the whole cache, only the disk store keeps it
+        self.entries[key] = entry
+        self.current_bytes += size
+        while self.current_bytes > self.max_bytes:
+            _, evicted = self.entries.popitem(last=False)
+            self.current_bytes -= self._entry_size(evicted)
+            self.evictions += 1
+
+    def _path(self, key):
+        return os.path.join(self.directory, key[:2], key + '.tri')
+
+    def _store(self, key, n, entry):
+        """ Write an entry to the disk store, the file is replaced atomically """
+        if self.directory is None:
+            return
+        triangle_indices, guard_indices = entry
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        temporary_path = f"{path}.{os.getpid()}.tmp"
+        with open(temporary_path, 'wb') as file:
+            file.write(FILE_HEADER.pack(FILE_MAGIC, n, len(triangle_indices), len(guard_indices)))
+            triangle_indices.tofile(file)
+            guard_indices.tofile(file)
+        os.replace(temporary_path, path)
+
+    def _load(self, key, n):
+        """ Read an entry from the disk store, returns None if it is missing or does not match """
+        if self.directory is None:
+            return None
+        try:
+            with open(self._path(key), 'rb') as file:
+                magic, stored_n, triangle_count, guard_count = FILE_HEADER.unpack(file.read(FILE_HEADER.size))
+                if magic != FILE_MAGIC or stored_n != n:
+                    return None
+                triangle_indices = array('i')
+                triangle_indices.fromfile(file, triangle_count)
+                guard_indices = array('i')
+                guard_indices.fromfile(file, guard_count)
+        except (OSError, EOFError, struct.error):
+            return None
+        return triangle_indices, guard_indices
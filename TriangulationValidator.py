@@ -0,0 +1,209 @@
+# Group ID 14 (21114021 & 21114078) - Ashutosh Kumar and Raiwat Bapat
+# Date: October 19 2026
+# TriangulationValidator.py : Contains the checks that a triangulated DCEL is consistent before its triangles are used.
+
+import time
+
+from SimplicityValidator import Segment, SegmentStatusTree
+from elements.DCEL import DCEL
+from elements.Geometry import cross, on_segment, segments_intersect
+from elements.Instrumentation import instrumentation
+
+
+class TriangulationViolation(Exception):
+    """ Raised inside the validator by the first failed check, carries the name of the check """
+
+    def __init__(self, check, message):
+        super().__init__(message)
+        self.check = check
+
+
+class TriangulationValidator:
+    def __init__(self, dcel: DCEL, tolerance=1e-9):
+        """
+        Initialize the validator with a triangulated DCEL. The areas of the triangles may differ from the area of the
+        polygon by the tolerance, relative to that area.
+        """
+        self.dcel = dcel
+        self.tolerance = tolerance
+
+    @instrumentation.timed('validate_triangulation')
+    def validate(self, crossings=True):
+        """
+        Run every check in order and stop at the first violation. The checks of the half-edges, the faces, the
+        triangle count and the areas take O(n) time, the sweep that checks that no two edges cross takes O(n log n)
+        and can be skipped with crossings=False.
+        Returns whether the triangulation is valid, the number of triangles, the first violation as the name of the
+        check and a message, or None, and the time taken in seconds.
+        """
+        start = time.perf_counter()
+        result = {'valid': True, 'triangles': len(self.dcel.faces) - 1, 'violation': None, 'seconds': 0.0}
+        try:
+            self.check_ids()
+            self.check_half_edges()
+            self.check_vertices()
+            self.check_faces()
+            self.check_count()
+            self.check_area()
+            if crossings:
+                self.check_crossings()
+        except TriangulationViolation as violation:
+            result['valid'] = False
+            result['violation'] = {'check': violation.check, 'message': str(violation)}
+            if instrumentation.enabled:
+                instrumentation.increment(f'triangulation_violation_{violation.check}')
+        result['seconds'] = time.perf_counter() - start
+        return result
+
+    def check(self, crossings=True):
+        """
+        Raise a ValueError that describes the first violation if the triangulation is not valid.
+        """
+        result = self.validate(crossings)
+        if not result['valid']:
+            raise ValueError(f"The triangulation is not valid, {result['violation']['message']}")
+        return result
+
+    def check_ids(self):
+        """ The ID of every vertex, half-edge and face is its index in its list """
+        for name, items in (('vertex', self.dcel.vertices), ('half-edge', self.dcel.half_edges),
+                            ('face', self.dcel.faces)):
+            for i, item in enumerate(items):
+                if item.id != i:
+                    raise TriangulationViolation('ids', f"the {name} at index {i} has ID {item.id}.")
+
+    def check_half_edges(self):
+        """ The twin, next and prev pointers of every half-edge agree with each other and with the incident faces """
+        faces = self.dcel.faces
+        for edge in self.dcel.half_edges:
+            twin = edge.twin
+            if twin is None or twin is edge or twin.twin is not edge:
+                raise TriangulationViolation('twin', f"the twin of half-edge {edge.id} does not point back to it.")
+            if edge.next is None or edge.next.prev is not edge:
+                raise TriangulationViolation('next', f"the next half-edge of half-edge {edge.id} does not point back "
+                                                     f"to it.")
+            if edge.prev is None or edge.prev.next is not edge:
+                raise TriangulationViolation('prev', f"the previous half-edge of half-edge {edge.id} does not point "
+                                                     f"back to it.")
+            if edge.next.origin is not twin.origin:
+                raise TriangulationViolation('next', f"half-edge {edge.id} does not end where its next half-edge "
+                                                     f"starts.")
+            if twin.origin is edge.origin:
+                raise TriangulationViolation('twin', f"half-edge {edge.id} starts and ends at the same vertex.")
+            face = edge.incident_face
+            if face is None or face.id >= len(faces) or faces[face.id] is not face:
+                raise TriangulationViolation('incident_face', f"half-edge {edge.id} bounds a face that is not in the "
+                                                              f"DCEL.")
+            if edge.next.incident_face is not face:
+                raise TriangulationViolation('incident_face', f"half-edges {edge.id} and {edge.next.id} follow each "
+                                                              f"other but bound different faces.")
+
+    def check_vertices(self):
+        """ The half-edges listed at every vertex start there, and the first one is on the boundary of the polygon """
+        outside = self.dcel.faces[0]
+        for vertex in self.dcel.vertices:
+            if not vertex.incident_edge:
+                raise TriangulationViolation('vertex', f"vertex {vertex.id} has no incident half-edge.")
+            for edge in vertex.incident_edge:
+                if edge.origin is not vertex:
+                    raise TriangulationViolation('vertex', f"half-edge {edge.id} is listed at vertex {vertex.id} but "
+                                                           f"starts at vertex {edge.origin.id}.")
+            if vertex.incident_edge[0].twin.incident_face is not outside:
+                raise TriangulationViolation('vertex', f"the first half-edge of vertex {vertex.id} is not on the "
+                                                       f"boundary.")
+
+    def check_faces(self):
+        """ Every face but the outside one is a counter-clockwise triangle without holes """
+        faces = self.dcel.faces
+        if len(faces) < 2:
+            raise TriangulationViolation('face', "the DCEL has no face inside the polygon.")
+        for face in faces[1:]:
+            edge = face.outer_component
+            if edge is None or edge.incident_face is not face:
+                raise TriangulationViolation('face', f"the outer component of face {face.id} does not bound it.")
+            if face.inner_component:
+                raise TriangulationViolation('face', f"face {face.id} still has a hole.")
+            if edge.next.next.next is not edge:
+                raise TriangulationViolation('triangle', f"face {face.id} is not a triangle.")
+            if cross(edge.origin.point, edge.next.origin.point, edge.prev.origin.point) <= 0:
+                raise TriangulationViolation('orientation', f"face {face.id} is not a counter-clockwise triangle.")
+
+    def check_count(self):
+        """
+        A polygon of n vertices with h holes has n + 2h - 2 triangles, n - 2 without holes, k disjoint polygons have
+        n + 2h - 2k together, and every boundary half-edge on the outside is one of the n edges of the boundary rings
+        """
+        outside = self.dcel.faces[0]
+        n = len(self.dcel.vertices)
+        polygons, holes = self.dcel.count_polygons()
+        expected = n + 2 * holes - 2 * polygons
+        triangles = len(self.dcel.faces) - 1
+        if triangles != expected:
+            raise TriangulationViolation('count', f"{triangles} triangles instead of {expected} for {n} vertices, "
+                                                  f"{polygons} polygons and {holes} holes.")
+        boundary = sum(1 for edge in self.dcel.half_edges if edge.incident_face is outside)
+        if boundary != n:
+            raise TriangulationViolation('count', f"{boundary} half-edges on the outside instead of {n}.")
+
+    def check_area(self):
+        """ The areas of the triangles add up to the area of the polygon """
+        total = 0.0
+        for face in self.dcel.faces[1:]:
+            edge = face.outer_component
+            total += cross(edge.origin.point, edge.next.origin.point, edge.prev.origin.point) / 2
+        area = self.dcel.calculate_area()
+        if abs(total - area) > self.tolerance * max(area, 1e-300):
+            raise TriangulationViolation('area', f"the triangles cover an area of {total} instead of {area}.")
+
+    def check_crossings(self):
+        """
+        Sweep all edges from top to bottom, as SimplicityValidator does, and test only the edges that become
+        neighbours in the status tree. Edges that share a vertex only cross if they overlap.
+        """
+        events = {}
+        for edge in self.dcel.half_edges:
+            if edge.id < edge.twin.id:
+                # The ring of a segment is unused, its index is the ID of the half-edge
+                segment = Segment(0, edge.id, edge.origin, edge.twin.origin)
+                events.setdefault(segment.upper, []).append(segment)
+                events.setdefault(segment.lower, []).append(segment)
+        order = sorted(events, key=lambda vertex: (-vertex.point.y, vertex.point.x))
+
+        status = SegmentStatusTree()
+        for vertex in order:
+            segments = events[vertex]
+            status.set_sweep_line_y(vertex.point.y)
+            status.sweep_line_x = vertex.point.x
+
+            for segment in segments:
+                if segment.lower is vertex:
+                    node = status.nodes[segment]
+                    left, right = status.predecessor(node), status.successor(node)
+                    status.remove(segment)
+                    if left and right:
+                        self.test_pair(left.edge, right.edge)
+
+            for segment in segments:
+                if segment.upper is vertex:
+                    node = status.add(segment)
+                    for neighbour in (status.predecessor(node), status.successor(node)):
+                        if neighbour:
+                            self.test_pair(segment, neighbour.edge)
+
+    def test_pair(self, segment1, segment2):
+        """ Raise a violation if the two edges share a point other than a common vertex """
+        a, b = segment1.upper, segment1.lower
+        c, d = segment2.upper, segment2.lower
+        shared = {a, b} & {c, d}
+        if len(shared) == 2:
+            crossing = True
+        elif shared:
+            vertex = shared.pop()
+            other1 = b if a is vertex else a
+            other2 = d if c is vertex else c
+            crossing = on_segment(a.point, b.point, other2.point) or on_segment(c.point, d.point, other1.point)
+        else:
+            crossing = segments_intersect(a.point, b.point, c.point, d.point)
+        if crossing:
+            edge1, edge2 = sorted((segment1.index, segment2.index))
+            raise TriangulationViolation('crossing', f"the edges of half-edges {edge1} and {edge2} cross.")
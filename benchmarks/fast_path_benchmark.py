@@ -0,0 +1,114 @@
+# Group ID 14 (21114021 & 21114078) - Ashutosh Kumar and Raiwat Bapat
+# Date: October 19 2026
+# fast_path_benchmark.py : Contains the benchmark of the convex and monotone fast paths on a mix of polygons.
+#
+# Run from the root of the repository:
+#     python -m benchmarks.fast_path_benchmark --count 200 --n 500 --mix convex=0.4 monotone=0.3 general=0.3
+
+import argparse
+import json
+import random
+import sys
+import threading
+import time
+
+from FastTriangulation import FastTriangulation
+from MonotonePartitioner import MonotonePartitioner
+from MonotoneTriangulation import MonotoneTriangulation
+from RandomPolygons import split_merge_polygon
+from benchmarks.pipeline_benchmark import (STACK_SIZE, convex_polygon, orient_counter_clockwise, space_partition_family,
+                                           star_polygon)
+from elements.DCEL import DCEL
+from elements.Point import Point
+from elements.Vertex import Vertex
+
+
+def monotone_polygon(n, rng):
+    """ A random y-monotone polygon, an x-monotone one without split and merge vertices turned by a quarter """
+    return [(-y, x) for x, y in split_merge_polygon(n, split_density=0, merge_density=0, seed=rng.randrange(2 ** 32))]
+
+
+def general_polygon(n, rng):
+    """ A star-shaped or a space partitioning polygon, with split and merge vertices """
+    return (star_polygon if rng.random() < 0.5 else space_partition_family)(n, rng)
+
+
+KINDS = {'convex': convex_polygon, 'monotone': monotone_polygon, 'general': general_polygon}
+
+
+def build(points):
+    return DCEL(vertices=[Vertex(Point(x, y)) for x, y in points], record_images=False)
+
+
+def run_baseline(points):
+    dcel = build(points)
+    start = time.perf_counter()
+    MonotonePartitioner(dcel).perform_sweep_line_partition()
+    MonotoneTriangulation(dcel).triangulate()
+    return time.perf_counter() - start
+
+
+def run_fast(points):
+    dcel = build(points)
+    start = time.perf_counter()
+    path = FastTriangulation(dcel).triangulate()['path']
+    return time.perf_counter() - start, path
+
+
+def main(arguments):
+    parser = argparse.ArgumentParser(description="Benchmark the fast paths of the triangulation on a mix of polygons.")
+    parser.add_argument('--count', type=int, default=200, help="Number of polygons in the mix")
+    parser.add_argument('--n', type=int, default=500, help="Vertices per polygon")
+    parser.add_argument('--mix', nargs='+', default=['convex=0.4', 'monotone=0.3', 'general=0.3'],
+                        help="Share of every kind of polygon, as kind=weight")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', help="Write the results to this JSON file")
+    options = parser.parse_args(arguments)
+
+    weights = {}
+    for item in options.mix:
+        kind, _, weight = item.partition('=')
+        if kind not in KINDS:
+            parser.error(f"Unknown kind of polygon {kind}, expected one of {list(KINDS)}.")
+        weights[kind] = float(weight)
+
+    rng = random.Random(options.seed)
+    kinds = rng.choices(list(weights), weights=list(weights.values()), k=options.count)
+    polygons = [orient_counter_clockwise(KINDS[kind](options.n, rng)) for kind in kinds]
+
+    report = {'count': options.count, 'n': options.n, 'mix': weights, 'kinds': {}}
+    for kind, points in zip(kinds, polygons):
+        baseline = run_baseline(points)
+        fast, path = run_fast(points)
+        entry = report['kinds'].setdefault(kind, {'polygons': 0, 'baseline_seconds': 0.0, 'fast_seconds': 0.0,
+                                                  'paths': {}})
+        entry['polygons'] += 1
+        entry['baseline_seconds'] += baseline
+        entry['fast_seconds'] += fast
+        entry['paths'][path] = entry['paths'].get(path, 0) + 1
+
+    for kind, entry in report['kinds'].items():
+        entry['speedup'] = entry['baseline_seconds'] / entry['fast_seconds']
+        print(f"{kind:<10} {entry['polygons']:>5} polygons  baseline {entry['baseline_seconds']:.3f}s  "
+              f"fast {entry['fast_seconds']:.3f}s  speedup {entry['speedup']:.1f}x  paths {entry['paths']}")
+    report['baseline_seconds'] = sum(entry['baseline_seconds'] for entry in report['kinds'].values())
+    report['fast_seconds'] = sum(entry['fast_seconds'] for entry in report['kinds'].values())
+    report['speedup'] = report['baseline_seconds'] / report['fast_seconds']
+    print(f"{'total':<10} {options.count:>5} polygons  baseline {report['baseline_seconds']:.3f}s  "
+          f"fast {report['fast_seconds']:.3f}s  speedup {report['speedup']:.1f}x")
+
+    if options.output:
+        with open(options.output, 'w') as file:
+            json.dump(report, file, indent=2)
+    return 0
+
+
+if __name__ == '__main__':
+    # The sweep of the partitioning recurses as deep as the status tree
+    sys.setrecursionlimit(10 ** 7)
+    threading.stack_size(STACK_SIZE)
+    exit_code = []
+    worker = threading.Thread(target=lambda: exit_code.append(main(sys.argv[1:])))
+    worker.start()
+    worker.join()
+    sys.exit(exit_code[0] if exit_code else 1)
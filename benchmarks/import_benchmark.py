@@ -0,0 +1,67 @@
+# Group ID 14 (21114021 & 21114078) - Ashutosh Kumar and Raiwat Bapat
+# Date: October 19 2026
+# import_benchmark.py : Contains the benchmark of the import time of the algorithm modules with and without plotting.
+#
+# Run from the root of the repository:
+#     python -m benchmarks.import_benchmark --repeat 10
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+CORE_IMPORTS = ("import elements.DCEL, MonotonePartitioner, MonotoneTriangulation, DualGraph, "
+                "IncrementalTriangulation, TriangulationCache")
+CASES = {
+    'core': CORE_IMPORTS,
+    'core_with_visualization': CORE_IMPORTS + "; import elements.Visualization",
+}
+PLOTTING_MODULES = ['matplotlib', 'PIL', 'tabulate']
+
+# Runs in a fresh interpreter, prints the import time and the plotting modules that got imported
+PROBE = """
+import sys, time
+start = time.perf_counter()
+{imports}
+elapsed = time.perf_counter() - start
+print(elapsed, ','.join(m for m in {plotting!r} if m in sys.modules))
+"""
+
+
+def measure(imports, repeat):
+    """ Import times in seconds over fresh interpreters, and the plotting modules the imports pulled in """
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    environment = dict(os.environ, MPLBACKEND='Agg')
+    times = []
+    loaded = ''
+    for _ in range(repeat):
+        output = subprocess.run([sys.executable, '-c', PROBE.format(imports=imports, plotting=PLOTTING_MODULES)],
+                                cwd=root, env=environment, capture_output=True, text=True, check=True).stdout
+        elapsed, loaded = output.split(' ')
+        times.append(float(elapsed))
+    return times, [module for module in loaded.strip().split(',') if module]
+
+
+def main(arguments):
+    parser = argparse.ArgumentParser(description="Benchmark the import time of the algorithm modules.")
+    parser.add_argument('--repeat', type=int, default=10, help="Fresh interpreters per case, the median is kept")
+    parser.add_argument('--output', help="Write the results to this JSON file")
+    options = parser.parse_args(arguments)
+
+    results = {}
+    for name, imports in CASES.items():
+        times, loaded = measure(imports, options.repeat)
+        results[name] = {'median': statistics.median(times), 'min': min(times), 'plotting_modules': loaded}
+        print(f"{name:>24}  median={results[name]['median'] * 1000:.1f}ms  min={results[name]['min'] * 1000:.1f}ms  "
+              f"plotting modules: {', '.join(loaded) or 'none'}")
+
+    if options.output:
+        with open(options.output, 'w') as file:
+            json.dump(results, file, indent=2)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,115 @@
+# Group ID 14 (21114021 & 21114078) - Ashutosh Kumar and Raiwat Bapat
+# Date: October 19 2026
+# multi_polygon_benchmark.py : Contains the benchmark of the single sweep over a tile of disjoint polygons against one pipeline per polygon.
+#
+# Run from the root of the repository:
+#     python -m benchmarks.multi_polygon_benchmark --polygons 100 500 --n 20
+
+import argparse
+import gc
+import json
+import random
+import sys
+import threading
+import time
+
+from DualGraph import DualGraph
+from MonotonePartitioner import MonotonePartitioner
+from MonotoneTriangulation import MonotoneTriangulation
+from MultiPolygonTriangulation import MultiPolygonTriangulation
+from benchmarks.pipeline_benchmark import STACK_SIZE, convex_polygon, orient_counter_clockwise, star_polygon
+from elements.DCEL import DCEL
+from elements.Point import Point
+from elements.Vertex import Vertex
+
+
+def tile_polygons(count, n, rng):
+    """ Star-shaped and convex polygons of n vertices, each one scaled into its own cell of a square grid """
+    side = int(count ** 0.5) + 1
+    polygons = []
+    for i in range(count):
+        points = orient_counter_clockwise((star_polygon if rng.random() < 0.5 else convex_polygon)(n, rng))
+        min_x, min_y = min(x for x, _ in points), min(y for _, y in points)
+        size = max(max(x for x, _ in points) - min_x, max(y for _, y in points) - min_y)
+        column, row = i % side, i // side
+        polygons.append([(column + (x - min_x) / size * 0.9, row + (y - min_y) / size * 0.9) for x, y in points])
+    return polygons
+
+
+def run_separately(polygons):
+    """ One DCEL, sweep, triangulation and dual graph per polygon, with the same triangles and guards as output """
+    results = []
+    for points in polygons:
+        dcel = DCEL(vertices=[Vertex(Point(x, y)) for x, y in points], record_images=False)
+        MonotonePartitioner(dcel).perform_sweep_line_partition()
+        MonotoneTriangulation(dcel).triangulate()
+        dual_graph = DualGraph(dcel)
+        dual_graph.build_dual_graph()
+        dual_graph.three_coloring()
+        triangles = [(edge.origin.id, edge.next.origin.id, edge.prev.origin.id)
+                     for edge in (face.outer_component for face in dcel.faces[1:])]
+        color_counts = [0, 0, 0]
+        for vertex in dcel.vertices:
+            color_counts[vertex.color] += 1
+        guard_color = color_counts.index(min(color_counts))
+        results.append({'triangles': triangles, 'guards': [vertex.id for vertex in dcel.vertices
+                                                           if vertex.color == guard_color]})
+    return results
+
+
+def run_together(polygons):
+    """ One DCEL and one sweep for the whole tile """
+    return MultiPolygonTriangulation(polygons).triangulate()['polygons']
+
+
+def measure(run, polygons, pause_collector):
+    """ Seconds taken by one run, under the same garbage collector settings for both sides """
+    gc.collect()  # The DCELs of the previous run are garbage cycles, they are not collected on the clock
+    if pause_collector:
+        gc.disable()
+    try:
+        start = time.perf_counter()
+        run(polygons)
+        return time.perf_counter() - start
+    finally:
+        if pause_collector:
+            gc.enable()
+
+
+def main(arguments):
+    parser = argparse.ArgumentParser(description="Benchmark the single sweep over a tile of disjoint polygons.")
+    parser.add_argument('--polygons', type=int, nargs='+', default=[100, 500], help="Polygons per tile")
+    parser.add_argument('--n', type=int, default=20, help="Vertices per polygon")
+    parser.add_argument('--repeat', type=int, default=3, help="Best of this many runs")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--pause-collector', action='store_true',
+                        help="Pause the cyclic garbage collector during both runs")
+    parser.add_argument('--output', help="Write the results to this JSON file")
+    options = parser.parse_args(arguments)
+
+    results = []
+    for count in options.polygons:
+        polygons = tile_polygons(count, options.n, random.Random(options.seed))
+        separate = min(measure(run_separately, polygons, options.pause_collector) for _ in range(options.repeat))
+        together = min(measure(run_together, polygons, options.pause_collector) for _ in range(options.repeat))
+        result = {'polygons': count, 'n': options.n, 'pause_collector': options.pause_collector,
+                  'separate_seconds': separate, 'together_seconds': together, 'speedup': separate / together}
+        results.append(result)
+        print(f"{count:>6} polygons of {options.n} vertices  separate {separate:.3f}s  together {together:.3f}s  "
+              f"speedup {result['speedup']:.2f}x")
+
+    if options.output:
+        with open(options.output, 'w') as file:
+            json.dump(results, file, indent=2)
+    return 0
+
+
+if __name__ == '__main__':
+    # The sweep of the partitioning recurses as deep as the status tree
+    sys.setrecursionlimit(10 ** 7)
+    threading.stack_size(STACK_SIZE)
+    exit_code = []
+    worker = threading.Thread(target=lambda: exit_code.append(main(sys.argv[1:])))
+    worker.start()
+    worker.join()
+    sys.exit(exit_code[0] if exit_code else 1)
@@ -0,0 +1,93 @@
+# Group ID 14 (21114021 & 21114078) - Ashutosh Kumar and Raiwat Bapat
+# Date: October 19 2026
+# parallel_benchmark.py : Contains the scaling benchmark of the parallel triangulation of monotone pieces across process counts.
+#
+# Run from the root of the repository:
+#     python -m benchmarks.parallel_benchmark --family split_merge --n 200000 --processes 1 2 4 8
+
+import argparse
+import json
+import os
+import random
+import sys
+import threading
+import time
+
+from MonotonePartitioner import MonotonePartitioner
+from MonotoneTriangulation import MonotoneTriangulation
+from ParallelTriangulation import ParallelTriangulation
+from benchmarks.pipeline_benchmark import FAMILIES, STACK_SIZE, orient_counter_clockwise
+from elements.DCEL import DCEL
+from elements.Point import Point
+from elements.Vertex import Vertex
+
+
+def partitioned_polygon(family, n, seed):
+    """ Serialized DCEL of a polygon of the family after the monotone partitioning, so every run starts the same """
+    points = orient_counter_clockwise(FAMILIES[family](n, random.Random(seed)))
+    dcel = DCEL(vertices=[Vertex(Point(x, y)) for x, y in points], record_images=False)
+    MonotonePartitioner(dcel).perform_sweep_line_partition()
+    return dcel.to_bytes(), len(dcel.faces) - 1
+
+
+def time_triangulation(data, processes, repeat):
+    """ Best time in seconds of the parallel triangulation over the repeats, the pool start-up is included """
+    best = None
+    for _ in range(repeat):
+        dcel = DCEL.from_bytes(data)
+        start = time.perf_counter()
+        ParallelTriangulation(dcel, processes=processes).triangulate()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def time_sequential(data):
+    """ Time in seconds of MonotoneTriangulation on the same pieces, for reference """
+    dcel = DCEL.from_bytes(data)
+    start = time.perf_counter()
+    MonotoneTriangulation(dcel).triangulate()
+    return time.perf_counter() - start
+
+
+def main(arguments):
+    parser = argparse.ArgumentParser(description="Benchmark the parallel triangulation across process counts.")
+    parser.add_argument('--family', choices=list(FAMILIES), default='split_merge')
+    parser.add_argument('--n', type=int, default=100000)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--processes', nargs='+', type=int, default=[1, 2, 4, 8])
+    parser.add_argument('--repeat', type=int, default=3, help="Repeats per process count, the best time is kept")
+    parser.add_argument('--sequential', action='store_true', help="Also time MonotoneTriangulation (quadratic)")
+    parser.add_argument('--output', help="Write the results to this JSON file")
+    options = parser.parse_args(arguments)
+
+    data, pieces = partitioned_polygon(options.family, options.n, options.seed)
+    print(f"{options.family} n={options.n}: {pieces} monotone pieces, {os.cpu_count()} CPUs available")
+    report = {'family': options.family, 'n': options.n, 'pieces': pieces, 'cpus': os.cpu_count(), 'results': []}
+
+    baseline = None
+    for processes in options.processes:
+        seconds = time_triangulation(data, processes, options.repeat)
+        baseline = baseline or seconds
+        report['results'].append({'processes': processes, 'seconds': seconds, 'speedup': baseline / seconds})
+        print(f"{processes:>4} processes  {seconds * 1000:.1f}ms  speedup {baseline / seconds:.2f}x", flush=True)
+
+    if options.sequential:
+        report['sequential_seconds'] = time_sequential(data)
+        print(f"MonotoneTriangulation  {report['sequential_seconds'] * 1000:.1f}ms")
+
+    if options.output:
+        with open(options.output, 'w') as file:
+            json.dump(report, file, indent=2)
+    return 0
+
+
+if __name__ == '__main__':
+    # The sweep of the partitioning recurses as deep as the status tree
+    sys.setrecursionlimit(10 ** 7)
+    threading.stack_size(STACK_SIZE)
+    exit_code = []
+    worker = threading.Thread(target=lambda: exit_code.append(main(sys.argv[1:])))
+    worker.start()
+    worker.join()
+    sys.exit(exit_code[0] if exit_code else 1)
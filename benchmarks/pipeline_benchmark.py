@@ -0,0 +1,290 @@
+# Group ID 14 (21114021 & 21114078) - Ashutosh Kumar and Raiwat Bapat
+# Date: October 19 2026
+# pipeline_benchmark.py : Contains the benchmark of every stage of the triangulation pipeline on families of polygons.
+#
+# Run from the root of the repository:
+#     python -m benchmarks.pipeline_benchmark --sizes 10 100 1000 --output results.json
+#     python -m benchmarks.pipeline_benchmark --sizes 10 100 1000 --baseline results.json
+
+import argparse
+import json
+import math
+import platform
+import random
+import sys
+import threading
+import time
+import tracemalloc
+
+from DualGraph import DualGraph
+from MonotonePartitioner import MonotonePartitioner
+from MonotoneTriangulation import MonotoneTriangulation
+from RandomPolygons import space_partition_polygon, split_merge_polygon
+from elements.DCEL import DCEL
+from elements.Point import Point
+from elements.Vertex import Vertex
+
+STAGES = ['construction', 'classify_vertices', 'sweep', 'triangulate', 'build_dual_graph', 'three_coloring']
+DEFAULT_SIZES = [10, 100, 1000, 10000, 100000, 1000000]
+STACK_SIZE = 512 * 1024 * 1024  # The status tree and the coloring recurse as deep as the polygon is long
+
+
+def convex_polygon(n, rng):
+    """ Points on a circle at jittered, sorted angles """
+    step = 2 * math.pi / n
+    angles = [i * step + rng.uniform(0, step / 2) for i in range(n)]
+    return [(math.cos(angle), math.sin(angle)) for angle in angles]
+
+
+def star_polygon(n, rng):
+    """ Random radii around the origin, the continuous counterpart of DCEL.random_simple_polygon """
+    step = 2 * math.pi / n
+    points = []
+    for i in range(n):
+        angle = i * step + rng.uniform(0, step / 2)
+        radius = rng.uniform(0.3, 1)
+        points.append((radius * math.cos(angle), radius * math.sin(angle)))
+    return points
+
+
+def spiral_polygon(n, rng):
+    """ A thick spiral band, out along the outer arm and back along the inner arm """
+    arm = n // 2
+    turns = max(1, min(50, n // 100))
+    outer = []
+    inner = []
+    for i in range(arm):
+        theta = 2 * math.pi * (1 + turns * i / (arm - 1))
+        radius = theta
+        outer.append((radius * math.cos(theta), radius * math.sin(theta)))
+        inner.append(((radius - math.pi) * math.cos(theta), (radius - math.pi) * math.sin(theta)))
+    points = outer + inner[::-1]
+    if n % 2:
+        points.append((0.5 * (outer[0][0] + inner[0][0]), 0.5 * (outer[0][1] + inner[0][1]) - 0.1))
+    return points
+
+
+def comb_polygon(n, rng):
+    """ Teeth pointing up from a base, every valley between two teeth is a merge vertex """
+    teeth = max(1, n // 4)
+    points = [(0, 0), (2 * teeth - 1, 0)]
+    for i in range(teeth - 1, -1, -1):
+        left, right = 2 * i, 2 * i + 1
+        top = 2 + rng.uniform(0, 0.5)
+        if i < teeth - 1:
+            points.append((right, 1 + rng.uniform(0, 0.1)))
+        points.append((right, top))
+        points.append((left, top + rng.uniform(0.001, 0.01)))
+        if i > 0:
+            points.append((left, 1 + rng.uniform(0, 0.1)))
+    return points
+
+
+def reflex_chain_polygon(n, rng):
+    """ A y-monotone polygon whose right chain is reflex everywhere, the stack of the triangulation grows to n """
+    chain = n - 2
+    points = [(0, 0)]
+    for i in range(1, chain + 1):
+        t = i / (chain + 1)
+        points.append((1 + 4 * (t - 0.5) ** 2, t * n))
+    points.append((0, n))
+    return points
+
+
+def zigzag_polygon(n, rng):
+    """ A y-monotone polygon whose right chain alternates between reflex and convex vertices """
+    chain = n - 2
+    points = [(0, 0)]
+    for i in range(1, chain + 1):
+        points.append((1 + (i % 2) + rng.uniform(0, 0.1), i))
+    points.append((0, chain + 1))
+    return points
+
+
+def space_partition_family(n, rng):
+    """ A random polygon that is not star-shaped, from RandomPolygons.space_partition_polygon """
+    return space_partition_polygon(n, seed=rng.randrange(2 ** 32))
+
+
+def split_merge_family(n, rng):
+    """ An x-monotone polygon with a tenth of its vertices split and a tenth merge vertices """
+    return split_merge_polygon(n, split_density=0.1, merge_density=0.1, seed=rng.randrange(2 ** 32))
+
+
+FAMILIES = {
+    'convex': convex_polygon,
+    'star': star_polygon,
+    'spiral': spiral_polygon,
+    'comb': comb_polygon,
+    'reflex_chain': reflex_chain_polygon,
+    'zigzag': zigzag_polygon,
+    'space_partition': space_partition_family,
+    'split_merge': split_merge_family,
+}
+
+
+def orient_counter_clockwise(points):
+    area = sum(p[0] * q[1] - q[0] * p[1] for p, q in zip(points, points[1:] + points[:1]))
+    return points if area > 0 else points[::-1]
+
+
+def run_pipeline(points):
+    """
+    Run every stage once on a ring of points. Returns the time of each stage in seconds and the size of the output.
+    """
+    timings = {}
+
+    start = time.perf_counter()
+    dcel = DCEL(vertices=[Vertex(Point(x, y)) for x, y in points], record_images=False)
+    timings['construction'] = time.perf_counter() - start
+
+    partitioner = MonotonePartitioner(dcel)
+    start = time.perf_counter()
+    partitioner.classify_vertices()
+    timings['classify_vertices'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    partitioner.perform_sweep_line_partition()
+    timings['sweep'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    MonotoneTriangulation(dcel).triangulate()
+    timings['triangulate'] = time.perf_counter() - start
+
+    dual_graph = DualGraph(dcel)
+    start = time.perf_counter()
+    dual_graph.build_dual_graph()
+    timings['build_dual_graph'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    dual_graph.three_coloring()
+    timings['three_coloring'] = time.perf_counter() - start
+
+    return timings, len(dcel.faces) - 1
+
+
+def measure_peak_memory(points):
+    """ Peak memory in bytes allocated while the whole pipeline runs, measured separately from the timings """
+    tracemalloc.start()
+    try:
+        run_pipeline(points)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+def benchmark_case(family, n, seed, repeat, memory):
+    """ Benchmark one polygon, the time of each stage is the best of the repeats """
+    points = orient_counter_clockwise(FAMILIES[family](n, random.Random(seed)))
+    result = {'family': family, 'n': len(points), 'status': 'ok'}
+    try:
+        best = None
+        for _ in range(repeat):
+            timings, triangles = run_pipeline(points)
+            best = timings if best is None else {stage: min(best[stage], timings[stage]) for stage in STAGES}
+        result['triangles'] = triangles
+        if memory:
+            result['peak_memory'] = measure_peak_memory(points)
+        result['stages'] = best
+        result['total'] = sum(best.values())
+    except Exception as error:
+        result['status'] = f"error: {type(error).__name__}: {error}"
+    return result
+
+
+def run_benchmarks(families, sizes, seed, repeat, memory, budget):
+    """
+    Benchmark every family at every size. The remaining sizes of a family are skipped once one of its cases takes
+    longer than the time budget in seconds, or fails.
+    """
+    results = []
+    for family in families:
+        skipping = False
+        for n in sizes:
+            if skipping:
+                results.append({'family': family, 'n': n, 'status': 'skipped'})
+                continue
+            start = time.perf_counter()
+            result = benchmark_case(family, n, seed, repeat, memory)
+            results.append(result)
+            print_result(result)
+            if result['status'] != 'ok' or time.perf_counter() - start > budget:
+                skipping = True
+    return results
+
+
+def print_result(result):
+    if result['status'] != 'ok':
+        print(f"{result['family']:>16} {result['n']:>8}  {result['status']}", flush=True)
+        return
+    stages = '  '.join(f"{stage}={result['stages'][stage] * 1000:.2f}ms" for stage in STAGES)
+    memory = f"  peak={result['peak_memory'] / 1024 / 1024:.1f}MiB" if 'peak_memory' in result else ''
+    print(f"{result['family']:>16} {result['n']:>8}  {stages}{memory}", flush=True)
+
+
+def compare_with_baseline(results, baseline, tolerance, min_seconds):
+    """
+    Compare the stage times with a saved result file. A stage regresses when it is slower than the baseline by more
+    than the relative tolerance and by more than min_seconds. Returns the list of regressions.
+    """
+    previous = {(entry['family'], entry['n']): entry for entry in baseline['results'] if entry['status'] == 'ok'}
+    regressions = []
+    for result in results:
+        old = previous.get((result['family'], result['n']))
+        if old is None or result['status'] != 'ok':
+            continue
+        for stage in STAGES:
+            new_time, old_time = result['stages'][stage], old['stages'][stage]
+            if new_time > old_time * (1 + tolerance) and new_time - old_time > min_seconds:
+                regressions.append({'family': result['family'], 'n': result['n'], 'stage': stage,
+                                    'baseline': old_time, 'current': new_time})
+    return regressions
+
+
+def main(arguments):
+    parser = argparse.ArgumentParser(description="Benchmark every stage of the triangulation pipeline.")
+    parser.add_argument('--families', nargs='+', choices=list(FAMILIES), default=list(FAMILIES))
+    parser.add_argument('--sizes', nargs='+', type=int, default=DEFAULT_SIZES)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--repeat', type=int, default=3, help="Repeats per case, the best time is kept")
+    parser.add_argument('--budget', type=float, default=60, help="Seconds per case before larger sizes are skipped")
+    parser.add_argument('--no-memory', action='store_true', help="Do not measure the peak memory")
+    parser.add_argument('--output', help="Write the results to this JSON file")
+    parser.add_argument('--baseline', help="Compare the results with this JSON file")
+    parser.add_argument('--tolerance', type=float, default=0.2, help="Allowed relative slowdown per stage")
+    parser.add_argument('--min-seconds', type=float, default=0.001, help="Ignore slowdowns smaller than this")
+    options = parser.parse_args(arguments)
+
+    results = run_benchmarks(options.families, sorted(options.sizes), options.seed, options.repeat,
+                             not options.no_memory, options.budget)
+    report = {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'seed': options.seed,
+        'repeat': options.repeat,
+        'results': results,
+    }
+    if options.output:
+        with open(options.output, 'w') as file:
+            json.dump(report, file, indent=2)
+
+    if options.baseline:
+        with open(options.baseline) as file:
+            regressions = compare_with_baseline(results, json.load(file), options.tolerance, options.min_seconds)
+        for regression in regressions:
+            print(f"Regression in {regression['stage']} for {regression['family']} n={regression['n']}: "
+                  f"{regression['baseline'] * 1000:.2f}ms -> {regression['current'] * 1000:.2f}ms")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == '__main__':
+    # The recursive parts of the pipeline need a deeper stack than the main thread has for large polygons
+    sys.setrecursionlimit(10 ** 7)
+    threading.stack_size(STACK_SIZE)
+    exit_code = []
+    worker = threading.Thread(target=lambda: exit_code.append(main(sys.argv[1:])))
+    worker.start()
+    worker.join()
+    sys.exit(exit_code[0] if exit_code else 1)
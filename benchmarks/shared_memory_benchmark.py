@@ -0,0 +1,169 @@
+# Group ID 14 (21114021 & 21114078) - Ashutosh Kumar and Raiwat Bapat
+# Date: October 19 2026
+# shared_memory_benchmark.py : Contains the benchmark of handing a triangulated DCEL to downstream worker processes in shared memory against pickling it.
+#
+# Run from the root of the repository:
+#     python -m benchmarks.shared_memory_benchmark --family split_merge --n 20000 100000 --consumers 1 4
+
+import argparse
+import json
+import random
+import sys
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from MonotonePartitioner import MonotonePartitioner
+from ParallelTriangulation import ParallelTriangulation
+from benchmarks.pipeline_benchmark import FAMILIES, STACK_SIZE, orient_counter_clockwise
+from elements.DCEL import DCEL
+from elements.Point import Point
+from elements.SharedTables import SharedTables
+from elements.Vertex import Vertex
+
+MODES = ['pickle_dcel', 'pickle_columns', 'shared_dcel', 'shared_columns']
+
+
+def triangulated_polygon(family, n, seed):
+    """ Serialized DCEL of a polygon of the family after the partitioning and the triangulation """
+    points = orient_counter_clockwise(FAMILIES[family](n, random.Random(seed)))
+    dcel = DCEL(vertices=[Vertex(Point(x, y)) for x, y in points], record_images=False)
+    MonotonePartitioner(dcel).perform_sweep_line_partition()
+    ParallelTriangulation(dcel, processes=1).triangulate()
+    return dcel.to_bytes()
+
+
+def area_of_columns(x, y, origin, next_edge, outer):
+    """ The downstream stage on the columns: the total area of the triangles, read from the flat index arrays """
+    total = 0.0
+    for f in range(1, len(outer)):
+        e = outer[f]
+        a, b, c = origin[e], origin[next_edge[e]], origin[next_edge[next_edge[e]]]
+        total += (x[b] - x[a]) * (y[c] - y[a]) - (y[b] - y[a]) * (x[c] - x[a])
+    return total / 2
+
+
+def area_of_dcel(dcel):
+    """ The same stage on the object graph """
+    total = 0.0
+    for face in dcel.faces[1:]:
+        edge = face.outer_component
+        a, b, c = edge.origin.point, edge.next.origin.point, edge.next.next.origin.point
+        total += (b.x - a.x) * (c.y - a.y) - (b.y - a.y) * (c.x - a.x)
+    return total / 2
+
+
+def _stage_dcel(dcel):
+    return area_of_dcel(dcel)
+
+
+def _stage_columns(columns):
+    vertices, half_edges, faces = columns['vertices'], columns['half_edges'], columns['faces']
+    return area_of_columns(vertices['x'], vertices['y'], half_edges['origin'], half_edges['next'], faces['outer'])
+
+
+def _stage_shared_dcel(descriptor):
+    with SharedTables.attach(descriptor) as tables:
+        dcel = DCEL.from_shared(tables)
+    return area_of_dcel(dcel)
+
+
+def _stage_shared_columns(descriptor):
+    with SharedTables.attach(descriptor) as tables:
+        return area_of_columns(tables.column('vertices/x'), tables.column('vertices/y'),
+                               tables.column('half_edges/origin'), tables.column('half_edges/next'),
+                               tables.column('faces/outer'))
+
+
+def hand_off(pool, mode, dcel, consumers):
+    """
+    Hand the DCEL to consumers tasks in the pool and run the stage in each. The pickling modes pickle the DCEL or its
+    columns once per task, the shared modes publish the columns once and pickle only the descriptor.
+    Returns the time taken in seconds and the areas computed by the consumers.
+    """
+    start = time.perf_counter()
+    if mode == 'pickle_dcel':
+        areas = list(pool.map(_stage_dcel, [dcel] * consumers))
+    elif mode == 'pickle_columns':
+        areas = list(pool.map(_stage_columns, [dcel.to_columns()] * consumers))
+    else:
+        stage = _stage_shared_dcel if mode == 'shared_dcel' else _stage_shared_columns
+        with dcel.share() as tables:
+            areas = list(pool.map(stage, [tables.descriptor] * consumers))
+    return time.perf_counter() - start, areas
+
+
+def time_parallel_triangulation(family, n, seed, processes, shared, repeat):
+    """ Best time in seconds of ParallelTriangulation with the pieces pickled or in shared memory """
+    points = orient_counter_clockwise(FAMILIES[family](n, random.Random(seed)))
+    dcel = DCEL(vertices=[Vertex(Point(x, y)) for x, y in points], record_images=False)
+    MonotonePartitioner(dcel).perform_sweep_line_partition()
+    data = dcel.to_bytes()
+    best = None
+    for _ in range(repeat):
+        dcel = DCEL.from_bytes(data)
+        start = time.perf_counter()
+        ParallelTriangulation(dcel, processes=processes, shared=shared).triangulate()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main(arguments):
+    parser = argparse.ArgumentParser(description="Benchmark the shared memory handoff against pickling.")
+    parser.add_argument('--family', choices=list(FAMILIES), default='split_merge')
+    parser.add_argument('--n', type=int, nargs='+', default=[20000, 100000])
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--consumers', type=int, nargs='+', default=[1, 4], help="Downstream tasks per handoff")
+    parser.add_argument('--processes', type=int, default=2, help="Size of the process pool")
+    parser.add_argument('--repeat', type=int, default=3, help="Best of this many runs")
+    parser.add_argument('--output', help="Write the results to this JSON file")
+    options = parser.parse_args(arguments)
+
+    results = []
+    SharedTables.track()
+    with ProcessPoolExecutor(max_workers=options.processes) as pool:
+        # Start the workers before anything is timed
+        list(pool.map(abs, range(options.processes)))
+        for n in options.n:
+            dcel = DCEL.from_bytes(triangulated_polygon(options.family, n, options.seed))
+            expected = area_of_dcel(dcel)
+            for consumers in options.consumers:
+                result = {'family': options.family, 'n': n, 'consumers': consumers}
+                for mode in MODES:
+                    best = None
+                    for _ in range(options.repeat):
+                        seconds, areas = hand_off(pool, mode, dcel, consumers)
+                        if any(abs(area - expected) > 1e-9 * abs(expected) for area in areas):
+                            raise ValueError(f"The {mode} handoff computed a different area.")
+                        best = seconds if best is None else min(best, seconds)
+                    result[f'{mode}_seconds'] = best
+                results.append(result)
+                print(f"{options.family} n={n} consumers={consumers}  " +
+                      "  ".join(f"{mode} {result[f'{mode}_seconds'] * 1000:.1f}ms" for mode in MODES) +
+                      f"  speedup {result['pickle_dcel_seconds'] / result['shared_columns_seconds']:.2f}x",
+                      flush=True)
+
+    for n in options.n:
+        pickled, shared = (time_parallel_triangulation(options.family, n, options.seed, options.processes, shared,
+                                                       options.repeat) for shared in (False, True))
+        results.append({'family': options.family, 'n': n, 'parallel_triangulation_pickle_seconds': pickled,
+                        'parallel_triangulation_shared_seconds': shared})
+        print(f"{options.family} n={n} ParallelTriangulation with {options.processes} processes  pickled "
+              f"{pickled * 1000:.1f}ms  shared {shared * 1000:.1f}ms", flush=True)
+
+    if options.output:
+        with open(options.output, 'w') as file:
+            json.dump(results, file, indent=2)
+    return 0
+
+
+if __name__ == '__main__':
+    # The sweep of the partitioning recurses as deep as the status tree
+    sys.setrecursionlimit(10 ** 7)
+    threading.stack_size(STACK_SIZE)
+    exit_code = []
+    worker = threading.Thread(target=lambda: exit_code.append(main(sys.argv[1:])))
+    worker.start()
+    worker.join()
+    sys.exit(exit_code[0] if exit_code else 1)
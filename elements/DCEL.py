@@ -4,20 +4,55 @@
 
 import math
 import random
+import struct
+import sys
+from array import array
 from io import BytesIO
 
-import matplotlib.pyplot as plt
-from PIL import Image
-from matplotlib import animation
-from tabulate import tabulate
-
 from elements.Face import Face
+from elements.FaceBoundary import FaceBoundary
 from elements.HalfEdge import HalfEdge
+from elements.Instrumentation import instrumentation
 from elements.Point import Point
 from elements.Vertex import Vertex
 
+SERIAL_HEADER = struct.Struct('<4s6q')  # Magic, n and the counts of vertices, half-edges, faces and index lists
+SERIAL_MAGIC = b'DCL1'
+
+
+def signed_area(vertices):
+    """ Signed area of a ring of vertices, positive when the ring is counter-clockwise """
+    n = len(vertices)
+    area = 0
+    for i in range(n):
+        p, q = vertices[i].point, vertices[(i + 1) % n].point  # Closing the ring by wrapping
+        area += (p.x * q.y) - (q.x * p.y)
+    return area / 2
+
+
+def in_wedge(edge, target):
+    """
+    Check if the direction from the origin of a half-edge towards the target vertex lies inside the corner of the
+    incident face of the half-edge at its origin, i.e. counter-clockwise between the half-edge and its previous one.
+    """
+    o = edge.origin.point
+    a = edge.twin.origin.point
+    b = edge.prev.origin.point
+    t = target.point
 
-def diagonal_exist(vertex1, vertex2, face):
+    def cross(p, q):
+        return (p.x - o.x) * (q.y - o.y) - (p.y - o.y) * (q.x - o.x)
+
+    if cross(a, b) > 0:  # Convex corner
+        return cross(a, t) > 0 and cross(t, b) > 0
+    return not (cross(b, t) >= 0 and cross(t, a) >= 0)  # Reflex corner
+
+
+def diagonal_exist(vertex1, vertex2, face, boundary=None):
+    """
+    Check if the segment between two vertices of a face is a diagonal of the face. With the cached boundary of the
+    face, the neighbours of the vertices are looked up instead of walking the boundary.
+    """
     def area_of_triangle2(a, b, c):
         return (b.point.x - a.point.x) * (c.point.y - a.point.y) - (c.point.x - a.point.x) * (b.point.y - a.point.y)
 
@@ -55,47 +90,61 @@ def diagonal_exist(vertex1, vertex2, face):
         else:
             return False
 
-    def diagonalize(a, b, face_queried):
+    def boundary_edges(face_queried):
         edge = face_queried.outer_component
         start = edge
-
         while True:
-            if edge.origin != a and edge.origin != b and edge.next.origin != a and edge.next.origin != b and intersect(
-                    a, b, edge.origin, edge.next.origin):
-                return False
-
+            yield edge
             edge = edge.next
             if edge == start:
                 break
 
-        return True
-
-    def in_cone(a, b, face_queried):
-        edge = face_queried.outer_component
-        start = edge
-        prev_vertex = a
-        next_vertex = a
-        while True:
-            if edge.next.origin == a:
-                prev_vertex = edge.origin
+    def diagonalize(a, b, face_queried):
+        scanned = 0
+        result = True
 
-            if edge.origin == a:
-                next_vertex = edge.next.origin
-            edge = edge.next
-            if edge == start:
+        for edge in boundary.edges if boundary is not None else boundary_edges(face_queried):
+            scanned += 1
+            if edge.origin != a and edge.origin != b and edge.next.origin != a and edge.next.origin != b and intersect(
+                    a, b, edge.origin, edge.next.origin):
+                result = False
                 break
 
+        if instrumentation.enabled:
+            instrumentation.increment('diagonal_exist_edges_scanned', scanned)
+        return result
+
+    def in_cone(a, b, face_queried):
+        if boundary is not None:
+            prev_vertex, next_vertex = boundary.prev(a), boundary.next(a)
+        else:
+            prev_vertex = a
+            next_vertex = a
+            scanned = 0
+            for edge in boundary_edges(face_queried):
+                scanned += 1
+                if edge.next.origin == a:
+                    prev_vertex = edge.origin
+
+                if edge.origin == a:
+                    next_vertex = edge.next.origin
+
+            if instrumentation.enabled:
+                instrumentation.increment('diagonal_exist_edges_scanned', scanned)
         if left_on(a, next_vertex, prev_vertex):
             return left(a, b, prev_vertex) and left(b, a, next_vertex)
         else:
             return not (left_on(a, b, next_vertex) and left_on(b, a, prev_vertex))
 
+    if instrumentation.enabled:
+        instrumentation.increment('diagonal_exist_calls')
     return in_cone(vertex1, vertex2, face) and in_cone(vertex2, vertex1, face) and diagonalize(vertex1, vertex2, face)
 
 
 class DCEL:
-    def __init__(self, n=None, vertices=None, half_edges=None, faces=None):
+    def __init__(self, n=None, vertices=None, half_edges=None, faces=None, holes=None, record_images=True):
         self.n = n if n else len(vertices)
+        self.record_images = record_images  # When False, plot_dcel does nothing so that the algorithms run at full speed
         if n is not None:
             self.vertices = []
             self.half_edges = []
@@ -111,11 +160,18 @@ class DCEL:
             self.images = []
             self.diagonals = []
 
+        self.holes = [list(hole) for hole in holes] if holes else []  # Vertex rings of the holes
+        self.rings = []  # Boundary rings, the outer boundary first and then the holes
+        self.ring_of = None  # Vertex -> index of its ring, with the union-find of the rings joined by diagonals
+        self.boundaries = {}  # Face -> cached FaceBoundary, dropped when the face changes
+        self.boundary_hits = 0
+        self.boundary_misses = 0
+
         self.create_polygon()
 
     def random_simple_polygon(self):
-        # Generate n random points
-        points = [Point(random.randint(-100, 100), random.randint(-100, 100)) for _ in range(self.n)]
+        # Generate n random points, continuous coordinates keep the points distinct with distinct y values
+        points = [Point(random.uniform(-100, 100), random.uniform(-100, 100)) for _ in range(self.n)]
 
         # Find centroid to sort the points by their polar angle relative to the centroid
         centroid_x = sum(p.x for p in points) / self.n
@@ -131,56 +187,272 @@ class DCEL:
         for p in points:
             self.vertices.append(Vertex(p))
 
+    def __reduce__(self):
+        # Pickle through the flat index arrays, the half-edge reference chains are too deep to pickle recursively
+        return DCEL.from_bytes, (self.to_bytes(), self.record_images)
+
+    def to_columns(self):
+        """
+        Flatten the vertex, half-edge and face tables into columns of integer indices and coordinates, one array per
+        column. The lists of incident half-edges and of inner components are stored one after another, with the offset
+        where the list of every row starts (and the total length at the end).
+        """
+        def index(item):
+            return item.id if item is not None else -1
+
+        x = array('d', (vertex.point.x for vertex in self.vertices))
+        y = array('d', (vertex.point.y for vertex in self.vertices))
+        color = array('i', (vertex.color if vertex.color is not None else -1 for vertex in self.vertices))
+        chain_val = array('i', (vertex.chain_val for vertex in self.vertices))
+        incident_offsets = array('i', [0])
+        incident = array('i')
+        for vertex in self.vertices:
+            incident.extend(edge.id for edge in vertex.incident_edge)
+            incident_offsets.append(len(incident))
+
+        origin = array('i', (index(edge.origin) for edge in self.half_edges))
+        twin = array('i', (index(edge.twin) for edge in self.half_edges))
+        next_edge = array('i', (index(edge.next) for edge in self.half_edges))
+        prev = array('i', (index(edge.prev) for edge in self.half_edges))
+        face = array('i', (index(edge.incident_face) for edge in self.half_edges))
+        helper = array('i', (index(edge.helper) for edge in self.half_edges))
+
+        outer = array('i', (index(f.outer_component) for f in self.faces))
+        inner_offsets = array('i', [0])
+        inner = array('i')
+        for f in self.faces:
+            inner.extend(edge.id for edge in f.inner_component)
+            inner_offsets.append(len(inner))
+
+        return {
+            'vertices': {'x': x, 'y': y, 'color': color, 'chain_val': chain_val, 'incident_offsets': incident_offsets,
+                         'incident': incident},
+            'half_edges': {'origin': origin, 'twin': twin, 'next': next_edge, 'prev': prev, 'face': face,
+                           'helper': helper},
+            'faces': {'outer': outer, 'inner_offsets': inner_offsets, 'inner': inner},
+        }
+
+    def to_bytes(self):
+        """
+        Flatten the DCEL into integer index arrays and coordinates in a compact binary form.
+        The plot images and the plotted diagonals are not kept.
+        """
+        columns = self.to_columns()
+        vertices, half_edges, faces = columns['vertices'], columns['half_edges'], columns['faces']
+        incident, inner = vertices['incident'], faces['inner']
+        arrays = list(vertices.values()) + list(half_edges.values()) + list(faces.values())
+        buffer = BytesIO()
+        buffer.write(SERIAL_HEADER.pack(SERIAL_MAGIC, self.n, len(self.vertices), len(self.half_edges),
+                                        len(self.faces), len(incident), len(inner)))
+        for values in arrays:
+            if sys.byteorder == 'big':
+                values.byteswap()
+            buffer.write(values.tobytes())
+        return buffer.getvalue()
+
+    @classmethod
+    def from_bytes(cls, data, record_images=False):
+        """
+        Rebuild a DCEL from the output of to_bytes in linear time. Nothing is plotted unless record_images is True, a
+        pickled DCEL keeps the setting it had.
+        """
+        magic, n, vertex_count, edge_count, face_count, incident_count, inner_count = SERIAL_HEADER.unpack_from(data)
+        if magic != SERIAL_MAGIC:
+            raise ValueError("The data is not a serialized DCEL.")
+
+        position = SERIAL_HEADER.size
+
+        def read(typecode, count):
+            nonlocal position
+            values = array(typecode)
+            values.frombytes(data[position:position + count * values.itemsize])
+            if sys.byteorder == 'big':
+                values.byteswap()
+            position += count * values.itemsize
+            return values
+
+        x, y = read('d', vertex_count), read('d', vertex_count)
+        color, chain_val = read('i', vertex_count), read('i', vertex_count)
+        incident_offsets, incident = read('i', vertex_count + 1), read('i', incident_count)
+        origin, twin, next_edge, prev, face, helper = (read('i', edge_count) for _ in range(6))
+        outer, inner_offsets, inner = read('i', face_count), read('i', face_count + 1), read('i', inner_count)
+        return cls.from_columns(n, {
+            'vertices': {'x': x, 'y': y, 'color': color, 'chain_val': chain_val, 'incident_offsets': incident_offsets,
+                         'incident': incident},
+            'half_edges': {'origin': origin, 'twin': twin, 'next': next_edge, 'prev': prev, 'face': face,
+                           'helper': helper},
+            'faces': {'outer': outer, 'inner_offsets': inner_offsets, 'inner': inner},
+        }, record_images)
+
+    @classmethod
+    def from_columns(cls, n, columns, record_images=False):
+        """
+        Rebuild a DCEL from the output of to_columns in linear time. The columns may be any sequences of numbers, e.g.
+        the memoryviews of SharedTables. Nothing is plotted unless record_images is True.
+        """
+        vertex_columns, edge_columns, face_columns = columns['vertices'], columns['half_edges'], columns['faces']
+        x, y, color, chain_val = (vertex_columns[name] for name in ('x', 'y', 'color', 'chain_val'))
+        incident_offsets, incident = vertex_columns['incident_offsets'], vertex_columns['incident']
+        origin, twin, next_edge, prev, face, helper = (edge_columns[name] for name in
+                                                       ('origin', 'twin', 'next', 'prev', 'face', 'helper'))
+        outer, inner_offsets, inner = face_columns['outer'], face_columns['inner_offsets'], face_columns['inner']
+        vertex_count, edge_count, face_count = len(x), len(origin), len(outer)
+
+        dcel = cls.__new__(cls)
+        dcel.n = n
+        dcel.images = []
+        dcel.diagonals = []
+        dcel.record_images = record_images
+        dcel.holes = []
+        dcel.rings = None  # Rebuilt from the boundary half-edges when needed
+        dcel.ring_of = None
+        dcel.boundaries = {}
+        dcel.boundary_hits = 0
+        dcel.boundary_misses = 0
+        dcel.vertices = [Vertex(Point(x[i], y[i])) for i in range(vertex_count)]
+        dcel.half_edges = [HalfEdge() for _ in range(edge_count)]
+        dcel.faces = [Face() for _ in range(face_count)]
+        vertices, half_edges, faces = dcel.vertices, dcel.half_edges, dcel.faces
+
+        for i, vertex in enumerate(vertices):
+            vertex.id = i
+            vertex.color = color[i] if color[i] >= 0 else None
+            vertex.chain_val = chain_val[i]
+            vertex.incident_edge = [half_edges[j] for j in incident[incident_offsets[i]:incident_offsets[i + 1]]]
+        for i, edge in enumerate(half_edges):
+            edge.id = i
+            edge.origin = vertices[origin[i]]
+            edge.twin = half_edges[twin[i]]
+            edge.next = half_edges[next_edge[i]]
+            edge.prev = half_edges[prev[i]]
+            edge.incident_face = faces[face[i]]
+            edge.helper = vertices[helper[i]] if helper[i] >= 0 else None
+        for i, f in enumerate(faces):
+            f.id = i
+            f.outer_component = half_edges[outer[i]] if outer[i] >= 0 else None
+            f.inner_component = [half_edges[j] for j in inner[inner_offsets[i]:inner_offsets[i + 1]]]
+        return dcel
+
+    def share(self):
+        """
+        Publish the columns of the DCEL in a shared memory segment, as table/column, e.g. half_edges/twin, for other
+        processes to attach to without copying. The caller owns the segment, use it as a context manager to unlink it.
+        """
+        from elements.SharedTables import SharedTables
+        columns = {'dcel/n': array('q', [self.n])}
+        for table, table_columns in self.to_columns().items():
+            for name, values in table_columns.items():
+                columns[f"{table}/{name}"] = values
+        return SharedTables.create(columns)
+
+    @classmethod
+    def from_shared(cls, tables, record_images=False):
+        """
+        Rebuild a DCEL from the SharedTables of share, in this or in another process. The columns are copied out of the
+        segment first, which is cheap next to building the objects, so the DCEL does not refer to the segment, which
+        can be closed afterwards. Stages that only read the columns can use the views of the tables instead.
+        """
+        columns = {table: {name: tables.copy(f"{table}/{name}") for name in tables.columns(f"{table}/")}
+                   for table in ('vertices', 'half_edges', 'faces')}
+        return cls.from_columns(tables.column('dcel/n')[0], columns, record_images)
+
+    def save(self, path):
+        """
+        Save the DCEL to a compact binary file.
+        """
+        with open(path, 'wb') as file:
+            file.write(self.to_bytes())
+
+    @classmethod
+    def load(cls, path, record_images=False):
+        """
+        Load a DCEL saved with save.
+        """
+        with open(path, 'rb') as file:
+            return cls.from_bytes(file.read(), record_images)
+
     def get_vertices(self):
         return [(p.point.x, p.point.y) for p in self.vertices]
 
     def get_vertices_of_face(self, face: Face):
         """
         Get the vertices in a face in the order they appear along the boundary.
+        The list belongs to the boundary cache and must not be modified.
         """
-        vertices = []
-        edge = face.outer_component
-        start = edge
-
-        while True:
-            vertices.append(edge.origin)
-            edge = edge.next
-            if edge == start:
-                break
-
-        return vertices
+        return self.get_face_boundary(face).vertices
 
     def are_vertices_in_same_face(self, v1: Vertex, v2: Vertex, face: Face):
         """
         Check if two vertices belong to the same face.
         """
-        vertices = self.get_vertices_of_face(face)
-        return v1 in vertices and v2 in vertices
+        boundary = self.get_face_boundary(face)
+        return v1 in boundary and v2 in boundary
 
-    def calculate_area(self):
-        # Using the Shoelace Theorem to calculate area
-        n = len(self.vertices)
-        area = 0
-        for i in range(n):
-            x1, y1 = self.vertices[i].point.x, self.vertices[i].point.y
-            x2, y2 = self.vertices[(i + 1) % n].point.x, self.vertices[
-                (i + 1) % n].point.y  # Closing the polygon by wrapping
-            area += (x1 * y2) - (x2 * y1)
-        return abs(area) / 2
+    def get_face_boundary(self, face: Face):
+        """
+        Get the cached boundary of a face, it is walked again only on the first query after the face has changed.
+        """
+        boundary = self.boundaries.get(face)
+        if boundary is None:
+            boundary = self.boundaries[face] = FaceBoundary(face)
+            self.boundary_misses += 1
+            if instrumentation.enabled:
+                instrumentation.increment('face_boundary_misses')
+        else:
+            self.boundary_hits += 1
+            if instrumentation.enabled:
+                instrumentation.increment('face_boundary_hits')
+        return boundary
 
-    def create_polygon(self):
-        n = len(self.vertices)
-        if n < 3:
-            raise ValueError("A polygon must have at least 3 vertices.")
+    def invalidate_faces(self, *faces):
+        """
+        Drop the cached boundaries of the given faces, or of every face when none are given. Anything that rewires the
+        half-edges of a face outside of the methods of the DCEL has to call it.
+        """
+        if not faces:
+            self.boundaries.clear()
+        for face in faces:
+            self.boundaries.pop(face, None)
+
+    def boundary_cache_stats(self):
+        """ The hits and misses of the face boundary cache """
+        queries = self.boundary_hits + self.boundary_misses
+        return {'hits': self.boundary_hits, 'misses': self.boundary_misses,
+                'hit_rate': self.boundary_hits / queries if queries else 0.0, 'cached_faces': len(self.boundaries)}
 
-        unbounded_face = Face()
-        self.faces.append(unbounded_face)
+    def calculate_area(self):
+        # Using the Shoelace Theorem to calculate area, the holes are subtracted from the outer boundaries
+        # The outer boundaries are counter-clockwise and the holes clockwise, so their signed areas add up
+        return sum(signed_area(ring) for ring in self.get_rings())
+
+    def count_polygons(self):
+        """ The number of disjoint polygons and the number of holes, from the orientation of the boundary rings """
+        rings = self.get_rings()
+        polygons = sum(1 for ring in rings if signed_area(ring) > 0)
+        return polygons, len(rings) - polygons
 
-        # Create a face for the polygon
-        face = Face()
+    def add_face(self, face: Face):
+        """
+        Append a face to the DCEL. The ID of a face is its index in the face list.
+        """
+        face.id = len(self.faces)
         self.faces.append(face)
+        return face
 
-        # Create half-edges
+    def add_half_edge(self, half_edge: HalfEdge):
+        """
+        Append a half-edge to the DCEL. The ID of a half-edge is its index in the half-edge list.
+        """
+        half_edge.id = len(self.half_edges)
+        self.half_edges.append(half_edge)
+        return half_edge
+
+    def create_ring(self, ring, face, outside_face):
+        """
+        Create the half-edges of one boundary ring. The half-edges that follow the ring order bound the given face and
+        their twins bound the outside face. Returns the first half-edge and the first twin half-edge of the ring.
+        """
+        n = len(ring)
         half_edges = [HalfEdge() for _ in range(n)]
         twin_half_edges = [HalfEdge() for _ in range(n)]
 
@@ -190,67 +462,169 @@ class DCEL:
             prev_index = (i - 1 + n) % n
 
             # Current edge
-            half_edges[i].origin = self.vertices[i]
+            half_edges[i].origin = ring[i]
             half_edges[i].next = half_edges[next_index]
             half_edges[i].prev = half_edges[prev_index]
             half_edges[i].incident_face = face
-            self.vertices[i].incident_edge.append(half_edges[i])
+            ring[i].incident_edge.append(half_edges[i])
 
             # Twin edge (opposite direction)
-            twin_half_edges[i].origin = self.vertices[(n - i) % n]
+            twin_half_edges[i].origin = ring[(n - i) % n]
             twin_half_edges[i].next = twin_half_edges[next_index]
             twin_half_edges[i].prev = twin_half_edges[prev_index]
-            twin_half_edges[i].incident_face = unbounded_face  # No face, these are outside the polygon
+            twin_half_edges[i].incident_face = outside_face  # No face, these are outside the polygon
             half_edges[i].twin = twin_half_edges[n - i - 1]
             twin_half_edges[n - i - 1].twin = half_edges[i]
 
-        # Connect the face to one of its outer components
-        face.outer_component = half_edges[0]
-        unbounded_face.inner_component = [twin_half_edges[0]]
-
         # Add half-edges to the DCEL
-        self.half_edges.extend(half_edges)
-        self.half_edges.extend(twin_half_edges)
+        for half_edge in half_edges + twin_half_edges:
+            self.add_half_edge(half_edge)
 
-    def display_dcel(self):
-        # Display vertices
-        print("Vertices:")
-        vertex_table = []
-        for vertex in self.vertices:
-            incident_edges = [edge.id for edge in vertex.incident_edge] if vertex.incident_edge else []
-            incident_edges_str = ', '.join(map(str, incident_edges)) if isinstance(incident_edges, list) else "None"
-            vertex_table.append([vertex.id, f"({vertex.point.x}, {vertex.point.y})", incident_edges_str])
-        print(tabulate(vertex_table, headers=["Vertex ID", "Coordinates", "Incident Edge ID"], tablefmt="grid"))
-
-        # Display half-edges
-        print("\nHalfEdges:")
-        half_edge_table = []
-        for edge in self.half_edges:
-            half_edge_table.append(
-                [edge.id, edge.origin.id, edge.twin.id if edge.twin else "None", edge.next.id if edge.next else "None",
-                 edge.prev.id if edge.prev else "None", edge.incident_face.id if edge.incident_face else "None",
-                 edge.helper.id if edge.helper else "None"])
-        print(tabulate(half_edge_table,
-                       headers=["Half-Edge ID", "Origin Vertex", "Twin Edge ID", "Next Edge ID", "Previous Edge ID",
-                                "Incident Face ID", "Edge Helper"], tablefmt="grid"))
-
-        # Display faces
-        print("\nFaces:")
-        face_table = []
-        for face in self.faces:
-            outer = face.outer_component.id if face.outer_component else "None"
-            inner = [he.id for he in face.inner_component] if face.inner_component else "None"
-            # Convert the list of inner component half-edges to a string for display
-            inner_str = ', '.join(map(str, inner)) if isinstance(inner, list) else "None"
-            face_table.append([face.id, outer, inner_str])
-        print(tabulate(face_table, headers=["Face ID", "Outer Component Half-Edge ID", "Inner Component Half-Edge IDs"],
-                       tablefmt="grid"))
+        return half_edges[0], twin_half_edges[0]
+
+    def create_polygon(self):
+        """
+        Build the half-edges and faces of the polygon. The outer boundary is given counter-clockwise, every hole is a
+        separate ring that is reversed if it is not clockwise, so that the interior always lies to the left of the
+        half-edges. The holes become inner components of the polygon face.
+        """
+        self.create_polygons([(list(self.vertices), self.holes)])
 
+    @classmethod
+    def from_polygons(cls, polygons, holes=None, record_images=True):
+        """
+        Build one DCEL from several disjoint polygons, given as vertex rings in counter-clockwise order, and optionally
+        the list of hole rings of every polygon. Polygon i becomes face i + 1 and its vertices, the outer boundary and
+        then its holes, follow the vertices of the polygons before it.
+        """
+        holes = holes if holes else [[] for _ in polygons]
+        if len(holes) != len(polygons):
+            raise ValueError("There must be one list of holes for every polygon.")
+        dcel = cls.__new__(cls)
+        dcel.n = sum(len(polygon) for polygon in polygons)
+        dcel.record_images = record_images
+        dcel.vertices = []
+        dcel.half_edges = []
+        dcel.faces = []
+        dcel.images = []
+        dcel.diagonals = []
+        dcel.holes = []
+        dcel.rings = []
+        dcel.ring_of = None
+        dcel.boundaries = {}
+        dcel.boundary_hits = 0
+        dcel.boundary_misses = 0
+        components = []
+        for polygon, polygon_holes in zip(polygons, holes):
+            polygon_holes = [list(hole) for hole in polygon_holes]
+            dcel.holes.extend(polygon_holes)
+            components.append((list(polygon), polygon_holes))
+        dcel.create_polygons(components)
+        return dcel
+
+    @instrumentation.timed('construction')
+    def create_polygons(self, components):
+        """
+        Build the half-edges and faces of one or more disjoint polygons, given as pairs of an outer boundary and a list
+        of holes. Every polygon gets a face of its own, in order after the unbounded face, and the rings are kept in
+        the same order: the outer boundary of every polygon followed by its holes.
+        """
+        vertices = []
+        self.rings = []
+        for outer, holes in components:
+            if len(outer) < 3:
+                raise ValueError("A polygon must have at least 3 vertices.")
+            self.rings.append(outer)
+            vertices.extend(outer)
+            for hole in holes:
+                if len(hole) < 3:
+                    raise ValueError("A hole must have at least 3 vertices.")
+                if signed_area(hole) > 0:
+                    hole.reverse()
+                self.rings.append(hole)
+                vertices.extend(hole)
+        self.vertices[:] = vertices
+
+        # Vertex IDs are local to the DCEL, so that several polygons can be processed one after another
+        for i, vertex in enumerate(self.vertices):
+            vertex.id = i
+
+        unbounded_face = self.add_face(Face())
+
+        # Create a face for every polygon
+        faces = [self.add_face(Face()) for _ in components]
+
+        # Connect every face to one of its outer components and to one half-edge of every hole
+        rings = iter(self.rings)
+        for face, (_, holes) in zip(faces, components):
+            face.outer_component, outer_twin = self.create_ring(next(rings), face, unbounded_face)
+            unbounded_face.inner_component.append(outer_twin)
+            for _ in holes:
+                hole_edge, hole_twin = self.create_ring(next(rings), face, unbounded_face)
+                face.inner_component.append(hole_edge)
+                unbounded_face.inner_component.append(hole_twin)
+
+    def display_dcel(self, mode='full', rows=5, page=0):
+        """
+        Prints the tables of the vertices, half-edges and faces. With mode='summary' only the counts and the first and
+        last rows of every table are printed, with mode='page' the rows of the given page of every table.
+        """
+        if mode not in ('full', 'summary', 'page'):
+            raise ValueError(f"Unknown mode {mode}, expected 'full', 'summary' or 'page'.")
+        from elements import Visualization
+        Visualization.display_dcel(self, mode, rows, page)
+
+    def summary(self):
+        """
+        Aggregate counts of the DCEL in O(n) time: the vertices, half-edges, faces, triangles, boundary edges,
+        diagonals, polygons and holes, and the bounding box of the vertices.
+        """
+        outside = self.faces[0] if self.faces else None
+        boundary = sum(1 for edge in self.half_edges if edge.incident_face is outside)
+        triangles = 0
+        for face in self.faces[1:]:
+            edge = face.outer_component
+            if edge is not None and edge.next.next.next is edge:
+                triangles += 1
+        polygons, holes = self.count_polygons() if outside else (0, 0)
+        xs = [vertex.point.x for vertex in self.vertices]
+        ys = [vertex.point.y for vertex in self.vertices]
+        return {
+            'vertices': len(self.vertices),
+            'half_edges': len(self.half_edges),
+            'faces': len(self.faces),
+            'triangles': triangles,
+            'boundary_edges': boundary,
+            'diagonals': (len(self.half_edges) - 2 * boundary) // 2,
+            'polygons': polygons,
+            'holes': holes,
+            'bounding_box': (min(xs), min(ys), max(xs), max(ys)) if xs else None,
+        }
+
+    def export(self, path, format='npz', compress=False):
+        """
+        Write the vertex, half-edge and face tables as columns, to one .npz archive with format='npz' or to a directory
+        of CSV files with format='csv'. The rows are written in chunks, so that large DCELs are exported quickly.
+        """
+        from elements import TableExport
+        if format == 'npz':
+            return TableExport.export_npz(self, path, compress)
+        if format == 'csv':
+            return TableExport.export_csv(self, path)
+        raise ValueError(f"Unknown format {format}, expected 'npz' or 'csv'.")
+
+    @instrumentation.timed('add_diagonal')
     def add_diagonal(self, v1, v2):
         """
         Add a diagonal between vertices v1 and v2, updating the DCEL structure.
-        This results in the creation of a new face and updating the half-edges and vertices.
+        A diagonal between two vertices of the same boundary splits the face in two and creates a new face.
+        A diagonal between the outer boundary and a hole, or between two holes, joins both boundaries into one
+        and no new face is created. Joining is told apart from splitting by the union-find of the rings, so only the
+        boundary of a new face is walked.
         """
+        if instrumentation.enabled:
+            instrumentation.increment('diagonals_added')
+
         # Step 1: Create two new half-edges for the diagonal
         half_edge_1 = HalfEdge(origin=v1)
         half_edge_2 = HalfEdge(origin=v2)
@@ -260,12 +634,16 @@ class DCEL:
         half_edge_2.twin = half_edge_1
 
         # Step 2: Locate the half-edges around v1 and v2 that will be affected
-        # These edges should correspond to the same incident face
-        # These half-edges are part of the existing face that will be split
-        find_common_incident_edges = lambda v1, v2: next(
-            ((e1, e2) for e1 in v1.incident_edge for e2 in v2.incident_edge if
-             e1.incident_face.id == e2.incident_face.id), (None, None))
-        incident_edge_v1, incident_edge_v2 = find_common_incident_edges(v1, v2)
+        # These half-edges are part of the existing face that will be split, they leave v1 and v2 in the corner of
+        # the face that contains the diagonal (a vertex can appear more than once on a face that has holes)
+        incident_edge_v1 = self.find_incident_edge(v1, v2)
+        incident_edge_v2 = self.find_incident_edge(v2, v1)
+        old_face = incident_edge_v1.incident_face
+        self.invalidate_faces(old_face)
+        joins = False  # Only a face with holes has more than one boundary to join
+        if old_face.inner_component:
+            ring_1, ring_2 = self.find_ring(v1), self.find_ring(v2)
+            joins = ring_1 != ring_2
 
         # Step 3: Adjust next and prev pointers for the new diagonal edges
         # Find the half-edges that come before and after the new diagonal in the face loop
@@ -282,135 +660,316 @@ class DCEL:
         half_edge_1.prev.next = half_edge_1
         half_edge_2.prev.next = half_edge_2
 
-        # Step 4: Create the new face
-        new_face = Face(outer_component=half_edge_2)
-        self.faces[incident_edge_v2.incident_face.id].outer_component = half_edge_1
-        self.faces.append(new_face)
-
-        # Step 5: Update the incident face for the new diagonal half-edges
-        half_edge_2.incident_face = new_face
-        half_edge_1.incident_face = self.faces[incident_edge_v2.incident_face.id]
-
-        # Update all affected half-edges incident face for the old face
-        current_edge = half_edge_2.next
-        while current_edge != half_edge_2:
-            current_edge.incident_face = half_edge_2.incident_face
-            current_edge = current_edge.next
-
-        # Step 7: Add the new half-edges to the DCEL
-        self.half_edges.append(half_edge_1)
-        self.half_edges.append(half_edge_2)
+        # Step 4: Add the new half-edges to the DCEL
+        self.add_half_edge(half_edge_1)
+        self.add_half_edge(half_edge_2)
 
         v1.incident_edge.append(half_edge_1)
         v2.incident_edge.append(half_edge_2)
 
-    def plot_dcel(self, sweep_line_y=None, current_vertex_id=None, helper_vertex_id=None, left_edge_id=None,
-                  add_diagonal=False, start=None, end=None):
-        """
-        Plots the DCEL with vertex and half-edge annotations.
-        Vertices are annotated with their coordinates, and half-edges are annotated with their IDs.
-        Handles small edges by adjusting the placement of annotations to avoid overlap.
-        """
-        plt.figure(figsize=(8, 8))
-
-        if sweep_line_y is not None:
-            # Plot the sweep line
-            plt.axhline(y=sweep_line_y, color='r', label='Sweep Line')
-
-        # Plot vertices and annotate them
-        for vertex in self.vertices:
-            if current_vertex_id is not None:
-                if vertex.id == current_vertex_id:
-                    plt.plot(vertex.point.x, vertex.point.y, 'ro')
-                    plt.text(vertex.point.x, vertex.point.y, f"V{vertex.id}", fontsize=9, ha='right')
-                else:
-                    if helper_vertex_id is not None:
-                        if vertex.id == helper_vertex_id:
-                            plt.plot(vertex.point.x, vertex.point.y, 'go')
-                            plt.text(vertex.point.x, vertex.point.y, f"V{vertex.id}", fontsize=9, ha='right')
-                        else:
-                            plt.plot(vertex.point.x, vertex.point.y, 'bo')
-                            plt.text(vertex.point.x, vertex.point.y, f"V{vertex.id}", fontsize=9, ha='right')
-                    else:
-                        plt.plot(vertex.point.x, vertex.point.y, 'bo')
-                        plt.text(vertex.point.x, vertex.point.y, f"V{vertex.id}", fontsize=9, ha='right')
+        half_edge_1.incident_face = old_face
+        half_edge_2.incident_face = old_face
+
+        if joins:
+            # Step 5: The diagonal joined two boundaries of the face, the holes on the joined boundary are no longer
+            # separate inner components
+            self.join_rings(old_face, ring_1, ring_2, half_edge_1)
+            return
+
+        # Step 5: Create the new face
+        if old_face.inner_component:
+            new_face_edge = half_edge_2
+            new_face_cycle = cycle_2 = self.get_cycle(half_edge_2)
+            cycle_1 = self.get_cycle(half_edge_1)
+            split_edges = set(cycle_1) | set(cycle_2)
+            if old_face.outer_component not in split_edges:
+                # A hole boundary was split, the counter-clockwise part bounds the new face and the other part
+                # stays a hole of the old face
+                if signed_area([edge.origin for edge in cycle_2]) < 0:
+                    new_face_edge, new_face_cycle = half_edge_1, cycle_1
+                old_face.inner_component = [edge for edge in old_face.inner_component if edge not in split_edges]
+                old_face.inner_component.append(new_face_edge.twin)
+                self.ring_of = None
             else:
-                plt.plot(vertex.point.x, vertex.point.y, 'bo')  # Plot vertex as a blue dot
-                plt.text(vertex.point.x, vertex.point.y, f"V{vertex.id}", fontsize=9, ha='right')
-
-        # Plot edges and annotate half-edges at 1/3rd and 2/3rd points
-        for half_edge in self.half_edges:
-            origin = self.vertices[half_edge.origin.id]
-            destination = self.vertices[half_edge.next.origin.id]
-
-            if left_edge_id is not None:
-                if half_edge.id == left_edge_id or half_edge.twin.id == left_edge_id:
-                    plt.plot([origin.point.x, destination.point.x], [origin.point.y, destination.point.y], 'g-')
-                else:
-                    plt.plot([origin.point.x, destination.point.x], [origin.point.y, destination.point.y], 'k-')
-            else:
-                plt.plot([origin.point.x, destination.point.x], [origin.point.y, destination.point.y], 'k-')
-
-        if add_diagonal:
-            self.diagonals.append((start, end))
-
-        for start, end in self.diagonals:
-            plt.plot([start.point.x, end.point.x], [start.point.y, end.point.y], 'g-')
-
-        # Set equal scaling and remove axis for better visualization
-        plt.axis('equal')
-        plt.grid(False)
-        plt.gca().set_axis_off()  # Hide axes
+                old_face.outer_component = half_edge_1
 
-        # Save the plot to a BytesIO object
-        buf = BytesIO()
-        plt.savefig(buf, format='png', bbox_inches='tight', pad_inches=0.1)  # Save the figure to the buffer
-        buf.seek(0)  # Move the buffer cursor to the beginning
+        else:
+            # The smaller part becomes the new face, so that splitting a face costs as much as its smaller part
+            new_face_edge, new_face_cycle = self.shorter_cycle(half_edge_2, half_edge_1)
+            old_face.outer_component = new_face_edge.twin
 
-        # Load the image from the buffer
-        image = Image.open(buf)
-        self.images.append(image)  # Store the image in self.images
+        new_face = self.add_face(Face(outer_component=new_face_edge))
 
-        plt.close()
+        # Update all affected half-edges incident face for the old face
+        for current_edge in new_face_cycle:
+            current_edge.incident_face = new_face
+        if instrumentation.enabled:
+            instrumentation.increment('faces_split')
+            instrumentation.increment('half_edges_relabeled', len(new_face_cycle))
+            instrumentation.observe_max('half_edges_relabeled_per_diagonal', len(new_face_cycle))
 
-    def animate_complete_triangulation(self):
-        fig = plt.figure()
-        plt.axis('off')
+        if old_face.inner_component:
+            self.move_enclosed_holes(old_face, new_face, [edge.origin for edge in new_face_cycle])
 
-        ims = []
-        for image in self.images:
-            im = plt.imshow(image, animated=True)
-            ims.append([im])
+    def find_ring(self, vertex):
+        """
+        The label of the boundary of the vertex: the root of its ring in the union-find of the rings that diagonals
+        have joined. In a planar subdivision the boundaries of one face belong to different connected parts, so two
+        vertices of a face are on the same boundary exactly when their rings have the same root. The labels are built
+        in O(n) time when first needed, or after an edit of the boundary, and add_diagonal keeps them up to date.
+        """
+        if self.ring_of is None:
+            rings = self.get_rings()
+            self.ring_of = {v: i for i, ring in enumerate(rings) for v in ring}
+            self.ring_parent = list(range(len(rings)))
+            for edge in self.half_edges:
+                ring_1, ring_2 = self.find_ring(edge.origin), self.find_ring(edge.twin.origin)
+                if ring_1 != ring_2:
+                    self.ring_parent[ring_1] = ring_2
+            # The half-edge that stands for every hole boundary in the inner components of its face
+            self.ring_components = {self.find_ring(edge.origin): edge for face in self.faces[1:]
+                                    for edge in face.inner_component}
+
+        ring = self.ring_of[vertex]
+        parent = self.ring_parent
+        while parent[ring] != ring:
+            parent[ring] = parent[parent[ring]]
+            ring = parent[ring]
+        return ring
+
+    def join_rings(self, face, ring_1, ring_2, half_edge):
+        """
+        Record that a diagonal, of which the given half-edge is one side, joined two boundaries of the face. The joined
+        boundary is a hole only if both boundaries were holes.
+        """
+        holes = 0
+        for ring in (ring_1, ring_2):
+            edge = self.ring_components.pop(ring, None)
+            if edge is not None:
+                face.inner_component.remove(edge)
+                holes += 1
+        self.ring_parent[ring_1] = ring_2
+        if holes == 2:
+            face.inner_component.append(half_edge)
+            self.ring_components[ring_2] = half_edge
+
+    def find_incident_edge(self, vertex, target):
+        """
+        Find the half-edge leaving the vertex whose incident face contains the direction towards the target vertex.
+        """
+        if len(vertex.incident_edge) == 1:
+            return vertex.incident_edge[0]
+        for edge in vertex.incident_edge:
+            if in_wedge(edge, target):
+                return edge
+        # Fall back to any half-edge that shares a face with the target
+        return next((e1 for e1 in vertex.incident_edge for e2 in target.incident_edge if
+                     e1.incident_face == e2.incident_face), vertex.incident_edge[0])
+
+    def get_cycle(self, start):
+        """
+        Get the half-edges of the boundary cycle that contains the given half-edge.
+        """
+        cycle = []
+        edge = start
+        while True:
+            cycle.append(edge)
+            edge = edge.next
+            if edge == start:
+                break
+        return cycle
 
-        ani = animation.ArtistAnimation(fig, ims, interval=500, blit=True, repeat_delay=1000)
-        ani.save('complete_triangulation.mp4', writer='ffmpeg')
+    def shorter_cycle(self, edge_1, edge_2):
+        """
+        Walk the boundary cycles of two half-edges in step until one of them closes. Returns that half-edge and its
+        cycle, the first one if both have the same length.
+        """
+        cycle_1, cycle_2 = [edge_1], [edge_2]
+        next_1, next_2 = edge_1.next, edge_2.next
+        while next_1 is not edge_1 and next_2 is not edge_2:
+            cycle_1.append(next_1)
+            cycle_2.append(next_2)
+            next_1, next_2 = next_1.next, next_2.next
+        if next_1 is edge_1:
+            return edge_1, cycle_1
+        return edge_2, cycle_2
+
+    def move_enclosed_holes(self, old_face, new_face, boundary):
+        """
+        Move the holes of the old face that lie inside the boundary of the new face to the new face.
+        """
+        def inside(point):
+            # Ray casting towards positive x
+            result = False
+            n = len(boundary)
+            for i in range(n):
+                p, q = boundary[i].point, boundary[(i + 1) % n].point
+                if (p.y > point.y) != (q.y > point.y):
+                    if point.x < p.x + (point.y - p.y) * (q.x - p.x) / (q.y - p.y):
+                        result = not result
+            return result
+
+        remaining = []
+        for hole_edge in old_face.inner_component:
+            if inside(hole_edge.origin.point):
+                new_face.inner_component.append(hole_edge)
+                for edge in self.get_cycle(hole_edge):
+                    edge.incident_face = new_face
+            else:
+                remaining.append(hole_edge)
+        old_face.inner_component = remaining
 
-        plt.close(fig)
+    def get_rings(self):
+        """
+        Get the boundary rings, the outer boundary of every polygon followed by its holes. They are rebuilt from the
+        boundary half-edges when an edit of the polygon has invalidated them.
+        """
+        if self.rings is None:
+            self.rings = []
+            for twin_edge in self.faces[0].inner_component:
+                ring = [edge.twin.origin for edge in self.get_cycle(twin_edge)]
+                ring.reverse()
+                self.rings.append(ring)
+        return self.rings
+
+    def remove_diagonal(self, half_edge):
+        """
+        Remove a diagonal from the DCEL, the two different faces on either side of it are joined into the face of
+        the given half-edge. Returns the joined face.
+        """
+        twin = half_edge.twin
+        face = half_edge.incident_face
+        removed_face = twin.incident_face
+        self.invalidate_faces(face, removed_face)
+        if self.ring_of is not None and self.ring_of[half_edge.origin] != self.ring_of[twin.origin]:
+            self.ring_of = None  # The diagonal may have been the only one between two rings
+
+        for edge in self.get_cycle(twin):
+            edge.incident_face = face
+
+        half_edge.prev.next = twin.next
+        twin.next.prev = half_edge.prev
+        twin.prev.next = half_edge.next
+        half_edge.next.prev = twin.prev
+
+        face.outer_component = half_edge.next
+        half_edge.origin.incident_edge.remove(half_edge)
+        twin.origin.incident_edge.remove(twin)
+
+        self._remove_half_edge(half_edge)
+        self._remove_half_edge(twin)
+        self._remove_face(removed_face)
+        return face
+
+    def split_edge(self, half_edge, vertex):
+        """
+        Insert a new vertex in the middle of a boundary edge. The given half-edge, which lies inside the polygon, is
+        shortened to end at the vertex and a new half-edge continues from the vertex to its old destination.
+        """
+        twin = half_edge.twin
+        self.invalidate_faces(half_edge.incident_face, twin.incident_face)
+        vertex.id = len(self.vertices)
+        self.vertices.append(vertex)
+
+        new_edge = HalfEdge(origin=vertex, incident_face=half_edge.incident_face)
+        new_twin = HalfEdge(origin=vertex, incident_face=twin.incident_face)
+
+        new_edge.next = half_edge.next
+        new_edge.prev = half_edge
+        half_edge.next.prev = new_edge
+        half_edge.next = new_edge
+
+        new_twin.next = twin.next
+        new_twin.prev = twin
+        twin.next.prev = new_twin
+        twin.next = new_twin
+
+        # The old twin now runs from the old destination to the vertex, the new twin from the vertex to the origin
+        half_edge.twin = new_twin
+        new_twin.twin = half_edge
+        new_edge.twin = twin
+        twin.twin = new_edge
+
+        vertex.incident_edge.append(new_edge)
+        self.add_half_edge(new_edge)
+        self.add_half_edge(new_twin)
+        self.rings = None
+        self.ring_of = None
+        return new_edge
+
+    def remove_boundary_vertex(self, vertex):
+        """
+        Remove a vertex of degree two from the boundary, its two edges are replaced by a single edge between its
+        neighbours. The vertex must not have any diagonals.
+        """
+        out_edge = vertex.incident_edge[0]
+        out_twin = out_edge.twin
+        in_twin = out_twin.next
+        in_edge = in_twin.twin
+        self.invalidate_faces(out_edge.incident_face, in_twin.incident_face)
+
+        # The incoming edge now reaches the next vertex, the twin of the outgoing edge now reaches the previous one
+        in_edge.next = out_edge.next
+        out_edge.next.prev = in_edge
+        out_twin.next = in_twin.next
+        in_twin.next.prev = out_twin
+        in_edge.twin = out_twin
+        out_twin.twin = in_edge
+
+        for face, component in ((out_edge.incident_face, out_edge), (in_twin.incident_face, in_twin)):
+            if face.outer_component is component:
+                face.outer_component = component.prev
+            face.inner_component = [edge.prev if edge is component else edge for edge in face.inner_component]
+
+        self._remove_half_edge(out_edge)
+        self._remove_half_edge(in_twin)
+        self._remove_vertex(vertex)
+        self.rings = None
+        self.ring_of = None
+
+    def _remove_face(self, face):
+        """ Remove a face by moving the last face into its slot, so that IDs stay equal to indices """
+        last = self.faces.pop()
+        if last is not face:
+            last.id = face.id
+            self.faces[face.id] = last
+
+    def _remove_half_edge(self, half_edge):
+        """ Remove a half-edge by moving the last half-edge into its slot, so that IDs stay equal to indices """
+        last = self.half_edges.pop()
+        if last is not half_edge:
+            last.id = half_edge.id
+            self.half_edges[half_edge.id] = last
+
+    def _remove_vertex(self, vertex):
+        """ Remove a vertex by moving the last vertex into its slot, so that IDs stay equal to indices """
+        last = self.vertices.pop()
+        if last is not vertex:
+            last.id = vertex.id
+            self.vertices[vertex.id] = last
 
-    def plot_dcel_polygon(self):
+    def plot_dcel(self, sweep_line_y=None, current_vertex_id=None, helper_vertex_id=None, left_edge_id=None,
+                  add_diagonal=False, start=None, end=None):
         """
         Plots the DCEL with vertex and half-edge annotations.
         Vertices are annotated with their coordinates, and half-edges are annotated with their IDs.
         Handles small edges by adjusting the placement of annotations to avoid overlap.
+        Nothing is plotted when the DCEL was created with record_images=False.
         """
-        plt.figure(figsize=(8, 8))
+        if not self.record_images:
+            return
+        from elements import Visualization
+        with instrumentation.phase('plot'):
+            Visualization.plot_dcel_step(self, sweep_line_y, current_vertex_id, helper_vertex_id, left_edge_id,
+                                         add_diagonal, start, end)
 
-        # Plot vertices and annotate them
-        for vertex in self.vertices:
-            plt.plot(vertex.point.x, vertex.point.y, 'bo')  # Plot vertex as a blue dot
-            plt.text(vertex.point.x, vertex.point.y, f"V{vertex.id}", fontsize=9, ha='right')
-
-        # Plot edges and annotate half-edges at 1/3rd and 2/3rd points
-        for half_edge in self.half_edges:
-            origin = self.vertices[half_edge.origin.id]
-            destination = self.vertices[half_edge.next.origin.id]
-
-            # Plot the edge between origin and destination
-            plt.plot([origin.point.x, destination.point.x], [origin.point.y, destination.point.y], 'k-')
-
-            # Calculate the 1/3rd and 2/3rd points of the edge
-        # Set equal scaling and remove axis for better visualization
-        plt.axis('equal')
-        plt.grid(False)
-        plt.gca().set_axis_off()  # Hide axes
-        plt.show()
+    def animate_complete_triangulation(self):
+        from elements import Visualization
+        Visualization.animate_complete_triangulation(self)
+
+    def plot_dcel_polygon(self):
+        """
+        Plots the DCEL with vertex annotations and shows the figure.
+        """
+        from elements import Visualization
+        Visualization.plot_dcel_polygon(self)
@@ -0,0 +1,36 @@
+# Group ID 14 (21114021 & 21114078) - Ashutosh Kumar and Raiwat Bapat
+# Date: October 19 2026
+# FaceBoundary.py : Contains the cached boundary of a face of the Doubly Connected Edge List (DCEL) data structure.
+
+class FaceBoundary:
+    """
+    The half-edges and vertices along the outer boundary of a face, starting at its outer component, with the position
+    of every vertex for constant time membership and neighbour queries. The DCEL drops it when the face changes.
+    """
+
+    def __init__(self, face):
+        self.edges = []
+        edge = start = face.outer_component
+        while True:
+            self.edges.append(edge)
+            edge = edge.next
+            if edge is start:
+                break
+        self.vertices = [edge.origin for edge in self.edges]
+        self.position = {}  # Vertex -> index of its first appearance along the boundary
+        for i, vertex in enumerate(self.vertices):
+            self.position.setdefault(vertex, i)
+
+    def __contains__(self, vertex):
+        return vertex in self.position
+
+    def __len__(self):
+        return len(self.vertices)
+
+    def prev(self, vertex):
+        """ The vertex before the given one along the boundary """
+        return self.vertices[self.position[vertex] - 1]
+
+    def next(self, vertex):
+        """ The vertex after the given one along the boundary """
+        return self.vertices[(self.position[vertex] + 1) % len(self.vertices)]
@@ -0,0 +1,91 @@
+# Group ID 14 (21114021 & 21114078) - Ashutosh Kumar and Raiwat Bapat
+# Date: October 19 2026
+# Geometry.py : Contains the geometric predicates on Point objects shared by the algorithms.
+
+
+def cross(o, a, b):
+    """ Twice the signed area of the triangle (o, a, b), positive when the triangle is counter-clockwise """
+    return (a.x - o.x) * (b.y - o.y) - (a.y - o.y) * (b.x - o.x)
+
+
+def turns_left(o, a, b, epsilon=1e-12):
+    """
+    Checks if (o, a, b) is a strict counter-clockwise turn. A cross product within the rounding error of the
+    coordinates, relative to the lengths of oa and ob, counts as collinear, so nearly collinear points are rejected.
+    """
+    scale = (abs(a.x - o.x) + abs(a.y - o.y)) * (abs(b.x - o.x) + abs(b.y - o.y))
+    return cross(o, a, b) > epsilon * scale
+
+
+def on_segment(p, q, r):
+    """ Checks if the point r lies on the closed segment pq """
+    if cross(p, q, r) != 0:
+        return False
+    return min(p.x, q.x) <= r.x <= max(p.x, q.x) and min(p.y, q.y) <= r.y <= max(p.y, q.y)
+
+
+def segments_intersect(p1, p2, q1, q2):
+    """ Checks if the closed segments p1p2 and q1q2 share at least one point """
+    d1 = cross(q1, q2, p1)
+    d2 = cross(q1, q2, p2)
+    d3 = cross(p1, p2, q1)
+    d4 = cross(p1, p2, q2)
+    if ((d1 > 0 > d2) or (d1 < 0 < d2)) and ((d3 > 0 > d4) or (d3 < 0 < d4)):
+        return True
+    return on_segment(q1, q2, p1) or on_segment(q1, q2, p2) or on_segment(p1, p2, q1) or on_segment(p1, p2, q2)
+
+
+def point_in_triangle(p, a, b, c):
+    """ Checks if the point p lies inside or on the boundary of the counter-clockwise triangle (a, b, c) """
+    return cross(a, b, p) >= 0 and cross(b, c, p) >= 0 and cross(c, a, p) >= 0
+
+
+def polygon_area(points):
+    """ Signed area of a ring of points, positive when the ring is counter-clockwise """
+    n = len(points)
+    area = 0
+    for i in range(n):
+        p, q = points[i], points[(i + 1) % n]
+        area += (p.x * q.y) - (q.x * p.y)
+    return area / 2
+
+
+def ear_clipping(points, colors=None):
+    """
+    Triangulate a small simple counter-clockwise polygon by clipping ears. Given the colors of the points, an ear whose
+    corners have three different colors is clipped first when there is one, so that the triangles keep a valid
+    three-coloring as far as the colors allow.
+    Returns the diagonals as pairs of indices into the list of points, in the order the ears were clipped.
+    """
+    remaining = list(range(len(points)))
+    diagonals = []
+    while len(remaining) > 3:
+        m = len(remaining)
+        ear = None
+        for k in range(m):
+            a, b, c = remaining[k - 1], remaining[k], remaining[(k + 1) % m]
+            if cross(points[a], points[b], points[c]) <= 0:
+                continue  # Reflex or flat corner
+            if any(point_in_triangle(points[j], points[a], points[b], points[c])
+                   for j in remaining if j not in (a, b, c)):
+                continue
+            if ear is None:
+                ear = k
+            if colors is None or len({colors[a], colors[b], colors[c]}) == 3:
+                ear = k
+                break
+        if ear is None:
+            raise ValueError("The polygon is not simple.")
+        diagonals.append((remaining[ear - 1], remaining[(ear + 1) % m]))
+        remaining.pop(ear)
+    return diagonals
+
+
+def in_circle(a, b, c, d):
+    """ Positive when the point d lies inside the circumcircle of the counter-clockwise triangle (a, b, c) """
+    adx, ady = a.x - d.x, a.y - d.y
+    bdx, bdy = b.x - d.x, b.y - d.y
+    cdx, cdy = c.x - d.x, c.y - d.y
+    return ((adx * adx + ady * ady) * (bdx * cdy - cdx * bdy)
+            - (bdx * bdx + bdy * bdy) * (adx * cdy - cdx * ady)
+            + (cdx * cdx + cdy * cdy) * (adx * bdy - bdx * ady))
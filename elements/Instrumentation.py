@@ -0,0 +1,125 @@
+# Group ID 14 (21114021 & 21114078) - Ashutosh Kumar and Raiwat Bapat
+# Date: October 19 2026
+# Instrumentation.py : Contains the phase timers and hot-path counters of the triangulation pipeline.
+
+import functools
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+
+class Instrumentation:
+    """
+    Wall time per phase and counters of the hot paths. It is off by default, the hot paths only test the enabled flag
+    before they record anything.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.track_memory = False
+        self.reset()
+
+    def reset(self):
+        """ Forget everything recorded so far """
+        self.phases = {}  # Phase name -> [seconds, calls]
+        self.counters = {}  # Counter name -> total
+        self.maxima = {}  # Gauge name -> largest observed value
+        self.vertex_types = {}  # Vertex type -> count, from classify_vertices
+        self.peak_memory = None
+        if self.track_memory and tracemalloc.is_tracing():
+            tracemalloc.clear_traces()
+
+    def enable(self, track_memory=False):
+        """ Start recording, track_memory also traces the allocations to report the peak memory (and is slow) """
+        self.enabled = True
+        self.track_memory = track_memory
+        if track_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    def disable(self):
+        """ Stop recording, what was recorded is kept until reset """
+        if self.track_memory and tracemalloc.is_tracing():
+            self.peak_memory = max(self.peak_memory or 0, tracemalloc.get_traced_memory()[1])
+            tracemalloc.stop()
+        self.enabled = False
+        self.track_memory = False
+
+    def increment(self, name, amount=1):
+        self.counters[name] = self.counters.get(name, 0) + amount
+
+    def observe_max(self, name, value):
+        if value > self.maxima.get(name, 0):
+            self.maxima[name] = value
+
+    def count_vertex_types(self, vertex_types):
+        """ Add the types of a classification (vertex ID -> type) to the vertex type counts """
+        for v_type in vertex_types.values():
+            self.vertex_types[v_type] = self.vertex_types.get(v_type, 0) + 1
+
+    @contextmanager
+    def phase(self, name):
+        """ Add the wall time of the enclosed block to the given phase """
+        if not self.enabled:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            entry = self.phases.setdefault(name, [0.0, 0])
+            entry[0] += time.perf_counter() - start
+            entry[1] += 1
+
+    def timed(self, name):
+        """ Decorator that adds the wall time of every call of the function to the given phase """
+        def decorator(function):
+            @functools.wraps(function)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return function(*args, **kwargs)
+                with self.phase(name):
+                    return function(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def to_dict(self):
+        """ Export everything recorded so far as a dictionary """
+        peak_memory = self.peak_memory
+        if self.track_memory and tracemalloc.is_tracing():
+            peak_memory = max(peak_memory or 0, tracemalloc.get_traced_memory()[1])
+        return {
+            'phases': {name: {'seconds': seconds, 'calls': calls} for name, (seconds, calls) in self.phases.items()},
+            'counters': dict(self.counters),
+            'maxima': dict(self.maxima),
+            'vertex_types': dict(self.vertex_types),
+            'peak_memory': peak_memory,
+        }
+
+    def to_prometheus(self, prefix='polygon_triangulation'):
+        """ Export everything recorded so far in the Prometheus text exposition format """
+        metrics = self.to_dict()
+        lines = []
+
+        def family(name, metric_type, samples):
+            if not samples:
+                return
+            lines.append(f"# TYPE {prefix}_{name} {metric_type}")
+            for labels, value in samples:
+                lines.append(f"{prefix}_{name}{labels} {value}")
+
+        family('phase_seconds_total', 'counter',
+               [(f'{{phase="{name}"}}', phase['seconds']) for name, phase in metrics['phases'].items()])
+        family('phase_calls_total', 'counter',
+               [(f'{{phase="{name}"}}', phase['calls']) for name, phase in metrics['phases'].items()])
+        family('vertex_types_total', 'counter',
+               [(f'{{type="{v_type}"}}', count) for v_type, count in metrics['vertex_types'].items()])
+        for name, value in metrics['counters'].items():
+            family(f'{name}_total', 'counter', [('', value)])
+        for name, value in metrics['maxima'].items():
+            family(f'{name}_max', 'gauge', [('', value)])
+        if metrics['peak_memory'] is not None:
+            family('peak_memory_bytes', 'gauge', [('', metrics['peak_memory'])])
+        return '\n'.join(lines) + '\n'
+
+
+instrumentation = Instrumentation()  # Shared by every module of the pipeline
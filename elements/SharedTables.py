@@ -0,0 +1,130 @@
+# Group ID 14 (21114021 & 21114078) - Ashutosh Kumar and Raiwat Bapat
+# Date: October 19 2026
+# SharedTables.py : Contains the columns of numbers published in a shared memory segment, for handing tables between processes without copying them.
+
+from array import array
+from multiprocessing import resource_tracker, shared_memory
+
+ALIGNMENT = 8  # Every column starts at a multiple of this many bytes, so the views can be cast to 8-byte numbers
+
+
+class SharedTables:
+    """
+    Named columns of numbers, e.g. the columns of DCEL.to_columns, in one shared memory segment.
+    The process that creates the segment owns it and unlinks it when it is done, the processes that attach to it only
+    close it. A column is read and written through a memoryview of the segment, so nothing is copied when another
+    process attaches. The segment is found by the descriptor, a small tuple of its name and layout that is cheap to
+    pickle. Call SharedTables.track() before starting a pool of forked workers that attach to segments created later.
+    """
+
+    def __init__(self, segment, layout, owner):
+        self.segment = segment
+        self.layout = layout  # Column name -> (typecode, byte offset, length)
+        self.owner = owner
+        self.closed = False
+        self.views = {}  # Column name -> (slice of the segment, view cast to the typecode of the column)
+
+    @classmethod
+    def create(cls, columns):
+        """
+        Create a segment that holds the given columns, a dict of name -> array, or of name -> (typecode, length) for a
+        zero-filled column that is written later, e.g. a buffer for results.
+        """
+        layout = {}
+        size = 0
+        for name, column in columns.items():
+            typecode, length = (column.typecode, len(column)) if isinstance(column, array) else column
+            layout[name] = (typecode, size, length)
+            size += -(-length * array(typecode).itemsize // ALIGNMENT) * ALIGNMENT
+        segment = shared_memory.SharedMemory(create=True, size=max(size, 1))
+        tables = cls(segment, layout, owner=True)
+        try:
+            for name, column in columns.items():
+                if isinstance(column, array):
+                    tables.column(name)[:] = column
+        except BaseException:
+            tables.close()
+            tables.unlink()
+            raise
+        return tables
+
+    @staticmethod
+    def track():
+        """
+        Start the resource tracker of this process, which unlinks the segments left behind if it dies. Workers forked
+        afterwards share it, a worker forked before it starts runs its own, which would unlink the segments that the
+        worker attached to when it exits.
+        """
+        resource_tracker.ensure_running()
+
+    @classmethod
+    def attach(cls, descriptor):
+        """ Attach to a segment created in another process, given its descriptor """
+        name, layout = descriptor
+        return cls(shared_memory.SharedMemory(name=name), dict(layout), owner=False)
+
+    @property
+    def descriptor(self):
+        """ The name of the segment and its layout, all that another process needs to attach to it """
+        return self.segment.name, tuple(self.layout.items())
+
+    @property
+    def size(self):
+        return self.segment.size
+
+    def column(self, name):
+        """ A memoryview of a column, cast to its typecode, that reads and writes the segment in place """
+        if name not in self.views:
+            if self.closed:
+                raise ValueError("The shared tables are closed.")
+            if name not in self.layout:
+                raise ValueError(f"There is no column {name} in the shared tables.")
+            typecode, offset, length = self.layout[name]
+            window = self.segment.buf[offset:offset + length * array(typecode).itemsize]
+            self.views[name] = (window, window.cast(typecode))
+        return self.views[name][1]
+
+    def copy(self, name):
+        """ A copy of a column as an array, which stays valid after the segment is closed """
+        values = array(self.layout[name][0])
+        self.column(name)
+        values.frombytes(self.views[name][0])
+        return values
+
+    def columns(self, prefix=''):
+        """ The views of every column whose name starts with the prefix, by name without the prefix """
+        return {name[len(prefix):]: self.column(name) for name in self.layout if name.startswith(prefix)}
+
+    def close(self):
+        """
+        Release the views and detach from the segment. A view or a slice of a view that is still in use elsewhere makes
+        this raise BufferError, copy the columns that must outlive the segment.
+        """
+        if self.closed:
+            return
+        for window, view in self.views.values():
+            view.release()
+            window.release()
+        self.views = {}
+        self.segment.close()
+        self.closed = True
+
+    def unlink(self):
+        """
+        Free the segment, only the owner may do so. The processes that are attached keep their views until they close
+        it, no other process can attach afterwards.
+        """
+        if not self.owner:
+            raise ValueError("Only the process that created the shared tables can unlink them.")
+        if self.segment is not None:
+            self.segment.unlink()
+            self.segment = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        if self.owner:
+            self.unlink()
+        return False
@@ -2,6 +2,7 @@
 # Date: September 27 2024
 # StatusTree.py : Contains the implementation of the binary search tree for the sweep status structure for Monotone Partitioning.
 
+from elements.Instrumentation import instrumentation
 from elements.StatusNode import StatusNode
 
 
@@ -24,26 +25,29 @@ class StatusTree:
         self.sweep_line_y = y
 
     def insert(self, edge):
-        """ Insert a new edge into the status tree """
+        """ Insert a new edge into the status tree, returns the node that stores it """
         if not self.root:
             self.root = StatusNode(edge)
-        else:
-            self._insert_recursive(self.root, edge)
+            return self.root
+        return self._insert_recursive(self.root, edge)
 
-    def _insert_recursive(self, node, edge):
-        """ Helper function to recursively insert an edge in the correct position """
+    def _insert_recursive(self, node, edge, depth=1):
+        """ Helper function to recursively insert an edge in the correct position, depth is the depth of the node """
         if self.compare_edges(edge, node.edge) < 0:
             if node.left:
-                self._insert_recursive(node.left, edge)
-            else:
-                node.left = StatusNode(edge)
-                node.left.parent = node
+                return self._insert_recursive(node.left, edge, depth + 1)
+            node.left = StatusNode(edge)
+            node.left.parent = node
+            new_node = node.left
         else:
             if node.right:
-                self._insert_recursive(node.right, edge)
-            else:
-                node.right = StatusNode(edge)
-                node.right.parent = node
+                return self._insert_recursive(node.right, edge, depth + 1)
+            node.right = StatusNode(edge)
+            node.right.parent = node
+            new_node = node.right
+        if instrumentation.enabled:
+            instrumentation.observe_max('status_tree_depth', depth + 1)
+        return new_node
 
     def delete(self, edge):
         """ Remove an edge from the status tree """
@@ -84,6 +88,8 @@ class StatusTree:
         while current_node:
             edge = current_node.edge
             x_intersection = self.get_x_intersection(edge)
+            if instrumentation.enabled:
+                instrumentation.increment('status_tree_comparisons')
 
             # If the edge is to the left of the vertex, it could be the candidate
             if x_intersection < vertex.point.x:
@@ -94,6 +100,25 @@ class StatusTree:
 
         return candidate_edge  # Return the best candidate found
 
+    def predecessor(self, node):
+        """ The node of the edge immediately to the left of the edge of the given node, or None """
+        if node.left:
+            node = node.left
+            while node.right:
+                node = node.right
+            return node
+        while node.parent and node == node.parent.left:
+            node = node.parent
+        return node.parent
+
+    def successor(self, node):
+        """ The node of the edge immediately to the right of the edge of the given node, or None """
+        if node.right:
+            return _find_min(node.right)
+        while node.parent and node == node.parent.right:
+            node = node.parent
+        return node.parent
+
     def _replace_node(self, node, new_node):
         """ Replace a node with another node in the BST """
         if node.parent:
@@ -108,6 +133,8 @@ class StatusTree:
 
     def compare_edges(self, edge1, edge2):
         """ Compare two edges based on their intersection points with the sweep line """
+        if instrumentation.enabled:
+            instrumentation.increment('status_tree_comparisons')
         x1 = self.get_x_intersection(edge1)
         x2 = self.get_x_intersection(edge2)
         if x1 < x2:
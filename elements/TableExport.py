@@ -0,0 +1,87 @@
+# Group ID 14 (21114021 & 21114078) - Ashutosh Kumar and Raiwat Bapat
+# Date: October 19 2026
+# TableExport.py : Contains the columnar export of the vertex, half-edge and face tables of the DCEL to CSV and NPZ.
+
+import csv
+import os
+import sys
+import zipfile
+
+CHUNK_SIZE = 65536  # Rows written at a time
+NPY_TYPES = {'d': '<f8', 'i': '<i4'}  # Typecodes of the column arrays -> NumPy dtypes
+CSV_COLUMNS = {
+    'vertices': ['id', 'x', 'y', 'color', 'chain_val', 'incident'],
+    'half_edges': ['id', 'origin', 'twin', 'next', 'prev', 'face', 'helper'],
+    'faces': ['id', 'outer', 'inner'],
+}
+
+
+def npy_header(values):
+    """ The header of a .npy file that holds a one-dimensional array, padded to a multiple of 64 bytes """
+    header = f"{{'descr': '{NPY_TYPES[values.typecode]}', 'fortran_order': False, 'shape': ({len(values)},), }}"
+    padding = 64 - (10 + len(header) + 1) % 64
+    header = (header + ' ' * padding + '\n').encode('latin1')
+    return b'\x93NUMPY\x01\x00' + len(header).to_bytes(2, 'little') + header
+
+
+def write_npy(file, values, chunk_size=CHUNK_SIZE):
+    """ Write an array of numbers to an open binary file in the .npy format, in chunks """
+    file.write(npy_header(values))
+    for start in range(0, len(values), chunk_size):
+        chunk = values[start:start + chunk_size]
+        if sys.byteorder == 'big':
+            chunk.byteswap()
+        file.write(chunk.tobytes())
+
+
+def export_npz(dcel, path, compress=False, chunk_size=CHUNK_SIZE):
+    """
+    Write every column of the DCEL tables to one .npz archive, as the arrays table/column, e.g. half_edges/twin.
+    numpy.load reads it without any conversion, NumPy itself is not needed to write it.
+    """
+    columns = dcel.to_columns()
+    compression = zipfile.ZIP_DEFLATED if compress else zipfile.ZIP_STORED
+    with zipfile.ZipFile(path, 'w', compression=compression, allowZip64=True) as archive:
+        for table, table_columns in columns.items():
+            for name, values in table_columns.items():
+                with archive.open(f"{table}/{name}.npy", 'w', force_zip64=True) as file:
+                    write_npy(file, values, chunk_size)
+    return path
+
+
+def csv_rows(table, table_columns, start, end):
+    """ The rows start to end of a table, the lists of incident half-edges and of inner components joined by spaces """
+    if table == 'vertices':
+        offsets, incident = table_columns['incident_offsets'], table_columns['incident']
+        for i in range(start, end):
+            yield (i, table_columns['x'][i], table_columns['y'][i], table_columns['color'][i],
+                   table_columns['chain_val'][i], ' '.join(map(str, incident[offsets[i]:offsets[i + 1]])))
+    elif table == 'half_edges':
+        columns = [table_columns[name] for name in CSV_COLUMNS['half_edges'][1:]]
+        for i in range(start, end):
+            yield (i, *(column[i] for column in columns))
+    else:
+        offsets, inner = table_columns['inner_offsets'], table_columns['inner']
+        for i in range(start, end):
+            yield i, table_columns['outer'][i], ' '.join(map(str, inner[offsets[i]:offsets[i + 1]]))
+
+
+def export_csv(dcel, directory, chunk_size=CHUNK_SIZE):
+    """
+    Write the vertex, half-edge and face tables to vertices.csv, half_edges.csv and faces.csv in a directory, a
+    chunk of rows at a time. Missing references are -1.
+    Returns the paths of the files.
+    """
+    os.makedirs(directory, exist_ok=True)
+    columns = dcel.to_columns()
+    counts = {'vertices': len(dcel.vertices), 'half_edges': len(dcel.half_edges), 'faces': len(dcel.faces)}
+    paths = []
+    for table, table_columns in columns.items():
+        path = os.path.join(directory, f"{table}.csv")
+        with open(path, 'w', newline='') as file:
+            writer = csv.writer(file)
+            writer.writerow(CSV_COLUMNS[table])
+            for start in range(0, counts[table], chunk_size):
+                writer.writerows(csv_rows(table, table_columns, start, min(start + chunk_size, counts[table])))
+        paths.append(path)
+    return paths
@@ -0,0 +1,133 @@
+# Group ID 14 (21114021 & 21114078) - Ashutosh Kumar and Raiwat Bapat
+# Date: October 19 2026
+# Tracing.py : Contains the level-gated structured tracing of the sweep and triangulation events.
+
+import json
+import random
+import sys
+
+DEBUG = 10
+INFO = 20
+OFF = 100
+LEVEL_NAMES = {DEBUG: 'debug', INFO: 'info'}
+
+
+class Tracer:
+    """
+    The tracer of one module. The hot paths test the debug or info flag before they build a record, so nothing is
+    formatted while tracing is off.
+    """
+
+    def __init__(self, tracing, module):
+        self.tracing = tracing
+        self.module = module
+        self.level = OFF
+        self.debug = False
+        self.info = False
+
+    def set_level(self, level):
+        self.level = level
+        self.debug = level <= DEBUG
+        self.info = level <= INFO
+
+    def emit(self, event, level=DEBUG, **fields):
+        """ Send a record with the event and its fields (vertex and edge IDs) to the sink """
+        if level < self.level:
+            return
+        record = {'module': self.module, 'level': LEVEL_NAMES.get(level, level), 'event': event}
+        record.update(fields)
+        self.tracing.sink(record)
+
+
+class Tracing:
+    """
+    The tracers of every module and the sink their records go to. It is off by default, the level of a module is the
+    one set for it or the default level given to enable.
+    """
+
+    def __init__(self):
+        self.sink = None
+        self.default_level = OFF
+        self.levels = {}  # Module name -> level set for it
+        self.tracers = {}  # Module name -> Tracer
+
+    def get_tracer(self, module):
+        tracer = self.tracers.get(module)
+        if tracer is None:
+            tracer = self.tracers[module] = Tracer(self, module)
+            self.refresh(tracer)
+        return tracer
+
+    def enable(self, sink, level=DEBUG, modules=None):
+        """
+        Send the records to the sink, a callable that takes a record dictionary. modules maps module names to the level
+        of that module, the other modules use the given level.
+        """
+        self.sink = sink
+        self.default_level = level
+        self.levels.update(modules or {})
+        for tracer in self.tracers.values():
+            self.refresh(tracer)
+
+    def set_level(self, module, level):
+        self.levels[module] = level
+        self.refresh(self.get_tracer(module))
+
+    def disable(self):
+        """ Stop tracing and forget the levels of the modules """
+        self.sink = None
+        self.default_level = OFF
+        self.levels = {}
+        for tracer in self.tracers.values():
+            self.refresh(tracer)
+
+    def refresh(self, tracer):
+        tracer.set_level(self.levels.get(tracer.module, self.default_level) if self.sink is not None else OFF)
+
+
+class ListSink:
+    """ Keeps the records in memory, for tests and for the viewer """
+
+    def __init__(self):
+        self.records = []
+
+    def __call__(self, record):
+        self.records.append(record)
+
+
+class JsonLinesSink:
+    """ Writes every record as one line of JSON """
+
+    def __init__(self, stream):
+        self.stream = stream
+
+    def __call__(self, record):
+        self.stream.write(json.dumps(record, separators=(',', ':')) + '\n')
+
+
+class ConsoleSink:
+    """ Writes every record as one readable line, like the messages of the original demo """
+
+    def __init__(self, stream=None):
+        self.stream = stream
+
+    def __call__(self, record):
+        fields = ' '.join(f"{key}={value}" for key, value in record.items()
+                          if key not in ('module', 'level', 'event'))
+        print(f"[{record['module']}] {record['event']} {fields}", file=self.stream or sys.stdout)
+
+
+class SamplingSink:
+    """ Passes on a random fraction of the records to another sink """
+
+    def __init__(self, sink, rate, seed=None):
+        self.sink = sink
+        self.rate = rate
+        self.random = random.Random(seed)
+
+    def __call__(self, record):
+        if self.random.random() < self.rate:
+            self.sink(record)
+
+
+tracing = Tracing()  # Shared by every module of the pipeline
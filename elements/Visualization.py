@@ -0,0 +1,343 @@
+# Group ID 14 (21114021 & 21114078) - Ashutosh Kumar and Raiwat Bapat
+# Date: October 19 2026
+# Visualization.py : Contains the plotting, animation and table display of the DCEL and the dual graph.
+# The algorithm modules import this module lazily, only when something is actually plotted or displayed.
+
+from io import BytesIO
+
+import matplotlib.pyplot as plt
+from PIL import Image
+from matplotlib import animation
+from tabulate import tabulate
+
+
+def plot_dcel_step(dcel, sweep_line_y, current_vertex_id, helper_vertex_id, left_edge_id, add_diagonal, start, end):
+    """ Plot one step of an algorithm, see DCEL.plot_dcel, and store the image in dcel.images """
+    plt.figure(figsize=(8, 8))
+
+    if sweep_line_y is not None:
+        # Plot the sweep line
+        plt.axhline(y=sweep_line_y, color='r', label='Sweep Line')
+
+    # Plot vertices and annotate them
+    for vertex in dcel.vertices:
+        if current_vertex_id is not None:
+            if vertex.id == current_vertex_id:
+                plt.plot(vertex.point.x, vertex.point.y, 'ro')
+                plt.text(vertex.point.x, vertex.point.y, f"V{vertex.id}", fontsize=9, ha='right')
+            else:
+                if helper_vertex_id is not None:
+                    if vertex.id == helper_vertex_id:
+                        plt.plot(vertex.point.x, vertex.point.y, 'go')
+                        plt.text(vertex.point.x, vertex.point.y, f"V{vertex.id}", fontsize=9, ha='right')
+                    else:
+                        plt.plot(vertex.point.x, vertex.point.y, 'bo')
+                        plt.text(vertex.point.x, vertex.point.y, f"V{vertex.id}", fontsize=9, ha='right')
+                else:
+                    plt.plot(vertex.point.x, vertex.point.y, 'bo')
+                    plt.text(vertex.point.x, vertex.point.y, f"V{vertex.id}", fontsize=9, ha='right')
+        else:
+            plt.plot(vertex.point.x, vertex.point.y, 'bo')  # Plot vertex as a blue dot
+            plt.text(vertex.point.x, vertex.point.y, f"V{vertex.id}", fontsize=9, ha='right')
+
+    # Plot edges and annotate half-edges at 1/3rd and 2/3rd points
+    for half_edge in dcel.half_edges:
+        origin = dcel.vertices[half_edge.origin.id]
+        destination = dcel.vertices[half_edge.next.origin.id]
+
+        if left_edge_id is not None:
+            if half_edge.id == left_edge_id or half_edge.twin.id == left_edge_id:
+                plt.plot([origin.point.x, destination.point.x], [origin.point.y, destination.point.y], 'g-')
+            else:
+                plt.plot([origin.point.x, destination.point.x], [origin.point.y, destination.point.y], 'k-')
+        else:
+            plt.plot([origin.point.x, destination.point.x], [origin.point.y, destination.point.y], 'k-')
+
+    if add_diagonal:
+        dcel.diagonals.append((start, end))
+
+    for start, end in dcel.diagonals:
+        plt.plot([start.point.x, end.point.x], [start.point.y, end.point.y], 'g-')
+
+    # Set equal scaling and remove axis for better visualization
+    plt.axis('equal')
+    plt.grid(False)
+    plt.gca().set_axis_off()  # Hide axes
+
+    # Save the plot to a BytesIO object
+    buf = BytesIO()
+    plt.savefig(buf, format='png', bbox_inches='tight', pad_inches=0.1)  # Save the figure to the buffer
+    buf.seek(0)  # Move the buffer cursor to the beginning
+
+    # Load the image from the buffer
+    image = Image.open(buf)
+    dcel.images.append(image)  # Store the image in dcel.images
+
+    plt.close()
+
+
+def animate_complete_triangulation(dcel):
+    fig = plt.figure()
+    plt.axis('off')
+
+    ims = []
+    for image in dcel.images:
+        im = plt.imshow(image, animated=True)
+        ims.append([im])
+
+    ani = animation.ArtistAnimation(fig, ims, interval=500, blit=True, repeat_delay=1000)
+    ani.save('complete_triangulation.mp4', writer='ffmpeg')
+
+    plt.close(fig)
+
+
+def plot_dcel_polygon(dcel):
+    """
+    Plots the DCEL with vertex and half-edge annotations.
+    Vertices are annotated with their coordinates, and half-edges are annotated with their IDs.
+    Handles small edges by adjusting the placement of annotations to avoid overlap.
+    """
+    plt.figure(figsize=(8, 8))
+
+    # Plot vertices and annotate them
+    for vertex in dcel.vertices:
+        plt.plot(vertex.point.x, vertex.point.y, 'bo')  # Plot vertex as a blue dot
+        plt.text(vertex.point.x, vertex.point.y, f"V{vertex.id}", fontsize=9, ha='right')
+
+    # Plot edges and annotate half-edges at 1/3rd and 2/3rd points
+    for half_edge in dcel.half_edges:
+        origin = dcel.vertices[half_edge.origin.id]
+        destination = dcel.vertices[half_edge.next.origin.id]
+
+        # Plot the edge between origin and destination
+        plt.plot([origin.point.x, destination.point.x], [origin.point.y, destination.point.y], 'k-')
+
+        # Calculate the 1/3rd and 2/3rd points of the edge
+    # Set equal scaling and remove axis for better visualization
+    plt.axis('equal')
+    plt.grid(False)
+    plt.gca().set_axis_off()  # Hide axes
+    plt.show()
+
+
+def vertex_row(vertex):
+    incident_edges = [edge.id for edge in vertex.incident_edge] if vertex.incident_edge else []
+    incident_edges_str = ', '.join(map(str, incident_edges)) if isinstance(incident_edges, list) else "None"
+    return [vertex.id, f"({vertex.point.x}, {vertex.point.y})", incident_edges_str]
+
+
+def half_edge_row(edge):
+    return [edge.id, edge.origin.id, edge.twin.id if edge.twin else "None", edge.next.id if edge.next else "None",
+            edge.prev.id if edge.prev else "None", edge.incident_face.id if edge.incident_face else "None",
+            edge.helper.id if edge.helper else "None"]
+
+
+def face_row(face):
+    outer = face.outer_component.id if face.outer_component else "None"
+    inner = [he.id for he in face.inner_component] if face.inner_component else "None"
+    # Convert the list of inner component half-edges to a string for display
+    inner_str = ', '.join(map(str, inner)) if isinstance(inner, list) else "None"
+    return [face.id, outer, inner_str]
+
+
+def select_rows(items, row, headers, mode, rows, page):
+    """
+    The table rows to print: all of them, the first and last rows with a row of dots between them, or one page.
+    Only the selected items are turned into rows.
+    """
+    if mode == 'full':
+        return [row(item) for item in items]
+    if mode == 'page':
+        return [row(item) for item in items[page * rows:(page + 1) * rows]]
+    if len(items) <= 2 * rows:
+        return [row(item) for item in items]
+    return [row(item) for item in items[:rows]] + [['...'] * len(headers)] + [row(item) for item in items[-rows:]]
+
+
+def display_dcel(dcel, mode='full', rows=5, page=0):
+    if mode == 'summary':
+        print(tabulate(dcel.summary().items(), headers=["Summary", "Value"], tablefmt="grid"))
+        print()
+    tables = [
+        ("Vertices", dcel.vertices, vertex_row, ["Vertex ID", "Coordinates", "Incident Edge ID"]),
+        ("HalfEdges", dcel.half_edges, half_edge_row,
+         ["Half-Edge ID", "Origin Vertex", "Twin Edge ID", "Next Edge ID", "Previous Edge ID", "Incident Face ID",
+          "Edge Helper"]),
+        ("Faces", dcel.faces, face_row, ["Face ID", "Outer Component Half-Edge ID", "Inner Component Half-Edge IDs"]),
+    ]
+    for i, (title, items, row, headers) in enumerate(tables):
+        if mode == 'page':
+            last = min((page + 1) * rows, len(items)) - 1
+            title = f"{title} (page {page}, rows {page * rows} to {last} of {len(items)})"
+        print(("\n" if i else "") + f"{title}:")
+        print(tabulate(select_rows(items, row, headers, mode, rows, page), headers=headers, tablefmt="grid"))
+
+
+def plot_dual_graph(dual_graph):
+    plt.figure(figsize=(8, 8))
+
+    # Plot the centroids (nodes of the dual graph)
+    for face, adjacent_faces in dual_graph.dual_graph.items():
+        # Plot the node (centroid of the face)
+        centroid = face.centroid
+        plt.scatter(centroid.x, centroid.y, c='blue')  # Plot centroids as blue points
+        plt.text(centroid.x, centroid.y, f'{face.id}', fontsize=9, ha='right')  # Label the face ID
+
+        # Plot edges to adjacent faces
+        for adjacent_face in adjacent_faces:
+            adj_centroid = adjacent_face.centroid
+            plt.plot([centroid.x, adj_centroid.x], [centroid.y, adj_centroid.y], 'k-', lw=1)  # Black edges
+
+    # Display the plot
+    plt.title("Dual Graph of Faces")
+    plt.xlabel("X Coordinate")
+    plt.ylabel("Y Coordinate")
+    plt.show()
+
+
+def plot_dcel_and_dual_graph(dual_graph):
+    """
+    Plots both the DCEL (vertices and edges) and the dual graph (faces and their adjacency)
+    in the same image.
+    """
+
+    plt.figure(figsize=(10, 10))
+
+    # Plot DCEL vertices and edges
+    for vertex in dual_graph.dcel.vertices:
+        plt.plot(vertex.point.x, vertex.point.y, 'bo')  # Plot vertex as a blue dot
+        plt.text(vertex.point.x, vertex.point.y, f"V{vertex.id}", fontsize=9, ha='right')  # Annotate vertex
+
+    for half_edge in dual_graph.dcel.half_edges:
+        origin = dual_graph.dcel.vertices[half_edge.origin.id]
+        destination = dual_graph.dcel.vertices[half_edge.next.origin.id]
+
+        # Plot the edge between origin and destination
+        plt.plot([origin.point.x, destination.point.x], [origin.point.y, destination.point.y], 'k-',
+                 label='DCEL edge')
+
+    # Plot dual graph nodes and edges (faces and adjacency)
+    for face, adjacent_faces in dual_graph.dual_graph.items():
+        # Plot the node (centroid of the face)
+        centroid = face.centroid
+        plt.scatter(centroid.x, centroid.y, c='black', zorder=3)  # Plot centroids as red points for dual graph
+        plt.text(centroid.x, centroid.y, f'{face.id}', fontsize=9, ha='right', color='red')  # Label the face ID
+
+        # Plot edges to adjacent faces
+        for adjacent_face in adjacent_faces:
+            adj_centroid = adjacent_face.centroid
+            plt.plot([centroid.x, adj_centroid.x], [centroid.y, adj_centroid.y], 'r', lw=1, label='Dual graph edge')
+
+    # Set equal scaling and remove axis for better visualization
+    plt.axis('equal')
+    plt.grid(False)
+    plt.gca().set_axis_off()  # Hide axes for clean visualization
+
+    plt.title("DCEL and Dual Graph")
+    plt.show()
+
+
+def plot_colored_dcel(dual_graph):
+    plt.figure(figsize=(8, 8))
+
+    # Define colors corresponding to 0, 1, 2
+    color_map = {0: 'red', 1: 'green', 2: 'blue'}
+    color_names = {0: "Red", 1: "Green", 2: "Blue"}
+
+    # Initialize color count dictionary
+    color_count = {0: 0, 1: 0, 2: 0}
+
+    # Plot vertices with their assigned colors and count color frequencies
+    for vertex in dual_graph.dcel.vertices:
+        color_count[vertex.color] += 1  # Count each vertex color
+        plt.plot(vertex.point.x, vertex.point.y, 'o', color=color_map[vertex.color], markersize=10)  # Color vertex
+        plt.text(vertex.point.x, vertex.point.y, f"V{vertex.id}", fontsize=9, ha='right')
+
+    # Plot edges
+    for half_edge in dual_graph.dcel.half_edges:
+        origin = dual_graph.dcel.vertices[half_edge.origin.id]
+        destination = dual_graph.dcel.vertices[half_edge.next.origin.id]
+
+        # Plot the edge between origin and destination
+        plt.plot([origin.point.x, destination.point.x], [origin.point.y, destination.point.y], 'k-')
+
+    # Find the color with the minimum count
+    min_color = min(color_count, key=color_count.get)
+    min_color_name = color_names[min_color]
+    min_color_value = color_map[min_color]
+    min_color_count = color_count[min_color]
+
+    # Set equal scaling and remove axis for better visualization
+    plt.axis('equal')
+    plt.grid(False)
+    plt.gca().set_axis_off()  # Hide axes
+
+    # Display the minimum color count at the bottom of the plot
+    plt.text(0.5, -0.1,
+             f"The Sufficient number of Vertex Guards required will be {min_color_count} Colored in {min_color_name}",
+             fontsize=12, ha='center', va='center', transform=plt.gca().transAxes)
+
+    # Show a dot representing the minimum color at the bottom
+    plt.plot(0.45, -0.1, 'o', color=min_color_value, markersize=12, transform=plt.gca().transAxes)
+
+    # Show the plot
+    plt.show()
+
+
+def plot_colored_dcel_with_dual_graph(dual_graph):
+    plt.figure(figsize=(10, 10))
+
+    # Define colors corresponding to 0, 1, 2
+    color_map = {0: 'red', 1: 'green', 2: 'blue'}
+    color_names = {0: "Red", 1: "Green", 2: "Blue"}
+
+    # Initialize color count dictionary
+    color_count = {0: 0, 1: 0, 2: 0}
+
+    # Plot DCEL vertices with their assigned colors and count color frequencies
+    for vertex in dual_graph.dcel.vertices:
+        color_count[vertex.color] += 1  # Count each vertex color
+        plt.plot(vertex.point.x, vertex.point.y, 'o', color=color_map[vertex.color], markersize=10)  # Color vertex
+        plt.text(vertex.point.x, vertex.point.y, f"V{vertex.id}", fontsize=9, ha='right')
+
+    # Plot DCEL edges
+    for half_edge in dual_graph.dcel.half_edges:
+        origin = dual_graph.dcel.vertices[half_edge.origin.id]
+        destination = dual_graph.dcel.vertices[half_edge.next.origin.id]
+
+        # Plot the edge between origin and destination
+        plt.plot([origin.point.x, destination.point.x], [origin.point.y, destination.point.y], 'k-', lw=1)
+
+    # Now, plot the dual graph (centroids of faces and adjacency)
+    for face, adjacent_faces in dual_graph.dual_graph.items():
+        # Plot the centroid of the face as a node of the dual graph
+        centroid = face.centroid
+        plt.scatter(centroid.x, centroid.y, c='black', zorder=3, s=50)  # Plot centroids as black points
+
+        # Plot edges connecting the centroids of adjacent faces
+        for adjacent_face in adjacent_faces:
+            adj_centroid = adjacent_face.centroid
+            plt.plot([centroid.x, adj_centroid.x], [centroid.y, adj_centroid.y], 'r-', lw=1,
+                     label='Dual graph edge')
+
+    # Find the color with the minimum count
+    min_color = min(color_count, key=color_count.get)
+    min_color_name = color_names[min_color]
+    min_color_value = color_map[min_color]
+    min_color_count = color_count[min_color]
+
+    # Set equal scaling and remove axis for better visualization
+    plt.axis('equal')
+    plt.grid(False)
+    plt.gca().set_axis_off()  # Hide axes
+
+    # Display the minimum color count at the bottom of the plot
+    plt.text(0.5, -0.1,
+             f"The Sufficient number of Vertex Guards required will be {min_color_count}, Colored in {min_color_name}",
+             fontsize=12, ha='center', va='center', transform=plt.gca().transAxes)
+
+    # Show a dot representing the minimum color at the bottom
+    plt.plot(0.45, -0.1, 'o', color=min_color_value, markersize=12, transform=plt.gca().transAxes)
+
+    # Show the plot
+    plt.show()
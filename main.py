@@ -7,6 +7,7 @@ from MonotonePartitioner import MonotonePartitioner
 from MonotoneTriangulation import MonotoneTriangulation
 from elements.DCEL import DCEL
 from elements.Point import Point
+from elements.Tracing import ConsoleSink, tracing
 from elements.Vertex import Vertex
 
 
@@ -81,6 +82,17 @@ def polygon_with_15_vertices():
 
     triangulate_and_animate(polygon_example_book)
 
+def polygon_with_holes():
+    polygon = DCEL(
+        vertices=[Vertex(Point(0, 0)), Vertex(Point(12, 1)), Vertex(Point(13, 9)), Vertex(Point(6, 12)),
+                  Vertex(Point(1, 10))],
+        holes=[
+            [Vertex(Point(3, 3)), Vertex(Point(3.5, 6)), Vertex(Point(5.5, 5.2)), Vertex(Point(5, 2.8))],
+            [Vertex(Point(8, 4)), Vertex(Point(8.4, 8.1)), Vertex(Point(10.6, 7.5)), Vertex(Point(10.1, 4.3))],
+        ]
+    )
+    triangulate_and_animate(polygon)
+
 def generate_and_triangulate_random_polygon(n):
     # Random Polygon Generation
     polygon_example = DCEL(n)
@@ -89,6 +101,7 @@ def generate_and_triangulate_random_polygon(n):
     triangulate_and_animate(polygon_example)
 
 def main():
+    tracing.enable(ConsoleSink())  # Narrate the sweep and the added diagonals
     polygon_with_34_vertices()
 
 if __name__ == "__main__":
@@ -0,0 +1,61 @@
+# Group ID 14 (21114021 & 21114078) - Ashutosh Kumar and Raiwat Bapat
+# Date: October 19 2026
+# test_incremental_triangulation.py : Contains the regression tests of the edits that would cross the boundary of the polygon next to the cavity.
+
+import contextlib
+import os
+import unittest
+
+from DualGraph import DualGraph
+from IncrementalTriangulation import IncrementalTriangulation
+from MonotonePartitioner import MonotonePartitioner
+from MonotoneTriangulation import MonotoneTriangulation
+from RandomPolygons import space_partition_polygon
+from TriangulationValidator import TriangulationValidator
+from benchmarks.pipeline_benchmark import orient_counter_clockwise
+from elements.DCEL import DCEL
+from elements.Point import Point
+from elements.Vertex import Vertex
+
+L_SHAPE = [(0, 0), (4, 0), (4, 1), (1, 1), (1, 3), (0, 3)]
+
+
+def triangulated(points):
+    """ The triangulated and three-colored DCEL of a ring and an editor for it """
+    dcel = DCEL(vertices=[Vertex(Point(x, y)) for x, y in points], record_images=False)
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        MonotonePartitioner(dcel).perform_sweep_line_partition()
+        MonotoneTriangulation(dcel).triangulate()
+    dual_graph = DualGraph(dcel)
+    dual_graph.build_dual_graph()
+    dual_graph.three_coloring()
+    return dcel, IncrementalTriangulation(dcel, dual_graph)
+
+
+class TestIncrementalTriangulation(unittest.TestCase):
+    def assertRejected(self, dcel, edit):
+        points = [(vertex.point.x, vertex.point.y) for vertex in dcel.vertices]
+        with self.assertRaises(ValueError):
+            edit()
+        self.assertEqual([(vertex.point.x, vertex.point.y) for vertex in dcel.vertices], points)
+        self.assertTrue(TriangulationValidator(dcel).validate()['valid'])
+
+    def test_move_past_a_boundary_edge_at_a_cavity_vertex(self):
+        # Every move swings an edge of the moved vertex past a boundary edge that is outside the cavity
+        for index, target in ((2, (0.5, 2)), (2, (0.5, 1.5)), (4, (2, 0.5))):
+            dcel, editor = triangulated(L_SHAPE)
+            self.assertRejected(dcel, lambda: editor.move_vertex(dcel.vertices[index], Point(*target)))
+
+    def test_delete_across_a_boundary_edge_at_a_cavity_vertex(self):
+        dcel, editor = triangulated(orient_counter_clockwise(space_partition_polygon(10, 54)))
+        self.assertRejected(dcel, lambda: editor.delete_vertex(dcel.vertices[8]))
+
+    def test_move_next_to_a_boundary_edge(self):
+        dcel, editor = triangulated(L_SHAPE)
+        editor.move_vertex(dcel.vertices[2], Point(1.5, 2.5))
+        self.assertTrue(TriangulationValidator(dcel).validate()['valid'])
+        self.assertEqual(len(dcel.faces) - 1, len(L_SHAPE) - 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
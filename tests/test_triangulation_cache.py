@@ -0,0 +1,88 @@
+# Group ID 14 (21114021 & 21114078) - Ashutosh Kumar and Raiwat Bapat
+# Date: October 19 2026
+# test_triangulation_cache.py : Contains the regression tests of the canonical keys and the orientation handling of the triangulation cache.
+
+import math
+import random
+import tempfile
+import unittest
+
+from TriangulationCache import TriangulationCache, canonicalize, fits_ring
+from benchmarks.pipeline_benchmark import orient_counter_clockwise, star_polygon
+
+
+def transformed_copy(points, rng):
+    """ A copy of a ring that starts at another vertex, uniformly scaled and translated by up to 100 times its size """
+    shift = rng.randrange(len(points))
+    scale = 10 ** rng.uniform(-3, 3)
+    dx, dy = rng.uniform(-100, 100) * scale, rng.uniform(-100, 100) * scale
+    rotated = points[shift:] + points[:shift]
+    return [(x * scale + dx, y * scale + dy) for x, y in rotated], shift
+
+
+class TestTriangulationCache(unittest.TestCase):
+    def test_copies_share_a_key(self):
+        rng = random.Random(0)
+        for n in (10, 30, 300, 3000):
+            points = orient_counter_clockwise(star_polygon(n, rng))
+            key, _ = canonicalize(points)
+            for _ in range(40):
+                copy, _ = transformed_copy(points, rng)
+                self.assertEqual(canonicalize(copy)[0], key, f"n={n}")
+
+    def test_copies_hit_the_cache(self):
+        rng = random.Random(1)
+        cache = TriangulationCache()
+        points = orient_counter_clockwise(star_polygon(50, rng))
+        triangles, guards = cache.triangulate(points)
+        for _ in range(50):
+            copy, shift = transformed_copy(points, rng)
+            copy_triangles, copy_guards = cache.triangulate(copy)
+            # Index i of the copy is index i + shift of the original
+            n = len(points)
+            self.assertEqual({frozenset((i + shift) % n for i in triangle) for triangle in copy_triangles},
+                             {frozenset(triangle) for triangle in triangles})
+            self.assertEqual(len(copy_guards), len(guards))
+        self.assertEqual(cache.stats()['misses'], 1)
+        self.assertEqual(cache.stats()['memory_hits'], 50)
+
+    def test_clockwise_ring(self):
+        points = orient_counter_clockwise(star_polygon(40, random.Random(2)))[::-1]
+        triangles, guards = TriangulationCache().triangulate(points)
+        self.assertEqual(len(triangles), len(points) - 2)
+        area = 0
+        for a, b, c in triangles:
+            (ax, ay), (bx, by), (cx, cy) = points[a], points[b], points[c]
+            cross = (bx - ax) * (cy - ay) - (by - ay) * (cx - ax)
+            self.assertGreater(cross, 0)
+            area += cross / 2
+        ring_area = -sum(p[0] * q[1] - q[0] * p[1] for p, q in zip(points, points[1:] + points[:1])) / 2
+        self.assertTrue(math.isclose(area, ring_area))
+        self.assertTrue(guards)
+
+    def test_entry_of_a_near_duplicate_ring_is_rejected(self):
+        # Both rings have the same key, but the triangle (2, 3, 4) of the first is clockwise in the second
+        first = [(0, 0), (2, 0), (2, 2), (1, 2 + 1e-8), (0, 2), (1, 1)]
+        second = [(0, 0), (2, 0), (2, 2), (1, 2 - 1e-8), (0, 2), (1, 1)]
+        self.assertEqual(canonicalize(first), canonicalize(second))
+        with tempfile.TemporaryDirectory() as directory:
+            cache = TriangulationCache(directory=directory)
+            cache.triangulate(first)
+            triangles, _ = cache.triangulate(second)
+            self.assertTrue(fits_ring(second, triangles))
+            cache.clear()
+            triangles, _ = cache.triangulate(second)  # From the disk store
+            self.assertTrue(fits_ring(second, triangles))
+            stats = cache.stats()
+            self.assertEqual((stats['memory_hits'], stats['disk_hits'], stats['rejected_hits']), (0, 0, 2))
+            # The entry of the first ring is kept
+            self.assertEqual(cache.triangulate(first), TriangulationCache().triangulate(first))
+            self.assertEqual(cache.stats()['disk_hits'], 1)
+
+    def test_ring_without_area(self):
+        with self.assertRaises(ValueError):
+            TriangulationCache().triangulate([(0, 0), (1, 1), (2, 2)])
+
+
+if __name__ == '__main__':
+    unittest.main()